@@ -0,0 +1,67 @@
+# encoding: utf-8
+
+"""Benchmark of the import time and memory of the pynlg modules.
+
+Each module is imported in a fresh interpreter, several times, and the
+median import time is reported, along with the memory allocated by the
+import (the increase of the interpreter peak resident set size).
+
+Usage:
+
+    $ python benchmarks/import_time.py [module ...]
+
+"""
+
+from __future__ import print_function
+
+import sys
+import subprocess
+
+from os.path import join, dirname, abspath
+
+ROOT = abspath(join(dirname(__file__), '..'))
+
+MODULES = [
+    'pynlg',
+    'pynlg.lexicon.feature.category',
+    'pynlg.lexicon.registry',
+    'pynlg.lexicon.fr',
+    'pynlg.spec.phrase',
+]
+
+SCRIPT = '''
+import time
+import resource
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.time()
+import {module}
+print(time.time() - start)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+'''
+
+RUNS = 15
+
+
+def import_time(module, runs=RUNS):
+    """Return the median import time of the argument module, in seconds,
+    and the median memory allocated by the import, in kB.
+
+    """
+    timings, memory = [], []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', SCRIPT.format(module=module)], cwd=ROOT)
+        timing, rss = output.split()
+        timings.append(float(timing))
+        memory.append(int(rss))
+    return sorted(timings)[runs // 2], sorted(memory)[runs // 2]
+
+
+def main(modules):
+    for module in modules:
+        timing, memory = import_time(module)
+        print('%-32s %6.1f ms %7d kB' % (module, timing * 1000, memory))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or MODULES)
@@ -0,0 +1,46 @@
+# encoding: utf-8
+
+"""Benchmark of the construction of the phrase elements.
+
+Each phrase type is built repeatedly, with the french lexicon, and the
+median construction time of a phrase is reported.
+
+Usage:
+
+    $ python benchmarks/phrase_construction.py
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from os.path import join, dirname, abspath
+
+sys.path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pynlg.lexicon.fr import FrenchLexicon  # noqa
+from pynlg.lexicon.feature import category as cat  # noqa
+from pynlg.spec.phrase import (  # noqa
+    PhraseElement, AdjectivePhraseElement, NounPhraseElement)
+
+NUMBER = 20000
+REPEAT = 5
+
+
+def main():
+    lexicon = FrenchLexicon(auto_index=False)
+    phrases = [
+        ('PhraseElement', lambda: PhraseElement(lexicon, cat.CLAUSE)),
+        ('AdjectivePhraseElement', lambda: AdjectivePhraseElement(lexicon)),
+        ('NounPhraseElement', lambda: NounPhraseElement(lexicon)),
+    ]
+    for name, build in phrases:
+        timings = timeit.repeat(build, number=NUMBER, repeat=REPEAT)
+        timing = sorted(timings)[REPEAT // 2] / NUMBER
+        print('%-24s %7.2f us' % (name, timing * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,33 @@
-from .spec.phrase import NounPhraseElement
+import sys
+import importlib
 
 __version__ = '0.1.1'
 
+#  Attributes of the package imported from its submodules on first
+#  access, so that importing pynlg (or any of its subpackages) does not
+#  import the whole library.
+_LAZY_ATTRIBUTES = {
+    'NounPhraseElement': '.spec.phrase',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ is only supported from python 3.7
+    from .spec.phrase import NounPhraseElement  # noqa
+
 
 def make_noun_phrase(lexicon, specifier, noun, modifiers=None):
+    from .spec.phrase import NounPhraseElement
     phrase = NounPhraseElement(lexicon)
     phrase.head = noun
     phrase.specifier = specifier
@@ -6,7 +6,12 @@ from __future__ import unicode_literals
 
 from .lexicon import Lexicon
 from .lang import ENGLISH
+from .feature import NUMBER, FORM, TENSE, PERSON, IS_COMPARATIVE, IS_SUPERLATIVE
+from .feature import number, person, tense, form
 from .feature.category import CONJUNCTION
+from .feature.lexical import (
+    PLURAL, PAST, PAST_PARTICIPLE, PRESENT_PARTICIPLE, PRESENT3S,
+    COMPARATIVE, SUPERLATIVE)
 
 
 class EnglishLexicon(Lexicon):
@@ -15,6 +20,21 @@ class EnglishLexicon(Lexicon):
 
     language = ENGLISH
 
+    INFLECTED_FORMS = (
+        PLURAL, PAST, PAST_PARTICIPLE, PRESENT_PARTICIPLE, PRESENT3S,
+        COMPARATIVE, SUPERLATIVE)
+
+    INFLECTED_FORM_FEATURES = {
+        PLURAL: {NUMBER: number.PLURAL},
+        PAST: {TENSE: tense.PAST},
+        PAST_PARTICIPLE: {FORM: form.PAST_PARTICIPLE},
+        PRESENT_PARTICIPLE: {FORM: form.PRESENT_PARTICIPLE},
+        PRESENT3S: {
+            TENSE: tense.PRESENT, PERSON: person.THIRD, NUMBER: number.SINGULAR},
+        COMPARATIVE: {IS_COMPARATIVE: True},
+        SUPERLATIVE: {IS_SUPERLATIVE: True},
+    }
+
     @property
     def conjunction_coordination(self):
         return self.first('et', category=CONJUNCTION)
@@ -0,0 +1,59 @@
+# encoding: utf-8
+
+"""Registry of all the feature constants, by name.
+
+The feature constants are looked up by name by the spec elements (see
+NLGElement.__getattr__). They are collected once, from a static list of
+feature modules, so that no directory needs to be walked at import time
+(which also allows pynlg to run from a zip file or a frozen bundle).
+
+When several modules define the same constant name, the last one in
+FEATURE_MODULES wins.
+
+"""
+
+from __future__ import unicode_literals
+
+import importlib
+
+__all__ = ['FEATURE_MODULES', 'FEATURE_CONSTANTS', 'collect_feature_constants']
+
+#  Feature modules, in the order in which their constants are collected.
+#  Any new feature module must be added here.
+FEATURE_MODULES = (
+    'pynlg.lexicon.feature.form',
+    'pynlg.lexicon.feature.number',
+    'pynlg.lexicon.feature.discourse',
+    'pynlg.lexicon.feature',
+    'pynlg.lexicon.feature.feature',
+    'pynlg.lexicon.feature.gender',
+    'pynlg.lexicon.feature.person',
+    'pynlg.lexicon.feature.tense',
+    'pynlg.lexicon.feature.clause',
+    'pynlg.lexicon.feature.category',
+    'pynlg.lexicon.feature.lexical',
+    'pynlg.lexicon.feature.lexical.neutral',
+    'pynlg.lexicon.feature.lexical.en',
+    'pynlg.lexicon.feature.lexical.fr',
+    'pynlg.lexicon.feature.pronoun',
+    'pynlg.lexicon.feature.pronoun.fr',
+    'pynlg.lexicon.feature.internal',
+    'pynlg.lexicon.feature.internal.fr',
+)
+
+
+def collect_feature_constants(modules=FEATURE_MODULES):
+    """Return a dict mapping the name of each constant (upper case
+    attribute) of the argument modules to its value.
+
+    """
+    constants = {}
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for name in dir(module):
+            if name.isupper():
+                constants[name] = getattr(module, name)
+    return constants
+
+
+FEATURE_CONSTANTS = collect_feature_constants()
@@ -6,7 +6,21 @@ from __future__ import unicode_literals
 
 from .lexicon import Lexicon
 from .lang import FRENCH
+from .feature import NUMBER, FORM, TENSE, PERSON, IS_COMPARATIVE
 from .feature.category import CONJUNCTION
+from .feature.gender import FEMININE
+from .feature.number import SINGULAR, PLURAL
+from .feature.person import FIRST, SECOND, THIRD
+from .feature.tense import PRESENT
+from .feature.form import (
+    INDICATIVE, SUBJUNCTIVE, IMPERATIVE, PAST_PARTICIPLE, PRESENT_PARTICIPLE)
+from .feature.lexical import COMPARATIVE, GENDER
+from .feature.lexical.fr import (
+    FEMININE_SINGULAR, FEMININE_PLURAL, FEMININE_PAST_PARTICIPLE,
+    PRESENT1S, PRESENT2S, PRESENT3S, PRESENT1P, PRESENT2P, PRESENT3P,
+    IMPERATIVE2S, IMPERATIVE1P, IMPERATIVE2P,
+    SUBJUNCTIVE1S, SUBJUNCTIVE2S, SUBJUNCTIVE3S,
+    SUBJUNCTIVE1P, SUBJUNCTIVE2P, SUBJUNCTIVE3P)
 
 
 class FrenchLexicon(Lexicon):
@@ -15,6 +29,47 @@ class FrenchLexicon(Lexicon):
 
     language = FRENCH
 
+    INFLECTED_FORMS = (
+        PLURAL, FEMININE_SINGULAR, FEMININE_PLURAL, COMPARATIVE,
+        PRESENT1S, PRESENT2S, PRESENT3S, PRESENT1P, PRESENT2P, PRESENT3P,
+        SUBJUNCTIVE1S, SUBJUNCTIVE2S, SUBJUNCTIVE3S,
+        SUBJUNCTIVE1P, SUBJUNCTIVE2P, SUBJUNCTIVE3P,
+        IMPERATIVE2S, IMPERATIVE1P, IMPERATIVE2P,
+        PAST_PARTICIPLE, FEMININE_PAST_PARTICIPLE, PRESENT_PARTICIPLE)
+
+    #  the subjunctive forms come before the identical imperative ones,
+    #  which are realised as such in any person (see Lexicon.copy_word)
+    INFLECTED_FORM_FEATURES = dict(
+        [
+            (PLURAL, {NUMBER: PLURAL}),
+            (FEMININE_SINGULAR, {GENDER: FEMININE, NUMBER: SINGULAR}),
+            (FEMININE_PLURAL, {GENDER: FEMININE, NUMBER: PLURAL}),
+            (COMPARATIVE, {IS_COMPARATIVE: True}),
+            (PAST_PARTICIPLE, {FORM: PAST_PARTICIPLE}),
+            (FEMININE_PAST_PARTICIPLE, {FORM: PAST_PARTICIPLE, GENDER: FEMININE}),
+            (PRESENT_PARTICIPLE, {FORM: PRESENT_PARTICIPLE}),
+        ]
+        + [
+            (name, {FORM: INDICATIVE, TENSE: PRESENT, PERSON: person, NUMBER: number})
+            for name, person, number in (
+                (PRESENT1S, FIRST, SINGULAR), (PRESENT2S, SECOND, SINGULAR),
+                (PRESENT3S, THIRD, SINGULAR), (PRESENT1P, FIRST, PLURAL),
+                (PRESENT2P, SECOND, PLURAL), (PRESENT3P, THIRD, PLURAL))
+        ]
+        + [
+            (name, {FORM: form, PERSON: person, NUMBER: number})
+            for name, form, person, number in (
+                (IMPERATIVE2S, IMPERATIVE, SECOND, SINGULAR),
+                (IMPERATIVE1P, IMPERATIVE, FIRST, PLURAL),
+                (IMPERATIVE2P, IMPERATIVE, SECOND, PLURAL),
+                (SUBJUNCTIVE1S, SUBJUNCTIVE, FIRST, SINGULAR),
+                (SUBJUNCTIVE2S, SUBJUNCTIVE, SECOND, SINGULAR),
+                (SUBJUNCTIVE3S, SUBJUNCTIVE, THIRD, SINGULAR),
+                (SUBJUNCTIVE1P, SUBJUNCTIVE, FIRST, PLURAL),
+                (SUBJUNCTIVE2P, SUBJUNCTIVE, SECOND, PLURAL),
+                (SUBJUNCTIVE3P, SUBJUNCTIVE, THIRD, PLURAL))
+        ])
+
     @property
     def conjunction_coordination(self):
         return self.first('et', category=CONJUNCTION)
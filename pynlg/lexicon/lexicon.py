@@ -4,19 +4,158 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import re
 import six
 import random
+import threading
 
-from copy import deepcopy
+from copy import copy
+from operator import attrgetter
 from collections import defaultdict
+try:
+    from collections.abc import Hashable
+except ImportError:  # Python 2
+    from collections import Hashable
 from xml.etree import cElementTree as ElementTree
 from os.path import join, dirname, abspath, exists
 
 from .feature.category import ANY
+from .feature.lexical import DEFAULT_SPELL
+from .parallel import CHUNKS_PER_PROCESS, split_chunks, parse_chunk
+from .prefix import PrefixIndex
 from ..exc import UnhandledLanguage
 from ..spec.word import WordElement
+from ..util import deep_sizeof, InflectionCache
 
-__all__ = ['Lexicon']
+__all__ = ['Lexicon', 'LazyWordEntry', 'LexiconIndexes']
+
+
+class LazyWordEntry(object):
+
+    """Index entry standing for a word of a lazy Lexicon, until it is
+    materialised into a WordElement.
+
+    Only the word id, base form and category are known, along with the
+    byte offsets of the word node in the XML lexicon, and its inflected
+    form features (see Lexicon.INFLECTED_FORMS).
+
+    """
+
+    __slots__ = ('id', 'base_form', 'category', 'features', 'start', 'end',
+                 'word')
+
+    def __init__(self, id, base_form, category, start, end, features=None):
+        self.id = id
+        self.base_form = base_form
+        self.category = category
+        self.features = features or {}
+        self.start = start
+        self.end = end
+        self.word = None
+
+    def __repr__(self):
+        return '<%s [%s:%s]>' % (
+            self.__class__.__name__, self.base_form, self.category)
+
+
+class LexiconIndexes(object):
+
+    """Indexes of the words of a Lexicon.
+
+    All the indexes are held by a single object, so that they can be
+    replaced at once by a single assignment (see Lexicon.reload).
+
+    """
+
+    #  attributes holding the indexes mapping keys to lists of entries,
+    #  built while indexing the words
+    LIST_INDEXES = ('base_index', 'variant_index', 'category_index')
+
+    #  attributes holding the secondary indexes mapping keys to lists of
+    #  entries, derived from the list indexes on first access, then
+    #  updated when a word is (un)indexed (see Lexicon.lazy_index)
+    LAZY_INDEXES = (
+        'inflection_index', 'category_base_index', 'category_variant_index',
+        'feature_index')
+
+    __slots__ = (
+        ('xml_source', 'words', 'id_index') + LIST_INDEXES + LAZY_INDEXES
+        + ('prefix_index', 'suffix_index'))
+
+    def __init__(self):
+        self.xml_source = None
+        self.words = set()
+        self.id_index = {}
+        self.base_index = defaultdict(list)
+        self.variant_index = defaultdict(list)
+        self.category_index = defaultdict(list)
+        # inflected form -> [(word, feature names realised by the form)]
+        self.inflection_index = None
+        # (category, base form) -> words, and (category, inflected form)
+        # -> words, serving the category-restricted lookups
+        self.category_base_index = None
+        self.category_variant_index = None
+        # (feature name, value) -> words, serving find_by_features
+        self.feature_index = None
+        # Prefix and suffix indexes of the forms, built on first access
+        # (see Lexicon.prefix_index)
+        self.prefix_index = None
+        self.suffix_index = None
+
+    def copy(self):
+        """Return a copy of the indexes, which can be modified without
+        impacting them. The indexed entries are shared.
+
+        """
+        indexes = self.__class__()
+        indexes.xml_source = self.xml_source
+        indexes.words = set(self.words)
+        indexes.id_index = dict(self.id_index)
+        for attr in self.LIST_INDEXES + self.LAZY_INDEXES:
+            index = getattr(self, attr)
+            if index is not None:
+                setattr(indexes, attr, defaultdict(list, (
+                    (key, list(entries)) for key, entries in index.items())))
+        return indexes
+
+
+#  Whether the instances of each feature value type are hashable
+_HASHABLE_TYPES = {}
+
+
+def is_hashable(value):
+    """Return True if the argument feature value is hashable, and can
+    thus be a key of the feature index.
+
+    The (slow) Hashable check is only done once per value type.
+
+    """
+    value_type = value.__class__
+    try:
+        return _HASHABLE_TYPES[value_type]
+    except KeyError:
+        hashable = _HASHABLE_TYPES[value_type] = issubclass(value_type, Hashable)
+        return hashable
+
+
+def indexes_attribute(name):
+    """Return a property giving access to the argument attribute of the
+    lexicon indexes.
+
+    """
+    def set_attribute(self, value):
+        setattr(self.indexes, name, value)
+
+    return property(attrgetter('indexes.%s' % (name)), set_attribute)
+
+
+def lazy_index_attribute(name):
+    """Return a property giving access to the argument secondary index
+    of the lexicon indexes, built on first access (see
+    Lexicon.lazy_index).
+
+    """
+    return property(lambda self: self.lazy_index(name))
 
 
 class Lexicon(object):
@@ -44,25 +183,92 @@ class Lexicon(object):
         "reg", "irreg", "uncount", "inv",
         "metareg", "glreg", "nonCount", "sing", "groupuncount"]
 
+    #  word features indexed in lazy mode, along with INFLECTED_FORMS
+    LAZY_FEATURES = ('base', 'id', 'category')
+
+    #  word features holding an inflected form of the word, indexed in
+    #  the variant and inflection indexes
+    INFLECTED_FORMS = ()
+
+    #  features realised by each one of the INFLECTED_FORMS, set on the
+    #  words fetched with one of their inflected forms (see copy_word)
+    INFLECTED_FORM_FEATURES = {}
+
+    #  attributes holding the indexes mapping keys to lists of entries
+    LIST_INDEXES = LexiconIndexes.LIST_INDEXES
+
+    #  the indexes, held by the indexes attribute (see LexiconIndexes)
+    xml_source = indexes_attribute('xml_source')
+    words = indexes_attribute('words')
+    id_index = indexes_attribute('id_index')
+    base_index = indexes_attribute('base_index')
+    variant_index = indexes_attribute('variant_index')
+    category_index = indexes_attribute('category_index')
+    inflection_index = lazy_index_attribute('inflection_index')
+    category_base_index = lazy_index_attribute('category_base_index')
+    category_variant_index = lazy_index_attribute('category_variant_index')
+    feature_index = lazy_index_attribute('feature_index')
+
+    #  maximum number of inflected forms held by the inflection cache
+    INFLECTION_CACHE_SIZE = 4096
+
     language = None
 
-    def __init__(self, auto_index=True):
+    def __init__(self, auto_index=True, snapshot=False, lazy=False, processes=None):
         """Create a new Lexicon.
 
         If auto_index is set to True, the XML lexicon corresponding to
         the argument language will be parsed, and several indexes will
         be built at instanciation.
 
+        If snapshot is set to True, the words will be loaded from a
+        binary snapshot of the XML lexicon, if an up-to-date one exists.
+        If not, the XML lexicon is parsed and the snapshot is compiled,
+        to speed up the next instanciations. Snapshots are pickle files,
+        which can execute code when loaded: the snapshot directory (see
+        pynlg.lexicon.snapshot) must not be writable by untrusted users.
+
+        If lazy is set to True, the XML lexicon is only scanned for the
+        word ids, base forms and categories at indexing time. Each word is
+        materialised into a WordElement the first time it is fetched.
+        This makes the indexing almost instantaneous, which suits short
+        lived processes only needing a few words.
+
+        If processes is set, the XML lexicon word nodes are split into
+        chunks, parsed and indexed by a pool of worker processes, which
+        speeds up the indexing of large lexicons on multicore machines.
+        It has no effect in lazy or snapshot mode.
+
         :param language: the language of the lexicon (default: 'english')
         :param auto_index: whether to parse index the lexicon data at
                            instanciation (default: True)
+        :param snapshot: whether to load the lexicon data from a binary
+                         snapshot (default: False)
+        :param lazy: whether to materialise the words on first access
+                     (default: False)
+        :param processes: the number of worker processes parsing the XML
+                          lexicon (default: None, to parse it in the
+                          current process)
 
         """
-        self.words = set()
-        self.id_index = {}
-        self.base_index = defaultdict(list)
-        self.variant_index = defaultdict(list)
-        self.category_index = defaultdict(list)
+        self.snapshot = snapshot
+        self.lazy = lazy
+        self.processes = processes
+        self.indexes = LexiconIndexes()
+        # Words created at runtime (see create_word), by object id
+        self.runtime_words = {}
+        # Serialises the word creations and the reloads
+        self.lock = threading.RLock()
+        # Interned feature names and values, shared by all the words
+        # built while indexing
+        self.interned = {}
+        self.inflected_form_names = frozenset(self.INFLECTED_FORMS)
+        # Realised inflected forms of the words, by entry id and
+        # inflection features (see InflectedWordElement.realise_morphology)
+        self.inflection_cache = InflectionCache(maxsize=self.INFLECTION_CACHE_SIZE)
+        # Precomputed conjugation paradigms of the verbs, if built (see
+        # build_verb_paradigms)
+        self.verb_paradigms = None
 
         if auto_index:
             self.make_indexes()
@@ -84,84 +290,722 @@ class Lexicon(object):
         return bool(self.id_index)
 
     def create_word(self, word):
+        """Add the argument word to the lexicon, and index it.
+
+        The words created this way are not part of the lexicon source,
+        and are kept when the lexicon is reloaded.
+
+        """
+        with self.lock:
+            self.add_word(word)
+            self.runtime_words[id(word)] = word
+
+    def add_word(self, word):
         self.words.add(word)
         self.index_word(word)
 
+    def lookup(self, word_feature, category=ANY):
+        """Return the list of indexed entries associated to the argument
+        word feature (an id, a base form etc), of the argument category.
+
+        Return None if the word feature is not indexed. An inflected
+        form (see INFLECTED_FORMS) is only considered indexed if one of
+        its words is of the argument category.
+
+        Note: the returned entries are the indexed ones, and must not be
+        modified.
+
+        """
+        indexes = self.indexes
+        # Search by base form, then by variant
+        if category == ANY:
+            words = (indexes.base_index.get(word_feature)
+                     or indexes.variant_index.get(word_feature))
+        else:
+            key = (category, word_feature)
+            words = (self.lazy_index('category_base_index', indexes).get(key)
+                     or self.lazy_index('category_variant_index', indexes).get(key))
+        if words:
+            return words
+        # Search by id
+        word = indexes.id_index.get(word_feature)
+        if word is not None:
+            if category == ANY or word.category == category:
+                return [word]
+            return []
+        # The word feature is the base form of words of other categories
+        if indexes.base_index.get(word_feature):
+            return []
+
     def get(self, word_feature, category=ANY, create_if_missing=True):
         """Fetch the WordElement(s) associated to the argument word
-        feature (an, a base form etc) from the Lexicon indexes.
+        feature (an id, a base form etc) from the Lexicon indexes.
 
         If the word is not found, create it if the argument
         ``create_if_missing`` is set to True. Else, return None.
 
+        The returned words are copies of the indexed ones, sharing
+        their features until they are modified (see NLGElement.__copy__),
+        so that any modification to the returned words won't impact the
+        index.
+
         """
-        # Search by base form
-        if self.base_index.get(word_feature):
-            word = self.indexed_words_by_category(
-                word_feature, category, self.base_index)
-        # Search by variant
-        elif self.variant_index.get(word_feature):
-            word = self.indexed_words_by_category(
-                word_feature, category, self.variant_index)
-        # Search by id
-        elif self.id_index.get(word_feature):
-            word = [self.indexed_words_by_category(
-                word_feature, category, self.id_index)]
+        words = self.lookup(word_feature, category=category)
+        if words is not None:
+            return [self.copy_word(w, word_feature) for w in words]
         elif create_if_missing:
-            word = WordElement(
-                base_form=word_feature, category=category, id=None,
-                lexicon=self, realisation=word_feature)
-            self.create_word(word)
-        else:
-            return
-        # don't return the indexed word, but return a deepcopy, so that
-        # any modification to the returned word won't impact the index
-        if isinstance(word, list):
-            return [deepcopy(w) for w in word]
-        else:
-            return deepcopy(word)
+            word = self.create_missing_word(word_feature, category)
+            return copy(word)
+
+    def create_missing_word(self, word_feature, category):
+        """Create, index and return a word which base form is the
+        argument word feature.
+
+        """
+        word = WordElement(
+            base_form=word_feature, category=category, id=None,
+            lexicon=self, realisation=word_feature)
+        self.create_word(word)
+        return word
 
     def first(self, word_feature, category=ANY):
         """Return the first matching word identified by the word_feature
         in one of the Lexicon indexes.
 
+        Only the returned word is copied.
+
         """
-        matches = self.get(word_feature, category=category)
-        if isinstance(matches, WordElement):
-            return matches
-        elif isinstance(matches, list):
-            return matches[0] if matches else None
+        words = self.lookup(word_feature, category=category)
+        if words is not None:
+            return self.copy_word(words[0], word_feature) if words else None
+        return copy(self.create_missing_word(word_feature, category))
 
-    def indexed_words_by_category(self, word_feature, category, index):
-        if category == ANY:
-            return index[word_feature]
-        else:
-            return [w for w in index[word_feature] if w.category == category]
+    def get_many(self, queries, create_if_missing=False):
+        """Fetch the words associated to each one of the argument queries,
+        and return the list of results, aligned with the queries.
+
+        Each query is either a (word feature, category) tuple, or a
+        word feature alone, looked up in all categories. Each result is
+        the list of matching words, or None if the word feature is not
+        indexed (unless ``create_if_missing`` is set to True, in which
+        case the missing word is created, as in ``get``).
+
+        Repeated queries are only resolved once, and share the same
+        result (and word copies).
+
+        Example:
+        >>> lex.get_many([('un', DETERMINER), 'maison', ('un', DETERMINER)])
+        [[<WordElement [un:DETERMINER]>],
+         [<WordElement [maison:NOUN]>],
+         [<WordElement [un:DETERMINER]>]]
+
+        """
+        def resolve(word_feature, category):
+            words = self.lookup(word_feature, category=category)
+            if words is not None:
+                return [self.copy_word(w, word_feature) for w in words]
+            elif create_if_missing:
+                return [copy(self.create_missing_word(word_feature, category))]
+
+        return self.resolve_many(queries, resolve)
+
+    def first_many(self, queries, create_if_missing=False):
+        """Return the first word associated to each one of the argument
+        queries (see get_many), or None if there is no such word.
+
+        """
+        def resolve(word_feature, category):
+            words = self.lookup(word_feature, category=category)
+            if words:
+                return self.copy_word(words[0], word_feature)
+            elif words is None and create_if_missing:
+                return copy(self.create_missing_word(word_feature, category))
+
+        return self.resolve_many(queries, resolve)
+
+    @staticmethod
+    def resolve_many(queries, resolve):
+        """Call the argument resolve function once per distinct query,
+        and return the list of results, aligned with the queries.
+
+        """
+        resolved = {}
+        results = []
+        for query in queries:
+            if isinstance(query, six.string_types):
+                query = (query, ANY)
+            try:
+                result = resolved[query]
+            except KeyError:
+                result = resolved[query] = resolve(*query)
+            results.append(result)
+        return results
+
+    def copy_word(self, entry, word_feature):
+        """Return a copy of the word of the argument index entry, fetched
+        with the argument word feature.
+
+        If the word was fetched with one of its inflected forms, the
+        form is kept as the copy realisation and default spelling
+        variant, and the features realised by the form (see
+        INFLECTED_FORM_FEATURES) are set on the copy, so that the copy is
+        still realised with the form once inflected. If the form realises
+        several features (eg: 'sois'), the first ones in INFLECTED_FORMS
+        order are set.
+
+        """
+        word = copy(self.materialise(entry))
+        if word_feature != word.base_form and word_feature != word.id:
+            word.realisation = word_feature
+            feature_names = self.inflected_forms(word).get(word_feature)
+            if feature_names:
+                features = word.features
+                features[DEFAULT_SPELL] = word_feature
+                features.update(self.INFLECTED_FORM_FEATURES.get(
+                    min(feature_names, key=self.INFLECTED_FORMS.index), {}))
+        return word
+
+    def lookup_inflection(self, form, category=ANY):
+        """Return a list of (word, feature names) tuples, associating each
+        word having the argument inflected form to the names of the
+        features realised by the form.
+
+        The returned words are copies of the indexed ones (see get).
+
+        Example:
+        >>> lex.lookup_inflection('sont')
+        [(<WordElement [être:VERB]>, ('present3p',))]
+
+        """
+        return [
+            (self.copy_word(word, form), feature_names)
+            for word, feature_names in self.inflection_index.get(form, ())
+            if category == ANY or word.category == category
+        ]
+
+    def prefix_search(self, prefix, category=ANY, limit=None):
+        """Return the words having a base or inflected form starting with
+        the argument prefix, of the argument category, sorted by form.
+
+        A word is returned once per matching form, with the form as
+        realisation (see copy_word). At most ``limit`` words are
+        returned, if specified.
+
+        Example:
+        >>> [w.realisation for w in lex.prefix_search('chev', category=NOUN)]
+        ['cheval', 'chevaux', 'cheveu', 'cheveux', ...]
+
+        """
+        return self.search_form_index(self.prefix_index, prefix, category, limit)
+
+    def suffix_search(self, suffix, category=ANY, limit=None):
+        """Return the words having a base or inflected form ending with
+        the argument suffix, of the argument category (see prefix_search).
+
+        The words are sorted by reversed form.
+
+        """
+        return self.search_form_index(self.suffix_index, suffix, category, limit)
+
+    def search_form_index(self, form_index, string, category, limit):
+        words = []
+        for form, entries in form_index.search(string):
+            for entry in entries:
+                if category == ANY or entry.category == category:
+                    words.append(self.copy_word(entry, form))
+                    if len(words) == limit:
+                        return words
+        return words
+
+    def lazy_index(self, name, indexes=None):
+        """Return the argument secondary index (see
+        LexiconIndexes.LAZY_INDEXES) of the argument indexes (default:
+        the lexicon ones), building it on first access.
+
+        Building the secondary indexes while parsing the lexicon slows
+        its loading down noticeably, whereas most applications only use
+        some of them.
+
+        """
+        if indexes is None:
+            indexes = self.indexes
+        index = getattr(indexes, name)
+        if index is None:
+            # not built while a word is being created
+            with self.lock:
+                index = getattr(indexes, name)
+                if index is None:
+                    if name == 'category_base_index':
+                        self.build_category_base_index(indexes)
+                    elif name == 'feature_index':
+                        self.build_feature_index(indexes)
+                    else:
+                        self.build_inflection_indexes(indexes)
+                    index = getattr(indexes, name)
+        return index
+
+    def build_inflection_indexes(self, indexes):
+        """Build the inflection and category variant indexes of the
+        argument lexicon indexes.
+
+        Both are derived from the variant index, which already lists the
+        words having each form in indexing order.
+
+        """
+        inflection_index = defaultdict(list)
+        category_variant_index = defaultdict(list)
+        inflected_forms = {}
+        for form, entries in indexes.variant_index.items():
+            for word in entries:
+                forms = inflected_forms.get(id(word))
+                if forms is None:
+                    forms = inflected_forms[id(word)] = self.inflected_forms(word)
+                feature_names = forms.get(form)
+                if feature_names is None:
+                    continue
+                if form != word.base_form:
+                    category_variant_index[(word.category, form)].append(word)
+                inflection_index[form].append((word, feature_names))
+        indexes.category_variant_index = category_variant_index
+        indexes.inflection_index = inflection_index
+
+    @staticmethod
+    def build_category_base_index(indexes):
+        """Build the category base index of the argument lexicon indexes,
+        from the base index.
+
+        """
+        category_base_index = defaultdict(list)
+        for base_form, entries in indexes.base_index.items():
+            for word in entries:
+                if word.category is not None:
+                    category_base_index[(word.category, base_form)].append(word)
+        indexes.category_base_index = category_base_index
+
+    def build_feature_index(self, indexes):
+        """Build the feature index of the argument lexicon indexes.
+
+        The words of each feature are listed category by category, in
+        indexing order within a category, which is the order in which
+        scan_by_features reads the words of a category.
+
+        """
+        feature_index = defaultdict(list)
+        words = [word for entries in indexes.category_index.values() for word in entries]
+        words.extend(word for word in indexes.words if word.category is None)
+        for word in words:
+            # Lazy word entries have no features to index
+            if isinstance(word, WordElement):
+                self.index_features(word, feature_index)
+        indexes.feature_index = feature_index
+
+    @property
+    def prefix_index(self):
+        """Return the prefix index of the base and inflected forms, built
+        on first access, updated when a word is indexed, and rebuilt after
+        a word is unindexed.
+
+        """
+        indexes = self.indexes
+        if indexes.prefix_index is None:
+            indexes.prefix_index = PrefixIndex(indexes.variant_index)
+        return indexes.prefix_index
+
+    @property
+    def suffix_index(self):
+        """Return the suffix index of the base and inflected forms (see
+        prefix_index).
+
+        """
+        indexes = self.indexes
+        if indexes.suffix_index is None:
+            indexes.suffix_index = PrefixIndex(indexes.variant_index, reverse=True)
+        return indexes.suffix_index
 
     def parse_xml_lexicon(self):
         return ElementTree.parse(self.lexicon_filepath)
 
+    def iter_xml_words(self, source=None):
+        """Incrementally parse the appropriate XML lexicon (or the
+        argument XML file object), and yield a WordElement for each one
+        of its word nodes.
+
+        The XML tree is never fully built: each word node is discarded
+        as soon as it has been converted to a WordElement, which keeps
+        the memory footprint of the parsing bounded.
+
+        """
+        nodes = ElementTree.iterparse(
+            source or self.lexicon_filepath, events=('start', 'end'))
+        _, root = next(nodes)
+        for event, node in nodes:
+            if event == 'end' and node.tag == self.WORD:
+                word = self.word_from_node(node)
+                # Remove the processed word node from the root node,
+                # so that it can be garbage collected
+                root.clear()
+                if word:
+                    yield word
+
+    def iter_snapshot_words(self):
+        """Yield a WordElement for each word of the lexicon, loaded from
+        the binary snapshot of the XML lexicon (see snapshot_chunk).
+
+        """
+        for record in self.snapshot_chunk()[0]:
+            yield self.word_from_record(record)
+
+    def snapshot_chunk(self):
+        """Return the (records, id index, indexes) chunk of the lexicon
+        words (see parallel.index_chunk), loaded from the binary snapshot
+        of the XML lexicon.
+
+        If the snapshot does not exist or is stale, the XML lexicon is
+        parsed and indexed instead, and the snapshot is (re)compiled.
+        Failing to write the snapshot is not an error: the lexicon will
+        simply be parsed again next time.
+
+        """
+        # the snapshot module (and hashlib) are only needed in snapshot mode
+        from .snapshot import (
+            checksum, snapshot_filepath, load_snapshot, dump_snapshot, compile_chunk)
+        lexicon_filepath = self.lexicon_filepath
+        filepath = snapshot_filepath(lexicon_filepath)
+        source_checksum = checksum(lexicon_filepath)
+        chunk = load_snapshot(filepath, source_checksum)
+        if chunk is None:
+            chunk = compile_chunk(self)
+            try:
+                dump_snapshot(chunk, filepath, source_checksum)
+            except (IOError, OSError):
+                pass
+        return chunk
+
+    def iter_lazy_entries(self):
+        """Scan the appropriate XML lexicon, and yield a LazyWordEntry
+        for each one of its word nodes.
+
+        The XML lexicon content is kept in memory, to materialise the
+        words later on.
+
+        """
+        # xml.sax.saxutils imports urllib, which is slow to import
+        from xml.sax.saxutils import unescape
+        with open(self.lexicon_filepath, 'rb') as f:
+            self.xml_source = source = f.read()
+        # The indexed feature names and the inflected forms are matched by
+        # a single scan of each word node
+        feature_names = dict(
+            (name.encode('utf-8'), name)
+            for name in self.LAZY_FEATURES + self.INFLECTED_FORMS)
+        feature_re = re.compile(('<(%s)>([^<]*)</\\1>' % (
+            '|'.join(self.LAZY_FEATURES + self.INFLECTED_FORMS))).encode('utf-8'))
+        findall = feature_re.findall
+        for start, end in self.iter_word_spans(source):
+            features = {}
+            for feature_name, feature_value in findall(source, start, end):
+                feature_value = feature_value.strip().decode('utf-8')
+                if '&' in feature_value:
+                    feature_value = unescape(
+                        feature_value, {'&quot;': '"', '&apos;': "'"})
+                features[feature_names[feature_name]] = feature_value
+            category = features.pop('category', None)
+            yield LazyWordEntry(
+                id=features.pop('id', None),
+                base_form=features.pop('base', None),
+                category=category.upper() if category else None,
+                start=start,
+                end=end,
+                features=features)
+
+    @staticmethod
+    def iter_word_spans(source):
+        """Yield the (start, end) byte offsets of each word node of the
+        argument XML lexicon content, skipping the commented-out ones.
+
+        """
+        position = 0
+        while True:
+            start = source.find(b'<word>', position)
+            if start == -1:
+                break
+            # skip any commented-out word node
+            comment_start = source.find(b'<!--', position, start)
+            if comment_start != -1:
+                position = source.find(b'-->', comment_start) + 3
+                continue
+            end = source.find(b'</word>', start) + 7
+            position = end
+            yield start, end
+
+    def iter_chunks(self):
+        """Parse the XML lexicon in a pool of worker processes, and yield
+        the (records, id index, indexes) of each one of its chunks, in
+        order (see parallel.parse_chunk).
+
+        """
+        filepath = self.lexicon_filepath
+        with open(filepath, 'rb') as f:
+            spans = list(self.iter_word_spans(f.read()))
+        tasks = [
+            (self.__class__, filepath, start, end)
+            for start, end in split_chunks(spans, self.processes * CHUNKS_PER_PROCESS)
+        ]
+        # multiprocessing is only imported when needed, as it is slow to
+        # import and most lexicons are loaded in the current process
+        import multiprocessing
+        pool = multiprocessing.Pool(self.processes)
+        try:
+            for chunk in pool.imap(parse_chunk, tasks):
+                yield chunk
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def merge_chunks(self, chunks):
+        """Merge the argument chunk indexes into the lexicon indexes.
+
+        Raise a ValueError if a word id is used in several chunks.
+
+        """
+        for records, id_index, indexes in chunks:
+            duplicates = set(id_index).intersection(self.id_index)
+            if duplicates:
+                raise ValueError(
+                    'Index %s already in id_index' % (min(duplicates)))
+            words = [self.word_from_record(record) for record in records]
+            self.words.update(words)
+            for word_id, position in id_index.items():
+                self.id_index[word_id] = words[position]
+            for attr, chunk_index in indexes.items():
+                index = getattr(self, attr)
+                for key, positions in chunk_index.items():
+                    entries = [words[position] for position in positions]
+                    if key in index:
+                        index[key].extend(entries)
+                    else:
+                        index[key] = entries
+        indexes = self.indexes
+        for attr in indexes.LAZY_INDEXES:
+            setattr(indexes, attr, None)
+        indexes.prefix_index = indexes.suffix_index = None
+
+    def build_verb_paradigms(self):
+        """Generate the conjugation paradigms of all the lexicon verbs,
+        which then serve their realisations (see
+        pynlg.morphology.paradigm), and return them.
+
+        """
+        from ..morphology.paradigm import VerbParadigms
+        self.verb_paradigms = VerbParadigms.build(self)
+        return self.verb_paradigms
+
+    def materialise(self, entry):
+        """Return the WordElement associated with the argument index
+        entry, building it from its XML node if the entry is a
+        LazyWordEntry which word has not been materialised yet.
+
+        """
+        if entry.__class__ is not LazyWordEntry:
+            return entry
+        if entry.word is None:
+            word_node = ElementTree.fromstring(self.xml_source[entry.start:entry.end])
+            entry.word = self.word_from_node(word_node)
+        return entry.word
+
     def make_indexes(self):
-        """Parse the appropriate XML lexicon, and build several indexes,
-        allowing fast access using several facets (id, word, base,
-        variant, category).
+        """Parse the appropriate XML lexicon (or its binary snapshot),
+        and build several indexes, allowing fast access using several
+        facets (id, word, base, variant, category).
+
+        In lazy mode, the indexes contain LazyWordEntry objects, that
+        are only materialised into WordElement objects when fetched.
+
+        """
+        if self.processes and not (self.lazy or self.snapshot):
+            self.merge_chunks(self.iter_chunks())
+        elif self.snapshot and not self.lazy:
+            # the snapshot holds the indexes as well as the words
+            self.merge_chunks([self.snapshot_chunk()])
+        else:
+            for word in self.iter_words():
+                self.add_word(word)
+        # The interned values are now referenced by the words
+        self.interned = {}
+
+    def iter_words(self):
+        """Yield the words of the lexicon source, either as WordElement
+        or LazyWordEntry objects, depending on the loading mode.
 
         """
-        self.tree = self.parse_xml_lexicon()
-        root = self.tree.getroot()
-        for word_node in root:
-            word = self.word_from_node(word_node)
-            if word:
-                self.create_word(word)
+        if self.lazy:
+            return self.iter_lazy_entries()
+        elif self.snapshot:
+            return self.iter_snapshot_words()
+        elif self.processes:
+            return (
+                self.word_from_record(record)
+                for records, _, _ in self.iter_chunks() for record in records)
+        else:
+            return self.iter_xml_words()
+
+    def reload(self):
+        """Read the lexicon source again, and only apply the added,
+        modified and removed words to the indexes.
+
+        The words are matched by id, or by base form and category for
+        the words without id. The words created at runtime (see
+        create_word) are kept.
+
+        The changes are applied to a copy of the indexes (see
+        LexiconIndexes), which then replaces the current indexes in a
+        single assignment: each lookup is served either by the old or by
+        the new indexes, never by partially updated ones. The words
+        created while the lexicon source is read again are added to the
+        copy before the swap.
+
+        Return a dict counting the 'added', 'changed' and 'removed' words.
+
+        """
+        # The staging lexicon has its own containers, so that the live
+        # lexicon is left untouched until the swap. Its inflection cache
+        # is disabled and it has no verb paradigms: both are reset for
+        # the live lexicon after the swap.
+        staging = copy(self)
+        with self.lock:
+            staging.indexes = self.indexes.copy()
+            staging.runtime_words = dict(self.runtime_words)
+        staging.interned = {}
+        staging.inflection_cache = InflectionCache(maxsize=0)
+        staging.verb_paradigms = None
+
+        old_words = self.word_keys(staging.source_words())
+        new_words = self.word_keys(staging.iter_words())
+        # The new words are built by the staging lexicon
+        for word in new_words.values():
+            if isinstance(word, WordElement):
+                word.lexicon = self
+        removed = [word for key, word in old_words.items() if key not in new_words]
+        added = [word for key, word in new_words.items() if key not in old_words]
+        changed, moved = [], []
+        for key, new_word in new_words.items():
+            old_word = old_words.get(key)
+            if old_word is None:
+                continue
+            if not staging.same_word(old_word, new_word, self):
+                changed.append((old_word, new_word))
+            elif (
+                    isinstance(old_word, LazyWordEntry)
+                    and (old_word.start, old_word.end) != (new_word.start, new_word.end)
+            ):
+                # Same XML node at another position of the XML lexicon
+                moved.append((old_word, new_word))
+
+        for word in removed:
+            staging.unindex_word(word)
+        for old_word, _ in changed + moved:
+            staging.unindex_word(old_word)
+        for _, new_word in changed + moved:
+            staging.add_word(new_word)
+        for word in added:
+            staging.add_word(word)
+
+        with self.lock:
+            for key, word in self.runtime_words.items():
+                if key not in staging.runtime_words:
+                    staging.create_word(word)
+            indexes = staging.indexes
+            indexes.prefix_index = indexes.suffix_index = None
+            self.indexes = indexes
+            self.runtime_words = staging.runtime_words
+            self.inflection_cache.clear()
+            if self.verb_paradigms is not None:
+                self.build_verb_paradigms()
+        return {'added': len(added), 'changed': len(changed), 'removed': len(removed)}
+
+    def source_words(self):
+        """Return the indexed words coming from the lexicon source, in
+        indexing order.
+
+        """
+        runtime_words = self.runtime_words
+        words = list(self.id_index.values())
+        for entries in self.category_base_index.values():
+            words.extend(w for w in entries if w.id is None)
+        return [w for w in words if id(w) not in runtime_words]
+
+    @staticmethod
+    def word_keys(words):
+        """Return a dict mapping the argument words to their reload key:
+        their id, or their base form, category and rank among the words
+        without id having the same base form and category.
+
+        Raise a ValueError if several words have the same id.
+
+        """
+        keys = {}
+        ranks = defaultdict(int)
+        for word in words:
+            if word.id is not None:
+                key = word.id
+                if key in keys:
+                    raise ValueError('Index %s already in id_index' % (key))
+            else:
+                key = (word.base_form, word.category)
+                ranks[key] += 1
+                key += (ranks[key], )
+            keys[key] = word
+        return keys
+
+    def same_word(self, word, new_word, old_lexicon):
+        """Return True if the argument word of the old lexicon is
+        identical to the argument new word.
+
+        Lazy word entries are compared using their XML node content, and
+        the new entry of an identical word inherits the old materialised
+        word.
+
+        """
+        if isinstance(word, LazyWordEntry):
+            node = old_lexicon.xml_source[word.start:word.end]
+            if node != self.xml_source[new_word.start:new_word.end]:
+                return False
+            new_word.word = word.word
+            return True
+        return self.word_to_record(word) == self.word_to_record(new_word)
+
+    @staticmethod
+    def word_to_record(word):
+        """Convert a WordElement to a picklable record, containing
+        all the information needed to rebuild it.
+
+        """
+        return (word.id, word.base_form, word.category, word.features)
+
+    def word_from_record(self, record):
+        """Convert a record built by word_to_record to a WordElement."""
+        id, base_form, category, features = record
+        word = WordElement(
+            base_form=base_form, category=category, id=id, lexicon=self,
+            realisation=base_form)
+        word.features = features
+        return word
 
     def word_from_node(self, word_node):
         """Convert a word node of the lexicon to a WordElement."""
         if word_node.tag != self.WORD:
             return None
         word = WordElement(base_form=None, category=None, id=None, lexicon=self)
+        # The word is new: its features are set in its own dict. The
+        # feature names and values are interned, so that all the words
+        # built while indexing share the same string objects.
+        features = word._features
+        intern = self.interned.setdefault
         inflections = []
         for feature_node in word_node:
             feature_name = six.text_type(feature_node.tag.strip())
+            feature_name = intern(feature_name, feature_name)
             feature_value = feature_node.text
             assert bool(feature_name), "empty feature_name for word_node %s" % (
                 feature_value)
@@ -170,21 +1014,22 @@ class Lexicon(object):
 
             # Set word base_form, id, category, inflection codes and features
             if feature_name == self.BASE:
-                word.base_form = feature_value
-                word.realisation = feature_value
+                word.base_form = intern(feature_value, feature_value)
+                word.realisation = word.base_form
             elif feature_name == self.ID:
                 word.id = feature_value
             elif feature_name == self.CATEGORY:
-                word.category = feature_value.upper()
+                category = feature_value.upper()
+                word.category = intern(category, category)
             elif not feature_value:
                 if feature_name in self.INFL_CODES:
                     inflections.append(feature_name)
                 else:
-                    word[feature_name] = True
+                    features[feature_name] = True
             else:
-                word[feature_name] = feature_value
+                features[feature_name] = intern(feature_value, feature_value)
 
-        # If no inflection is specified, assume the word is regular
+        # If no inflection is specified, assume the word is regular.
         inflections = inflections or ['reg']
 
         # The default inflection code is "reg" if we have it, else we take
@@ -200,18 +1045,141 @@ class Lexicon(object):
 
         return word
 
+    def unindex_word(self, word):
+        """Remove the argument word from all the indexes."""
+        def remove(index, key, entry=word):
+            entries = [e for e in index.get(key, ()) if e is not entry]
+            if entries:
+                index[key] = entries
+            else:
+                index.pop(key, None)
+
+        indexes = self.indexes
+        indexes.words.discard(word)
+        self.runtime_words.pop(id(word), None)
+        if word.id is not None and indexes.id_index.get(word.id) is word:
+            del indexes.id_index[word.id]
+            self.inflection_cache.invalidate(word.id)
+            if self.verb_paradigms is not None:
+                self.verb_paradigms.discard(word.id)
+        if word.base_form:
+            remove(indexes.base_index, word.base_form)
+            remove(indexes.variant_index, word.base_form)
+        if word.category is not None:
+            remove(indexes.category_index, word.category)
+            if indexes.category_base_index is not None:
+                remove(indexes.category_base_index, (word.category, word.base_form))
+        inflection_index = indexes.inflection_index
+        for form in self.inflected_forms(word):
+            remove(indexes.variant_index, form)
+            if inflection_index is not None:
+                remove(indexes.category_variant_index, (word.category, form))
+                inflection_index[form] = [
+                    e for e in inflection_index.get(form, ()) if e[0] is not word]
+                if not inflection_index[form]:
+                    del inflection_index[form]
+        if indexes.feature_index is not None and isinstance(word, WordElement):
+            for feature in word._features.items():
+                if is_hashable(feature[1]):
+                    remove(indexes.feature_index, feature)
+        indexes.prefix_index = indexes.suffix_index = None
+
     def index_word(self, word):
+        """Add the argument word to the indexes, and to the secondary
+        indexes which are already built (see lazy_index).
+
+        """
+        indexes = self.indexes
         if word.base_form:
-            self.base_index[word.base_form].append(word)
-            self.variant_index[word.base_form].append(word)
+            indexes.base_index[word.base_form].append(word)
+            self.index_variant(word.base_form, word)
         if word.id is not None:
-            if word.id in self.id_index:
+            if word.id in indexes.id_index:
                 raise ValueError(
                     'Index %s already in id_index' % (word.id))
             else:
-                self.id_index[word.id] = word
+                indexes.id_index[word.id] = word
         if word.category is not None:
-            self.category_index[word.category].append(word)
+            indexes.category_index[word.category].append(word)
+            if word.base_form and indexes.category_base_index is not None:
+                indexes.category_base_index[(word.category, word.base_form)].append(word)
+        inflection_index = indexes.inflection_index
+        for form, feature_names in self.inflected_forms(word).items():
+            if form != word.base_form:
+                self.index_variant(form, word)
+                if inflection_index is not None:
+                    indexes.category_variant_index[(word.category, form)].append(word)
+            if inflection_index is not None:
+                inflection_index[form].append((word, feature_names))
+        # Lazy word entries have no features to index
+        if indexes.feature_index is not None and isinstance(word, WordElement):
+            self.index_features(word, indexes.feature_index)
+
+    @staticmethod
+    def index_features(word, feature_index):
+        """Add the argument word to the feature index entries of its
+        hashable (feature name, value) pairs.
+
+        """
+        for feature in word._features.items():
+            if is_hashable(feature[1]):
+                feature_index[feature].append(word)
+
+    def index_variant(self, form, word):
+        """Add the argument word to the variant index entries of the
+        argument form. A new form is inserted in the prefix and suffix
+        indexes, if they are built.
+
+        """
+        indexes = self.indexes
+        entries = indexes.variant_index.get(form)
+        if entries is not None:
+            entries.append(word)
+            return
+        entries = indexes.variant_index[form] = [word]
+        for form_index in (indexes.prefix_index, indexes.suffix_index):
+            if form_index is not None:
+                form_index.add(form, entries)
+
+    def inflected_forms(self, word):
+        """Return a dict mapping each inflected form of the argument word
+        (or lazy word entry) to the tuple of feature names it realises.
+
+        Example:
+        >>> lex.inflected_forms(lex.first('être'))['sois']
+        ('imperative2s', 'subjunctive1s', 'subjunctive2s')
+
+        """
+        features = word._features if isinstance(word, WordElement) else word.features
+        inflected_form_names = self.inflected_form_names
+        forms = {}
+        for feature_name, form in features.items():
+            if (
+                    feature_name in inflected_form_names
+                    and form and isinstance(form, six.string_types)
+            ):
+                forms[form] = forms.get(form, ()) + (feature_name, )
+        return forms
+
+    def memory_usage(self):
+        """Return the approximate memory used by the lexicon, in bytes,
+        broken down by attribute.
+
+        The words (and their features) are accounted for in 'words',
+        the indexes only account for their own structures. Objects
+        shared by several words (eg: interned strings) are only
+        accounted for once.
+
+        """
+        seen = set([id(self)])
+        usage = {}
+        for attr in ('words', 'id_index', 'base_index', 'variant_index',
+                     'inflection_index', 'category_index',
+                     'category_base_index', 'category_variant_index',
+                     'feature_index', 'xml_source'):
+            usage[attr] = deep_sizeof(getattr(self, attr), seen)
+        usage['total'] = sum(usage.values())
+        return usage
 
     @property
     def lexicon_filepath(self):
@@ -238,8 +1206,38 @@ class Lexicon(object):
         argument features, and having the same category as the argument
         one.
 
+        The candidate words are taken from the shortest posting list
+        of the feature index among the argument (feature, value) pairs,
+        and checked against the other pairs.
+
+        The returned word is a copy of the indexed one (see get).
+
+        """
+        if self.lazy or not features:
+            word = self.scan_by_features(features, category)
+        else:
+            candidates = min(
+                (self.feature_index.get(feature, ()) for feature in features.items()),
+                key=len)
+            for word in candidates:
+                if (
+                        (category == ANY or word.category == category)
+                        and word.has_features(features)
+                ):
+                    break
+            else:
+                word = None
+        if word is not None:
+            return self.copy_word(word, word.base_form)
+
+    def scan_by_features(self, features, category=ANY):
+        """Return the first indexed word found with features including
+        the argument features, and having the same category as the
+        argument one, by scanning all the words of the category.
+
         """
         haystack = self.words if category == ANY else self.category_index[category]
-        for word in haystack:
-            if self.is_dict_subset(features, word.features):
+        for entry in haystack:
+            word = self.materialise(entry)
+            if self.is_dict_subset(features, word._features):
                 return word
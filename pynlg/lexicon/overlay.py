@@ -0,0 +1,179 @@
+# encoding: utf-8
+
+"""Definition of the overlay lexicons.
+
+An overlay lexicon stacks a private vocabulary (eg: domain specific
+words) on top of a base lexicon, which is never modified. All the
+lookups are chained from the overlay to its base, so that several
+overlays can share the same base lexicon, without duplicating it, and
+without seeing each other's words.
+
+Example:
+>>> from pynlg.lexicon import registry
+>>> from pynlg.lexicon.overlay import OverlayLexicon
+>>> lex = OverlayLexicon(registry.get('french'))
+>>> lex.create_word(WordElement('Olympia', NOUN, 'olympia_1', lexicon=lex))
+>>> lex.first('Olympia')
+<WordElement (realisation=Olympia, category=NOUN)>
+>>> registry.get('french').get('Olympia', create_if_missing=False)  # None
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from .lexicon import Lexicon
+from .feature.category import ANY
+
+__all__ = ['OverlayLexicon']
+
+
+class OverlayLexicon(Lexicon):
+
+    """Lexicon stacking its own words on top of a read-only base lexicon.
+
+    The overlay words are stored in the overlay indexes, and the words
+    missing from both the overlay and the base are created in the
+    overlay. An overlay word having the same id as a base word shadows
+    it.
+
+    The words fetched from the base lexicon through the overlay are
+    attached to the overlay, so that any further lookup made from the
+    words themselves go through the overlay as well.
+
+    """
+
+    def __init__(self, base):
+        """Create an empty overlay lexicon on top of the argument base
+        lexicon (which can be an overlay itself).
+
+        """
+        self.base = base
+        self.language = base.language
+        super(OverlayLexicon, self).__init__(auto_index=False)
+
+    def __getattr__(self, name):
+        """Fallback on the base lexicon for the attributes defined by
+        language specific lexicons (eg: conjunction_coordination).
+
+        """
+        if name == 'base':
+            # the overlay is not initialized yet
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+    def __repr__(self):
+        return '<%s - %s (over %r)>' % (
+            self.__class__.__name__, self.language, self.base)
+
+    @property
+    def indexed(self):
+        return self.base.indexed
+
+    @property
+    def lexicon_filepath(self):
+        return self.base.lexicon_filepath
+
+    def iter_words(self):
+        """An overlay has no XML lexicon of its own: its indexes only
+        contain the words created in the overlay.
+
+        """
+        return iter(())
+
+    def shadowed(self, words):
+        """Return the argument base words, without the ones shadowed by
+        an overlay word with the same id.
+
+        """
+        id_index = self.id_index
+        if not id_index:
+            return words
+        return [w for w in words if w.id is None or w.id not in id_index]
+
+    def lookup(self, word_feature, category=ANY):
+        """Return the list of indexed entries associated to the argument
+        word feature, of the argument category, from both the overlay
+        and the base lexicon (the overlay entries coming first).
+
+        Return None if the word feature is indexed in neither of them.
+
+        """
+        words = super(OverlayLexicon, self).lookup(word_feature, category)
+        base_words = self.base.lookup(word_feature, category)
+        if base_words is None:
+            return words
+        base_words = self.shadowed(base_words)
+        if words is None:
+            return base_words
+        return words + base_words
+
+    def lookup_inflection(self, form, category=ANY):
+        inflections = super(OverlayLexicon, self).lookup_inflection(form, category)
+        for word, feature_names in self.base.lookup_inflection(form, category):
+            if self.shadowed([word]):
+                word.lexicon = self
+                inflections.append((word, feature_names))
+        return inflections
+
+    def prefix_search(self, prefix, category=ANY, limit=None):
+        return self.merge_searches(
+            super(OverlayLexicon, self).prefix_search(prefix, category, limit),
+            self.base.prefix_search(prefix, category, self.base_limit(limit)),
+            lambda word: word.realisation, limit)
+
+    def suffix_search(self, suffix, category=ANY, limit=None):
+        return self.merge_searches(
+            super(OverlayLexicon, self).suffix_search(suffix, category, limit),
+            self.base.suffix_search(suffix, category, self.base_limit(limit)),
+            lambda word: word.realisation[::-1], limit)
+
+    def base_limit(self, limit):
+        # Some of the base words might be shadowed
+        return limit + len(self.id_index) if limit is not None else None
+
+    def merge_searches(self, words, base_words, key, limit):
+        """Merge the argument overlay and base search results, sorted by
+        the argument key function.
+
+        """
+        for word in self.shadowed(base_words):
+            word.lexicon = self
+            words.append(word)
+        words.sort(key=key)
+        return words[:limit] if limit is not None else words
+
+    def materialise(self, entry):
+        # lazy entries can only come from the base lexicon
+        return self.base.materialise(entry)
+
+    def copy_word(self, entry, word_feature):
+        word = super(OverlayLexicon, self).copy_word(entry, word_feature)
+        word.lexicon = self
+        return word
+
+    def find_by_features(self, features, category=ANY):
+        """Return the first word found with features including the
+        argument features, and having the same category as the argument
+        one, in the overlay, then in the base lexicon.
+
+        The base words are copied and attached to the overlay, as in
+        lookup.
+
+        """
+        word = super(OverlayLexicon, self).find_by_features(features, category)
+        if word is not None:
+            return word
+        word = self.base.find_by_features(features, category)
+        if word is not None and not self.shadowed([word]):
+            # The first matching base word is shadowed: fallback
+            # on a scan of the base words.
+            haystack = (self.base.words if category == ANY
+                        else self.base.category_index.get(category, ()))
+            for entry in self.shadowed(haystack):
+                if self.base.materialise(entry).has_features(features):
+                    word = entry
+                    break
+            else:
+                return None
+        if word is not None:
+            return self.copy_word(word, word.base_form)
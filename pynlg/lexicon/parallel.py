@@ -0,0 +1,89 @@
+# encoding: utf-8
+
+"""Definition of the parallel parsing of the XML lexicons.
+
+Converting the XML word nodes to WordElement objects is the most
+expensive part of the indexing of a large XML lexicon. The word nodes
+of a lexicon can be split into chunks of contiguous nodes, each one of
+them being parsed and indexed by a worker process. The partial indexes
+of the chunks are then merged, in order, into the lexicon indexes.
+
+Example:
+>>> from pynlg.lexicon.fr import FrenchLexicon
+>>> lex = FrenchLexicon(processes=4)
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from io import BytesIO
+
+__all__ = ['CHUNKS_PER_PROCESS', 'split_chunks', 'index_chunk', 'parse_chunk']
+
+#  Number of chunks parsed by each worker process. Smaller chunks
+#  balance the load between the workers, and allow the merging of the
+#  first chunks to start while the last ones are being parsed.
+CHUNKS_PER_PROCESS = 4
+
+
+def split_chunks(spans, count):
+    """Split the argument list of (start, end) word node spans into (at
+    most) count chunks of contiguous word nodes, and return the list of
+    (start, end) spans of the chunks.
+
+    Example:
+    >>> split_chunks([(0, 10), (10, 20), (25, 30)], 2)
+    [(0, 20), (25, 30)]
+
+    """
+    size = -(-len(spans) // count) if count > 0 else len(spans)
+    return [
+        (spans[i][0], spans[min(i + size, len(spans)) - 1][1])
+        for i in range(0, len(spans), max(size, 1))
+    ]
+
+
+def index_chunk(lexicon, words):
+    """Return the (records, id index, indexes) chunk of the argument
+    words, which must be the only words indexed by the argument lexicon.
+
+    The records are the word records (see Lexicon.word_to_record), and
+    the id index and Lexicon.LIST_INDEXES indexes are plain dicts in
+    which each word is replaced by the position of its record. Records
+    and positions are much cheaper to send back from a worker process,
+    or to store in a snapshot, than WordElement objects (see
+    Lexicon.merge_chunks).
+
+    """
+    positions = dict((id(word), position) for position, word in enumerate(words))
+    indexes = {}
+    for attr in lexicon.LIST_INDEXES:
+        indexes[attr] = dict(
+            (key, [positions[id(word)] for word in entries])
+            for key, entries in getattr(lexicon, attr).items())
+    id_index = dict(
+        (word_id, positions[id(word)]) for word_id, word in lexicon.id_index.items())
+    return [lexicon.word_to_record(word) for word in words], id_index, indexes
+
+
+def parse_chunk(task):
+    """Parse the word nodes of a chunk of a XML lexicon, and index them.
+
+    The task is a (lexicon class, XML lexicon path, start, end) tuple.
+    The lexicon class must be importable, as it is sent to the worker
+    processes.
+
+    Return the (records, id index, indexes) chunk of the parsed words
+    (see index_chunk).
+
+    """
+    lexicon_class, filepath, start, end = task
+    lexicon = lexicon_class(auto_index=False)
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    words = []
+    for word in lexicon.iter_xml_words(BytesIO(b'<lexicon>' + chunk + b'</lexicon>')):
+        lexicon.add_word(word)
+        words.append(word)
+    return index_chunk(lexicon, words)
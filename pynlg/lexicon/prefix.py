@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""Definition of the prefix indexes, allowing to search all the words
+of a lexicon starting (or ending) with a given string.
+
+A PrefixIndex stores its keys in a sorted list, and finds the keys
+starting with a prefix using a binary search. This provides the same
+prefix queries as a trie, for the memory cost of two pointer arrays,
+as the index values are shared with the lexicon indexes.
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from bisect import bisect_left
+
+__all__ = ['PrefixIndex']
+
+
+class PrefixIndex(object):
+
+    """Index of string keys, supporting prefix searches.
+
+    Example:
+    >>> index = PrefixIndex({'chat': 1, 'cheval': 2, 'chevaux': 3})
+    >>> list(index.search('chev'))
+    [('cheval', 2), ('chevaux', 3)]
+    >>> index = PrefixIndex({'chat': 1, 'cheval': 2}, reverse=True)
+    >>> list(index.search('al'))  # keys ending with 'al'
+    [('cheval', 2)]
+
+    """
+
+    __slots__ = ('keys', 'values', 'reverse')
+
+    def __init__(self, mapping, reverse=False):
+        """Build an index of the argument mapping items.
+
+        If reverse is True, the index keys are stored reversed, so that
+        searching a prefix actually searches the keys ending with it.
+
+        """
+        self.reverse = reverse
+        if reverse:
+            items = sorted((key[::-1], value) for key, value in mapping.items())
+        else:
+            items = sorted(mapping.items())
+        self.keys = [key for key, _ in items]
+        self.values = [value for _, value in items]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        if self.reverse:
+            key = key[::-1]
+        position = bisect_left(self.keys, key)
+        return position < len(self.keys) and self.keys[position] == key
+
+    def add(self, key, value):
+        """Insert the argument key, which must not be indexed yet, along
+        with the argument value.
+
+        """
+        if self.reverse:
+            key = key[::-1]
+        position = bisect_left(self.keys, key)
+        self.keys.insert(position, key)
+        self.values.insert(position, value)
+
+    def search(self, prefix):
+        """Yield the (key, value) items which key starts with the argument
+        prefix (or ends with it, for a reverse index), sorted by
+        (reversed) key.
+
+        """
+        keys, values = self.keys, self.values
+        if self.reverse:
+            prefix = prefix[::-1]
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            key = keys[position]
+            yield (key[::-1] if self.reverse else key), values[position]
+            position += 1
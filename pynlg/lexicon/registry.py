@@ -0,0 +1,71 @@
+# encoding: utf-8
+
+"""Definition of the process-wide lexicon registry.
+
+Indexing a lexicon is expensive, and a Lexicon instance can safely be
+shared, so each language lexicon should only be loaded once per process.
+The registry lazily instanciates the lexicon of a language the first
+time it is requested, and hands out the same instance afterwards.
+
+Example:
+>>> from pynlg.lexicon import registry
+>>> lex = registry.get('french')
+>>> lex is registry.get('french')
+True
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import threading
+
+from ..util import get_lexicon
+
+__all__ = ['get', 'register', 'unregister', 'clear']
+
+_lexicons = {}
+_lock = threading.Lock()
+
+
+def get(language):
+    """Return the shared lexicon of the argument language, and load it
+    if it has not been loaded yet.
+
+    If several threads request a language lexicon that has not been
+    loaded yet, it will only be loaded once.
+
+    """
+    try:
+        return _lexicons[language]
+    except KeyError:
+        pass
+    with _lock:
+        # The lexicon could have been loaded by another thread while
+        # we were waiting for the lock
+        if language not in _lexicons:
+            _lexicons[language] = get_lexicon(language)()
+        return _lexicons[language]
+
+
+def register(lexicon):
+    """Register the argument lexicon instance as the shared lexicon of
+    its language (eg: a lexicon loaded with specific options).
+
+    """
+    with _lock:
+        _lexicons[lexicon.language] = lexicon
+
+
+def unregister(language):
+    """Remove the shared lexicon of the argument language from the
+    registry, if any. It will be loaded again on next access.
+
+    """
+    with _lock:
+        _lexicons.pop(language, None)
+
+
+def clear():
+    """Remove all the shared lexicons from the registry."""
+    with _lock:
+        _lexicons.clear()
@@ -0,0 +1,180 @@
+# encoding: utf-8
+
+"""Definition of the binary lexicon snapshots.
+
+Parsing a XML lexicon is the most expensive part of a Lexicon
+instanciation. A snapshot is a precompiled binary version of the words
+contained in a XML lexicon and of their indexes, that can be loaded in a
+fraction of the XML parsing and indexing time.
+
+Each snapshot is stamped with a format version and with the checksum of
+the XML file it was compiled from: a snapshot is automatically
+considered stale (and ignored) when any of them changes.
+
+Snapshots are pickle files, and unpickling a file can execute arbitrary
+code: whoever can write a snapshot can run code in the processes loading
+it. A snapshot is thus only loaded if it is owned by the current user (or
+by root) and is not writable by its group or by the other users. The
+PYNLG_SNAPSHOT_DIR directory must never be writable by untrusted users.
+
+Snapshots can be compiled ahead of time (at build or deploy time) with:
+
+    $ python -m pynlg.lexicon.snapshot french english
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import os
+import sys
+import stat
+import hashlib
+
+from os.path import join, dirname, basename, exists
+
+from six.moves import cPickle as pickle
+
+from .parallel import index_chunk
+
+__all__ = ['SNAPSHOT_VERSION', 'checksum', 'snapshot_filepath', 'dump_snapshot',
+           'is_trusted', 'load_snapshot', 'compile_chunk', 'compile_snapshot']
+
+#  Version of the snapshot format. Bump it whenever the record layout
+#  (see Lexicon.word_to_record) or the chunk layout (see
+#  parallel.index_chunk) changes.
+SNAPSHOT_VERSION = 2
+
+#  Magic string identifying a pynlg lexicon snapshot
+MAGIC = 'pynlg-lexicon-snapshot'
+
+#  Environment variable allowing to store snapshots out of the package
+#  data directory (eg: when the package is installed read-only).
+SNAPSHOT_DIR_ENV = 'PYNLG_SNAPSHOT_DIR'
+
+
+def checksum(filepath):
+    """Return the SHA1 hex digest of the argument file content."""
+    sha1 = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def snapshot_filepath(lexicon_filepath):
+    """Return the path of the snapshot associated with the argument XML
+    lexicon file path.
+
+    By default, the snapshot is stored next to the XML lexicon, unless
+    the PYNLG_SNAPSHOT_DIR environment variable is set.
+
+    """
+    snapshot_dir = os.environ.get(SNAPSHOT_DIR_ENV) or dirname(lexicon_filepath)
+    return join(snapshot_dir, '%s.snapshot' % (basename(lexicon_filepath)))
+
+
+def dump_snapshot(chunk, filepath, source_checksum):
+    """Write the argument (records, id index, indexes) chunk (see
+    parallel.index_chunk) to a snapshot file, stamped with the snapshot
+    format version and the argument XML checksum.
+
+    The snapshot is first written to a temporary file, then moved to
+    its final location, so that concurrent readers never see a partially
+    written snapshot.
+
+    """
+    snapshot_dir = dirname(filepath)
+    if snapshot_dir and not exists(snapshot_dir):
+        os.makedirs(snapshot_dir)
+    tmp_filepath = '%s.%d.tmp' % (filepath, os.getpid())
+    with open(tmp_filepath, 'wb') as f:
+        pickle.dump((MAGIC, SNAPSHOT_VERSION, source_checksum), f,
+                    pickle.HIGHEST_PROTOCOL)
+        pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+    # only writable by its owner, whatever the umask (see is_trusted)
+    os.chmod(tmp_filepath, 0o644)
+    if sys.platform.startswith('win') and exists(filepath):
+        os.remove(filepath)
+    os.rename(tmp_filepath, filepath)
+
+
+def is_trusted(filepath):
+    """Return True if the argument file is owned by the current user (or
+    by root) and is neither writable by its group nor by the other users,
+    ie: if it can only have been written by a trusted user.
+
+    The owner is not checked on the platforms without user ids.
+
+    """
+    status = os.stat(filepath)
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    if hasattr(os, 'getuid'):
+        return status.st_uid in (os.getuid(), 0)
+    return True
+
+
+def load_snapshot(filepath, source_checksum):
+    """Return the (records, id index, indexes) chunk stored in the
+    argument snapshot file.
+
+    Return None if the snapshot does not exist, is not trusted (see
+    is_trusted), is unreadable, was compiled with another snapshot
+    format version, or was compiled from an XML lexicon which checksum
+    differs from the argument one.
+
+    """
+    try:
+        if not is_trusted(filepath):
+            # unpickling a file written by someone else would run their code
+            return None
+        with open(filepath, 'rb') as f:
+            header = pickle.load(f)
+            if header != (MAGIC, SNAPSHOT_VERSION, source_checksum):
+                return None
+            return pickle.load(f)
+    except Exception:
+        # A corrupted or incompatible snapshot is simply ignored,
+        # the XML lexicon will be parsed instead.
+        return None
+
+
+def compile_chunk(lexicon):
+    """Parse and index the XML lexicon associated with the argument
+    lexicon, and return its (records, id index, indexes) chunk.
+
+    The words are indexed by a new lexicon of the same class, so that
+    the argument lexicon is left untouched.
+
+    """
+    indexer = lexicon.__class__(auto_index=False)
+    words = []
+    for word in lexicon.iter_xml_words():
+        indexer.add_word(word)
+        words.append(word)
+    return index_chunk(indexer, words)
+
+
+def compile_snapshot(lexicon):
+    """Parse and index the XML lexicon associated with the argument
+    lexicon, and compile it into a binary snapshot.
+
+    Return the snapshot file path.
+
+    """
+    lexicon_filepath = lexicon.lexicon_filepath
+    filepath = snapshot_filepath(lexicon_filepath)
+    dump_snapshot(compile_chunk(lexicon), filepath, checksum(lexicon_filepath))
+    return filepath
+
+
+def main(languages):
+    from ..util import get_lexicon
+
+    for language in languages:
+        lexicon = get_lexicon(language)(auto_index=False)
+        print('%s: %s' % (language, compile_snapshot(lexicon)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
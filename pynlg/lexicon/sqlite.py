@@ -0,0 +1,321 @@
+# encoding: utf-8
+
+"""Definition of the SQLite lexicons.
+
+A SQLiteLexicon stores its words in a SQLite database file instead of
+in memory, which allows to use lexicons far bigger than the XML ones
+(eg: domain specific lexicons of several hundreds of thousands words),
+with a memory footprint independent from the lexicon size. Only the
+most recently looked up words are kept in memory.
+
+Example:
+>>> from pynlg.lexicon.sqlite import SQLiteLexicon
+>>> lex = SQLiteLexicon('/var/lib/pynlg/french.db', language='french')
+>>> lex.first('cheval', category=NOUN)
+<WordElement (realisation=cheval, category=NOUN)>
+
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import six
+import json
+import sqlite3
+
+from .lexicon import Lexicon
+from .feature.category import ANY
+from ..spec.word import WordElement
+from ..util import get_lexicon, LRUCache
+
+__all__ = ['SQLiteLexicon']
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS words (
+    id TEXT UNIQUE,
+    base_form TEXT,
+    category TEXT,
+    features TEXT
+);
+CREATE TABLE IF NOT EXISTS forms (
+    form TEXT NOT NULL,
+    reversed_form TEXT NOT NULL,
+    category TEXT,
+    is_base INTEGER NOT NULL,
+    feature_names TEXT,
+    word INTEGER NOT NULL REFERENCES words(rowid)
+);
+CREATE INDEX IF NOT EXISTS forms_form ON forms (form, is_base, category);
+CREATE INDEX IF NOT EXISTS forms_reversed_form ON forms (reversed_form);
+CREATE TABLE IF NOT EXISTS features (
+    name TEXT NOT NULL,
+    value,
+    word INTEGER NOT NULL REFERENCES words(rowid)
+);
+CREATE INDEX IF NOT EXISTS features_name_value ON features (name, value);
+'''
+
+#  Largest unicode character, used as an upper bound of the strings
+#  starting with a prefix
+MAX_CHAR = '\U0010ffff'
+
+#  Separator of the feature names stored in the forms table
+FEATURE_NAMES_SEP = ','
+
+#  Types of the feature values stored in the features table, allowing
+#  to select words by feature
+SCALAR_TYPES = (bool, int, float) + six.string_types
+
+#  Marker of a lookup missing from the cache
+_MISSING = object()
+
+
+class SQLiteLexicon(Lexicon):
+
+    """Lexicon storing its words and features in a SQLite database.
+
+    The database is created if it does not exist. When indexed, an empty
+    database is filled with the words of the XML lexicon of the
+    argument language. More words can then be added with create_word
+    or create_words.
+
+    The lookup results of the last ``cache_size`` looked up word features
+    are cached in memory.
+
+    The word features are stored as JSON, which is safe to load from a
+    database shared with other users or processes (contrary to pickle),
+    but limits the feature values to strings, numbers, booleans, None
+    and lists.
+
+    """
+
+    def __init__(self, filepath, language, auto_index=True, cache_size=4096):
+        """Create a new SQLite lexicon, stored in the argument database
+        file path (or ':memory:').
+
+        :param filepath: the path of the SQLite database file
+        :param language: the language of the lexicon words
+        :param auto_index: whether to fill an empty database with the
+                           XML lexicon words of the language
+                           (default: True)
+        :param cache_size: the maximum number of word features which
+                           lookups are cached (default: 4096)
+
+        """
+        self.filepath = filepath
+        self.language = language
+        # The inflected forms are the ones of the language lexicon
+        lexicon_class = get_lexicon(language)
+        self.INFLECTED_FORMS = lexicon_class.INFLECTED_FORMS
+        self.INFLECTED_FORM_FEATURES = lexicon_class.INFLECTED_FORM_FEATURES
+        self.cache = LRUCache(maxsize=cache_size)
+        self.connection = sqlite3.connect(filepath, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        super(SQLiteLexicon, self).__init__(auto_index=auto_index)
+
+    @property
+    def indexed(self):
+        return bool(self.query('SELECT 1 FROM words LIMIT 1'))
+
+    def query(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def make_indexes(self):
+        """Fill the database with the XML lexicon words, if empty."""
+        if not self.indexed:
+            self.create_words(self.iter_xml_words())
+
+    def reload(self):
+        """Drop the cached lookups and inflected forms, so that the words
+        written to the database by other connections (eg: by another
+        process) are read from it again.
+
+        The database is the lexicon source, which changes are not
+        tracked: contrary to Lexicon.reload, None is returned.
+
+        """
+        with self.lock:
+            self.cache.clear()
+        self.inflection_cache.clear()
+
+    def create_word(self, word):
+        self.create_words([word])
+
+    def create_words(self, words):
+        """Insert the argument words in the database, in a single
+        transaction.
+
+        Raise a ValueError if the id of one of the words is already used,
+        or if the features of one of the words can not be stored as JSON,
+        in which case none of the words is inserted.
+
+        """
+        with self.lock:
+            inserted = []
+            try:
+                with self.connection:
+                    for word in words:
+                        self.insert_word(word)
+                        inserted.append(word)
+            except sqlite3.IntegrityError as exc:
+                raise ValueError('Index already in database: %s' % (exc))
+            except TypeError as exc:
+                raise ValueError('Features can not be stored: %s' % (exc))
+            finally:
+                for word in inserted:
+                    self.uncache_word(word)
+
+    def uncache_word(self, word):
+        """Remove the cached lookups the argument word could be a result
+        of.
+
+        """
+        with self.lock:
+            self.cache.pop(word.base_form)
+            self.cache.pop(word.id)
+            for form in self.inflected_forms(word):
+                self.cache.pop(form)
+
+    def insert_word(self, word):
+        cursor = self.connection.execute(
+            'INSERT INTO words (id, base_form, category, features) '
+            'VALUES (?, ?, ?, ?)',
+            (word.id, word.base_form, word.category, json.dumps(word._features)))
+        rowid = cursor.lastrowid
+        forms = [
+            (form, form[::-1], word.category, 0,
+             FEATURE_NAMES_SEP.join(feature_names), rowid)
+            for form, feature_names in self.inflected_forms(word).items()
+            if form != word.base_form
+        ]
+        if word.base_form:
+            forms.append(
+                (word.base_form, word.base_form[::-1], word.category, 1, None, rowid))
+        self.connection.executemany(
+            'INSERT INTO forms (form, reversed_form, category, is_base, '
+            'feature_names, word) VALUES (?, ?, ?, ?, ?, ?)', forms)
+        self.connection.executemany(
+            'INSERT INTO features (name, value, word) VALUES (?, ?, ?)',
+            [(name, value, rowid) for name, value in word._features.items()
+             if isinstance(value, SCALAR_TYPES)])
+
+    def word_from_row(self, row):
+        id, base_form, category, features = row
+        word = WordElement(
+            base_form=base_form, category=category, id=id, lexicon=self,
+            realisation=base_form)
+        word.features = json.loads(features)
+        return word
+
+    def query_words(self, sql, parameters=()):
+        return [self.word_from_row(row) for row in self.query(
+            'SELECT words.id, words.base_form, words.category, words.features '
+            + sql, parameters)]
+
+    def query_forms(self, form, is_base, category):
+        sql = ('FROM forms JOIN words ON forms.word = words.rowid '
+               'WHERE forms.form = ? AND forms.is_base = ?')
+        parameters = (form, is_base)
+        if category != ANY:
+            sql += ' AND forms.category = ?'
+            parameters += (category, )
+        return self.query_words(sql + ' ORDER BY words.rowid', parameters)
+
+    def lookup(self, word_feature, category=ANY):
+        """Return the list of words associated to the argument word
+        feature, of the argument category, with the same semantics as
+        Lexicon.lookup.
+
+        """
+        # The cached lookups are grouped by word feature, so that they
+        # can all be invalidated when a word is created.
+        with self.lock:
+            lookups = self.cache.get(word_feature)
+            if lookups is None:
+                lookups = self.cache[word_feature] = {}
+            words = lookups.get(category, _MISSING)
+            if words is _MISSING:
+                words = lookups[category] = self.query_lookup(word_feature, category)
+            return words
+
+    def query_lookup(self, word_feature, category):
+        # Search by base form, then by variant
+        words = (self.query_forms(word_feature, 1, category)
+                 or self.query_forms(word_feature, 0, category))
+        if words:
+            return words
+        # Search by id
+        words = self.query_words('FROM words WHERE id = ?', (word_feature, ))
+        if words:
+            if category == ANY or words[0].category == category:
+                return words
+            return []
+        # The word feature is the base form of words of other categories
+        if self.query('SELECT 1 FROM forms WHERE form = ? AND is_base = 1 LIMIT 1',
+                      (word_feature, )):
+            return []
+
+    def lookup_inflection(self, form, category=ANY):
+        sql = ('SELECT words.id, words.base_form, words.category, words.features, '
+               'forms.feature_names '
+               'FROM forms JOIN words ON forms.word = words.rowid '
+               'WHERE forms.form = ? AND forms.is_base = 0')
+        parameters = (form, )
+        if category != ANY:
+            sql += ' AND forms.category = ?'
+            parameters += (category, )
+        inflections = []
+        for row in self.query(sql + ' ORDER BY words.rowid', parameters):
+            word = self.copy_word(self.word_from_row(row[:4]), form)
+            inflections.append((word, tuple(row[4].split(FEATURE_NAMES_SEP))))
+        return inflections
+
+    def search_forms(self, column, string, category, limit):
+        sql = ('FROM forms JOIN words ON forms.word = words.rowid '
+               'WHERE forms.{0} >= ? AND forms.{0} < ?'.format(column))
+        parameters = (string, string + MAX_CHAR)
+        if category != ANY:
+            sql += ' AND forms.category = ?'
+            parameters += (category, )
+        sql += ' ORDER BY forms.{0}, words.rowid'.format(column)
+        if limit is not None:
+            sql += ' LIMIT %d' % (limit)
+        rows = self.query(
+            'SELECT words.id, words.base_form, words.category, words.features, '
+            'forms.form ' + sql, parameters)
+        return [self.copy_word(self.word_from_row(row[:4]), row[4]) for row in rows]
+
+    def prefix_search(self, prefix, category=ANY, limit=None):
+        return self.search_forms('form', prefix, category, limit)
+
+    def suffix_search(self, suffix, category=ANY, limit=None):
+        return self.search_forms('reversed_form', suffix[::-1], category, limit)
+
+    def find_by_features(self, features, category=ANY):
+        """Return the first word found with features including the
+        argument features, and having the same category as the argument
+        one.
+
+        The candidate words are selected in the database from the
+        argument features having a scalar value, and checked against
+        the other ones.
+
+        """
+        conditions = [
+            (name, value) for name, value in features.items()
+            if isinstance(value, SCALAR_TYPES)]
+        sql = 'FROM words'
+        parameters = ()
+        if conditions:
+            sql += ' WHERE words.rowid IN (%s)' % (' INTERSECT '.join(
+                ['SELECT word FROM features WHERE name = ? AND value = ?']
+                * len(conditions)))
+            for condition in conditions:
+                parameters += condition
+        if category != ANY:
+            sql += (' AND' if conditions else ' WHERE') + ' words.category = ?'
+            parameters += (category, )
+        for word in self.query_words(sql + ' ORDER BY words.rowid', parameters):
+            if word.has_features(features):
+                return word
+
@@ -0,0 +1,312 @@
+# encoding: utf-8
+
+"""Definition of the reverse morphological analyser, mapping the
+inflected forms of a lexicon words back to their lemma and features.
+
+Every form the french morphology rules can produce for the lexicon words
+is generated once (the verb forms coming from their conjugation
+paradigms, see pynlg.morphology.paradigm). Each (form, analysis) pair is
+then encoded as a string: the form, a separator, the number of trailing
+characters of the form to replace to get the lemma, the index of the
+(category, features) tag of the analysis and the lemma ending. The
+strings are compiled into a minimal acyclic automaton (a DAWG), in which
+both the form prefixes and the analysis suffixes (eg: the '<cut 2>
+<feminine plural adjective>' of 'grandes', 'petites', etc) are shared.
+
+Example:
+>>> from pynlg.lexicon.fr import FrenchLexicon
+>>> analyser = MorphologyAnalyser.build(FrenchLexicon())
+>>> analyser.analyse('belles')
+[Analysis(lemma='beau', category='ADJECTIVE', features={'gender': 'feminine', \
+'number': 'plural'})]
+
+"""
+
+from __future__ import unicode_literals
+
+import six
+
+from array import array
+from copy import copy
+from collections import namedtuple
+
+from .paradigm import VerbParadigms, CELLS, WIDTH, cell_arguments
+from ..lexicon.feature import NUMBER, PERSON, TENSE, FORM
+from ..lexicon.feature.lexical import GENDER
+from ..lexicon.feature.category import NOUN, ADJECTIVE, DETERMINER, VERB
+from ..lexicon.feature.gender import MASCULINE, FEMININE
+from ..lexicon.feature.number import SINGULAR, PLURAL, BOTH
+from ..lexicon.feature.form import (
+    INFINITIVE, INDICATIVE, PRESENT_PARTICIPLE, PAST_PARTICIPLE)
+from ..spec.word import InflectedWordElement
+from ..util import get_shared_morphology_rules
+
+__all__ = ['Analysis', 'FormAutomaton', 'MorphologyAnalyser']
+
+Analysis = namedtuple('Analysis', ['lemma', 'category', 'features'])
+
+#  Separator between a form and its analysis, and terminator of the
+#  analysis, in the automaton strings. They can't be part of a form.
+SEPARATOR = '\x00'
+TERMINATOR = '\x01'
+
+#  Offset of the code points encoding the cut lengths and tag indexes
+CODE_OFFSET = 0x20
+
+
+class FormAutomaton(object):
+
+    """Minimal acyclic deterministic automaton recognising a set of
+    strings, supporting the enumeration of the suffixes of the strings
+    starting with a given prefix.
+
+    The strings must be prefix-free (no string is the prefix of another
+    one), eg: by ending them with a terminator character. The final
+    states are then the states without transitions.
+
+    The transitions of the state s are the characters of labels between
+    the positions starts[s] and starts[s + 1], leading to the states of
+    targets at the same positions. The initial state is 0.
+
+    Example:
+    >>> automaton = FormAutomaton(['chat.', 'chats.', 'rat.', 'rats.'])
+    >>> sorted(automaton.suffixes('cha'))
+    ['t.', 'ts.']
+
+    """
+
+    __slots__ = ('labels', 'starts', 'targets')
+
+    def __init__(self, strings):
+        """Build the minimal automaton of the argument strings, using the
+        incremental construction from sorted strings of Daciuk et al.
+
+        """
+        root = {}
+        # canonical states, by transitions
+        register = {}
+        # (parent, label, state) transitions of the last added string,
+        # whose states are not registered yet
+        unchecked = []
+
+        def minimise(depth):
+            while len(unchecked) > depth:
+                parent, label, state = unchecked.pop()
+                signature = tuple(sorted(
+                    (key, id(child)) for key, child in state.items()))
+                canonical = register.setdefault(signature, state)
+                if canonical is not state:
+                    parent[label] = canonical
+
+        previous = ''
+        for string in sorted(set(strings)):
+            common = 0
+            for left, right in zip(previous, string):
+                if left != right:
+                    break
+                common += 1
+            minimise(common)
+            state = unchecked[-1][2] if unchecked else root
+            for label in string[common:]:
+                child = {}
+                state[label] = child
+                unchecked.append((state, label, child))
+                state = child
+            previous = string
+        minimise(0)
+        self.freeze(root)
+
+    def freeze(self, root):
+        """Number the states reachable from the argument root state, and
+        store their transitions in the labels, starts and targets arrays.
+
+        """
+        numbers = {id(root): 0}
+        states = [root]
+        for state in states:
+            for label in sorted(state):
+                child = state[label]
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(states)
+                    states.append(child)
+        labels = []
+        starts = array('L', [0])
+        targets = array('L')
+        for state in states:
+            for label in sorted(state):
+                labels.append(label)
+                targets.append(numbers[id(state[label])])
+            starts.append(len(targets))
+        self.labels = ''.join(labels)
+        self.starts = starts
+        self.targets = targets
+
+    def __len__(self):
+        """Return the number of states of the automaton."""
+        return len(self.starts) - 1
+
+    def walk(self, string, state=0):
+        """Return the state reached from the argument state by reading
+        the argument string, or None if the automaton rejects it.
+
+        """
+        labels, starts, targets = self.labels, self.starts, self.targets
+        for label in string:
+            position = labels.find(label, starts[state], starts[state + 1])
+            if position < 0:
+                return None
+            state = targets[position]
+        return state
+
+    def suffixes(self, prefix):
+        """Yield the suffixes of the strings starting with the argument
+        prefix.
+
+        """
+        state = self.walk(prefix)
+        if state is None:
+            return
+        labels, starts, targets = self.labels, self.starts, self.targets
+        stack = [(state, '')]
+        while stack:
+            state, suffix = stack.pop()
+            start, end = starts[state], starts[state + 1]
+            if start == end:
+                yield suffix
+            for position in range(end - 1, start - 1, -1):
+                stack.append((targets[position], suffix + labels[position]))
+
+
+class MorphologyAnalyser(object):
+
+    """Analyser of the inflected forms of the words of a lexicon.
+
+    The analyser is a snapshot of the lexicon: it must be built again to
+    take any lexicon change into account.
+
+    """
+
+    __slots__ = ('automaton', 'tags')
+
+    def __init__(self, automaton, tags):
+        self.automaton = automaton
+        self.tags = tags
+
+    @classmethod
+    def build(cls, lexicon):
+        """Generate all the inflected forms of the argument lexicon words,
+        and compile their analyses.
+
+        Raise an UnhandledLanguage error if the lexicon is not french.
+
+        """
+        tags = {}
+        strings = []
+        for form, lemma, category, features in cls.iter_forms(lexicon):
+            if not form or SEPARATOR in form or TERMINATOR in form:
+                continue
+            tag = (category, tuple(sorted(features.items())))
+            tag_index = tags.setdefault(tag, len(tags))
+            common = 0
+            for left, right in zip(form, lemma):
+                if left != right:
+                    break
+                common += 1
+            strings.append(''.join((
+                form, SEPARATOR,
+                six.unichr(CODE_OFFSET + len(form) - common),
+                six.unichr(CODE_OFFSET + tag_index),
+                lemma[common:], TERMINATOR)))
+        ordered_tags = [None] * len(tags)
+        for tag, tag_index in tags.items():
+            ordered_tags[tag_index] = tag
+        return cls(FormAutomaton(strings), tuple(ordered_tags))
+
+    @staticmethod
+    def iter_forms(lexicon):
+        """Yield the (form, lemma, category, features) of all the forms
+        the morphology rules produce for the argument lexicon words.
+
+        Nouns are inflected in number, adjectives and determiners in
+        gender and number, and verbs in all the forms of their
+        conjugation paradigms (see pynlg.morphology.paradigm). The
+        other words only have their base form.
+
+        """
+        rules = get_shared_morphology_rules(lexicon.language)
+        paradigms = lexicon.verb_paradigms or VerbParadigms.build(lexicon)
+        inflections = {
+            NOUN: [{NUMBER: number} for number in (SINGULAR, PLURAL)],
+            ADJECTIVE: [
+                {GENDER: gender, NUMBER: number}
+                for gender in (MASCULINE, FEMININE) for number in (SINGULAR, PLURAL)],
+        }
+        inflections[DETERMINER] = inflections[ADJECTIVE]
+        morph = {
+            NOUN: rules.morph_noun,
+            ADJECTIVE: rules.morph_adjective,
+            DETERMINER: lambda element, word: rules.morph_determiner(element),
+        }
+        for category, entries in lexicon.category_index.items():
+            for entry in entries:
+                word = lexicon.materialise(entry)
+                lemma = word.base_form
+                if not lemma:
+                    continue
+                if category == VERB:
+                    yield lemma, lemma, VERB, {FORM: INFINITIVE}
+                    if word.id in paradigms:
+                        for analysis in iter_verb_forms(paradigms, word):
+                            yield analysis
+                elif category in inflections:
+                    # the copy is detached from any phrase the lexicon
+                    # word was added to
+                    word = copy(word)
+                    word.parent = None
+                    for features in inflections[category]:
+                        element = InflectedWordElement(word, features=features)
+                        try:
+                            form = morph[category](element, word).realisation
+                        except Exception:
+                            continue
+                        yield form, lemma, category, features
+                else:
+                    yield lemma, lemma, category, {}
+
+    def analyse(self, form):
+        """Return the list of the analyses of the argument form (empty if
+        the form is unknown).
+
+        """
+        analyses = []
+        tags = self.tags
+        stem = len(form)
+        for suffix in self.automaton.suffixes(form + SEPARATOR):
+            category, features = tags[ord(suffix[1]) - CODE_OFFSET]
+            lemma = form[:stem - (ord(suffix[0]) - CODE_OFFSET)] + suffix[2:-1]
+            analyses.append(Analysis(lemma, category, dict(features)))
+        return analyses
+
+
+def iter_verb_forms(paradigms, word):
+    """Yield the (form, lemma, category, features) of the forms of the
+    paradigm of the argument verb.
+
+    """
+    offsets, text = paradigms.offsets, paradigms.text
+    row = paradigms.rows[word.id] * WIDTH
+    for index, key in enumerate(CELLS):
+        form, tense, person, number, gender = cell_arguments(key)
+        if number == BOTH:
+            # same forms as the singular ones
+            continue
+        start, end = offsets[row + index], offsets[row + index + 1]
+        if end == start:
+            continue
+        if form in (PRESENT_PARTICIPLE, PAST_PARTICIPLE):
+            features = {FORM: form, GENDER: gender, NUMBER: number}
+        elif form == INDICATIVE:
+            features = {FORM: form, TENSE: tense, PERSON: person, NUMBER: number}
+        else:
+            features = {FORM: form, PERSON: person, NUMBER: number}
+        yield text[start:end], word.base_form, VERB, features
@@ -0,0 +1,336 @@
+# encoding: utf-8
+
+"""Definition of English morphology rules.
+
+The word lists of the wordlists.xml file (consonant doubling verbs,
+null plural nouns, modals, etc) are compiled into lookup tables the
+first time the rules are used. Inflecting a word then boils down to
+reading the irregular form of its lexicon entry and a couple of set
+probes, before falling back on the regular inflection rules.
+
+"""
+
+from __future__ import unicode_literals
+
+import re
+import threading
+
+from os.path import join, dirname, abspath
+from xml.etree import cElementTree as ElementTree
+
+from ..lexicon.feature import PARTICLE
+from ..lexicon.feature.lexical import (
+    PLURAL, PAST, PAST_PARTICIPLE, PRESENT_PARTICIPLE, PRESENT3S,
+    COMPARATIVE, SUPERLATIVE, DEFAULT_INFL)
+from ..lexicon.feature.person import FIRST, SECOND, THIRD
+from ..lexicon.feature.number import SINGULAR
+from ..lexicon.feature.tense import PRESENT, PAST as PAST_TENSE
+from ..lexicon.feature import form
+from ..spec.string import StringElement
+
+__all__ = ['EnglishMorphologyRules', 'EnglishMorphologyTables', 'load_wordlists']
+
+WORDLISTS_FILEPATH = abspath(join(
+    dirname(__file__), '..', 'lexicon', 'data', 'wordlists.xml'))
+
+#  Names of the wordlists.xml lists
+CONSONANT_DOUBLING = 'verb const doubling'
+MODALS = 'modals'
+NULL_PLURAL = 'null plural'
+
+#  Inflection variant of the greco-latin regular nouns (eg: focus -> foci)
+GRECO_LATIN_REGULAR = 'glreg'
+
+#  Inflection variants of the nouns that are never pluralised
+UNCOUNTABLE = frozenset(['uncount', 'nonCount', 'groupuncount', 'inv'])
+
+#  Plural of the determiners having one
+PLURAL_DETERMINERS = {
+    'a': 'some',
+    'an': 'some',
+    'this': 'these',
+    'that': 'those',
+}
+
+#  Regular plurals of the greco-latin nouns, by singular suffix
+GRECO_LATIN_PLURALS = (
+    ('us', 'i'), ('ma', 'mata'), ('a', 'ae'), ('um', 'a'), ('on', 'a'),
+    ('sis', 'ses'), ('is', 'ides'), ('men', 'mina'), ('ex', 'ices'), ('x', 'ces'),
+)
+
+SIBILANT_ENDING = re.compile(r'(s|x|z|ch|sh)$')
+CONSONANT_Y_ENDING = re.compile(r'[^aeiou]y$')
+CONSONANT_E_ENDING = re.compile(r'[^aeiouy]e$')
+
+
+def load_wordlists(filepath=WORDLISTS_FILEPATH):
+    """Return a dict mapping the name of each list of the argument
+    wordlists XML file to the frozenset of its values.
+
+    """
+    wordlists = {}
+    for list_node in ElementTree.parse(filepath).getroot().iter('list'):
+        wordlists[list_node.findtext('name').strip()] = frozenset(
+            item.findtext('value').strip() for item in list_node.iter('item'))
+    return wordlists
+
+
+class EnglishMorphologyTables(object):
+
+    """Lookup tables used by the english morphology rules, compiled
+    from the word lists.
+
+    """
+
+    __slots__ = ('wordlists', 'consonant_doubling', 'null_plural', 'modals')
+
+    def __init__(self, wordlists):
+        """Compile the tables from the argument word lists (see
+        load_wordlists).
+
+        """
+        self.wordlists = wordlists
+        self.consonant_doubling = wordlists.get(CONSONANT_DOUBLING, frozenset())
+        self.null_plural = wordlists.get(NULL_PLURAL, frozenset())
+        self.modals = wordlists.get(MODALS, frozenset())
+
+
+class EnglishMorphologyRules(object):
+
+    """Class in charge of performing english morphology rules for any
+    type of words: verbs, nouns, determiners, etc.
+
+    The lookup tables are shared by all the instances, and compiled the
+    first time they are needed. The irregular forms are read from the
+    lexicon entry of the inflected word.
+
+    """
+
+    _tables = None
+    _tables_lock = threading.Lock()
+
+    @property
+    def tables(self):
+        cls = self.__class__
+        if cls._tables is None:
+            with cls._tables_lock:
+                if cls._tables is None:
+                    cls._tables = EnglishMorphologyTables(load_wordlists())
+        return cls._tables
+
+    def inflection_key(self, element, base_word):
+        """The english inflected forms are looked up in the shared tables,
+        and are not cached in the lexicon inflection cache.
+
+        """
+        return None
+
+    @staticmethod
+    def get_base_form(element, base_word):
+        """Return the element base form, or the base word one if the
+        element has none.
+
+        """
+        if element.base_form:
+            return element.base_form
+        elif base_word:
+            return base_word.base_form
+
+    @staticmethod
+    def with_particle(realised, element):
+        """Append the particle of a phrasal verb (eg: 'give up')."""
+        particle = element._features.get(PARTICLE)
+        return '%s %s' % (realised, particle) if particle else realised
+
+    @staticmethod
+    def inflected_form(element, base_word, base_form, name):
+        """Return the inflected form defined by the element or its base
+        word, in that order, or None.
+
+        Without base word, the base word is the entry of the element
+        lexicon having the argument base form.
+
+        """
+        realised = element._features.get(name)
+        if realised:
+            return realised
+        if base_word is None:
+            lexicon = element.lexicon
+            if lexicon is None or not base_form:
+                return None
+            entries = lexicon.lookup(base_form, category=element.category)
+            if not entries:
+                return None
+            base_word = lexicon.materialise(entries[0])
+        return base_word._features.get(name)
+
+    def pluralize(self, base_form, greco_latin=False):
+        """Return the regular plural of the argument noun."""
+        if base_form in self.tables.null_plural:
+            return base_form
+        if greco_latin:
+            for singular, plural in GRECO_LATIN_PLURALS:
+                if base_form.endswith(singular):
+                    return base_form[:-len(singular)] + plural
+        if CONSONANT_Y_ENDING.search(base_form):
+            return base_form[:-1] + 'ies'
+        elif SIBILANT_ENDING.search(base_form):
+            return base_form + 'es'
+        return base_form + 's'
+
+    def double_consonant(self, base_form):
+        """Return the base form with its last consonant doubled if the
+        verb belongs to the consonant doubling list (eg: 'admit').
+
+        """
+        if base_form in self.tables.consonant_doubling:
+            return base_form + base_form[-1]
+        return base_form
+
+    @staticmethod
+    def build_present3s_verb(base_form):
+        if CONSONANT_Y_ENDING.search(base_form):
+            return base_form[:-1] + 'ies'
+        elif SIBILANT_ENDING.search(base_form):
+            return base_form + 'es'
+        return base_form + 's'
+
+    def build_past_verb(self, base_form):
+        if base_form.endswith('e'):
+            return base_form + 'd'
+        elif CONSONANT_Y_ENDING.search(base_form):
+            return base_form[:-1] + 'ied'
+        return self.double_consonant(base_form) + 'ed'
+
+    def build_present_participle_verb(self, base_form):
+        if base_form.endswith('ie'):
+            return base_form[:-2] + 'ying'
+        elif CONSONANT_E_ENDING.search(base_form) and base_form != 'be':
+            return base_form[:-1] + 'ing'
+        return self.double_consonant(base_form) + 'ing'
+
+    @staticmethod
+    def build_comparative(base_form):
+        if CONSONANT_Y_ENDING.search(base_form):
+            return base_form[:-1] + 'ier'
+        elif base_form.endswith('e'):
+            return base_form + 'r'
+        return base_form + 'er'
+
+    @staticmethod
+    def build_superlative(base_form):
+        if CONSONANT_Y_ENDING.search(base_form):
+            return base_form[:-1] + 'iest'
+        elif base_form.endswith('e'):
+            return base_form + 'st'
+        return base_form + 'est'
+
+    @staticmethod
+    def realise_be(person, number, tense):
+        """Return the present or past form of the verb 'be'."""
+        if tense == PAST_TENSE:
+            return 'was' if number == SINGULAR and person != SECOND else 'were'
+        if number == SINGULAR and person == FIRST:
+            return 'am'
+        elif number == SINGULAR and person == THIRD:
+            return 'is'
+        return 'are'
+
+    def morph_noun(self, element, base_word=None):
+        """Perform the morphology for nouns."""
+        base_form = self.get_base_form(element, base_word)
+        inflection = (
+            element._features.get(DEFAULT_INFL)
+            or (base_word and base_word._features.get(DEFAULT_INFL)))
+        if (
+                (element.parent and element.parent.is_plural or element.is_plural)
+                and not element.proper
+                and inflection not in UNCOUNTABLE
+        ):
+            realised = self.inflected_form(element, base_word, base_form, PLURAL)
+            if not realised:
+                realised = self.pluralize(
+                    base_form, greco_latin=inflection == GRECO_LATIN_REGULAR)
+        else:
+            realised = base_form
+        return StringElement(string=realised, word=element)
+
+    def morph_adjective(self, element, base_word=None):
+        """Perform the morphology for adjectives."""
+        base_form = self.get_base_form(element, base_word)
+        if element.is_superlative:
+            realised = (
+                self.inflected_form(element, base_word, base_form, SUPERLATIVE)
+                or self.build_superlative(base_form))
+        elif element.is_comparative:
+            realised = (
+                self.inflected_form(element, base_word, base_form, COMPARATIVE)
+                or self.build_comparative(base_form))
+        else:
+            realised = base_form
+        return StringElement(string=realised, word=element)
+
+    def morph_adverb(self, element, base_word=None):
+        """Perform the morphology for adverbs: only the comparatives and
+        superlatives provided by the lexicon are inflected (eg: 'well',
+        'better', 'best'), the other ones are treated by syntax.
+
+        """
+        base_form = self.get_base_form(element, base_word)
+        realised = None
+        if element.is_superlative:
+            realised = self.inflected_form(element, base_word, base_form, SUPERLATIVE)
+        elif element.is_comparative:
+            realised = self.inflected_form(element, base_word, base_form, COMPARATIVE)
+        return StringElement(string=realised or base_form, word=element)
+
+    def morph_determiner(self, element):
+        """Perform the morphology for determiners."""
+        parent = element.parent
+        realised = element.base_form
+        if (parent and parent.is_plural) or element.is_plural:
+            realised = PLURAL_DETERMINERS.get(realised, realised)
+        return StringElement(string=realised, word=element)
+
+    def morph_pronoun(self, element):
+        return StringElement(string=element.base_form, word=element)
+
+    def morph_verb(self, element, base_word):
+        """Apply morphology rules for verb words.
+
+        Return a StringElement which realisaton is the morphed verb.
+
+        """
+        number = element.number or SINGULAR
+        person = element.person or THIRD
+        tense = element.tense or PRESENT
+        verb_form = element.form or form.INDICATIVE
+        base_form = self.get_base_form(element, base_word)
+
+        if base_form in self.tables.modals or verb_form in (
+                form.BARE_INFINITIVE, form.INFINITIVE, form.IMPERATIVE):
+            realised = base_form
+        elif verb_form in (form.PRESENT_PARTICIPLE, form.GERUND):
+            realised = (
+                self.inflected_form(element, base_word, base_form, PRESENT_PARTICIPLE)
+                or self.build_present_participle_verb(base_form))
+        elif verb_form == form.PAST_PARTICIPLE:
+            realised = (
+                self.inflected_form(element, base_word, base_form, PAST_PARTICIPLE)
+                or self.inflected_form(element, base_word, base_form, PAST)
+                or self.build_past_verb(base_form))
+        elif base_form == 'be' and tense in (PRESENT, PAST_TENSE):
+            realised = self.realise_be(person, number, tense)
+        elif tense == PAST_TENSE:
+            realised = (
+                self.inflected_form(element, base_word, base_form, PAST)
+                or self.build_past_verb(base_form))
+        elif tense == PRESENT and number == SINGULAR and person == THIRD:
+            realised = (
+                self.inflected_form(element, base_word, base_form, PRESENT3S)
+                or self.build_present3s_verb(base_form))
+        else:
+            # The future and conditional are built by syntax (will, would)
+            realised = base_form
+
+        return StringElement(string=self.with_particle(realised, element), word=element)
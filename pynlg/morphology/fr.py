@@ -12,8 +12,11 @@ from ..lexicon.feature.discourse import (
     HEAD, FRONT_MODIFIER, PRE_MODIFIER, POST_MODIFIER,
     OBJECT, COMPLEMENT, SUBJECT, INDIRECT_OBJECT)
 from ..lexicon.feature.category import (
-    VERB_PHRASE, NOUN, VERB, PREPOSITIONAL_PHRASE, NOUN_PHRASE, PRONOUN, CLAUSE)
+    VERB_PHRASE, NOUN, VERB, ADJECTIVE, PREPOSITIONAL_PHRASE, NOUN_PHRASE, PRONOUN,
+    CLAUSE)
+from ..lexicon.feature import lexical
 from ..lexicon.feature.lexical import REFLEXIVE, GENDER
+from ..lexicon.feature.lexical import fr as lexical_fr
 from ..lexicon.feature.pronoun import PERSONAL, RELATIVE
 from ..lexicon.feature.lexical.fr import PRONOUN_TYPE, DETACHED
 from ..lexicon.feature.person import FIRST, SECOND, THIRD
@@ -30,6 +33,21 @@ from ..spec.string import StringElement
 
 Verb = namedtuple('Radical', ['radical', 'group'])
 
+#  Lexical features holding inflected forms, which the morphology rules
+#  read from the inflected element before its base word
+INFLECTION_FEATURES = (
+    lexical.PLURAL, lexical.COMPARATIVE,
+    lexical.PRESENT_PARTICIPLE, lexical.PAST_PARTICIPLE,
+    lexical_fr.FEMININE_SINGULAR, lexical_fr.FEMININE_PLURAL,
+    lexical_fr.FEMININE_PAST_PARTICIPLE,
+    lexical_fr.FUTURE_RADICAL, lexical_fr.IMPARFAIT_RADICAL,
+    lexical_fr.PRESENT1S, lexical_fr.PRESENT2S, lexical_fr.PRESENT3S,
+    lexical_fr.PRESENT1P, lexical_fr.PRESENT2P, lexical_fr.PRESENT3P,
+    lexical_fr.SUBJUNCTIVE1S, lexical_fr.SUBJUNCTIVE2S, lexical_fr.SUBJUNCTIVE3S,
+    lexical_fr.SUBJUNCTIVE1P, lexical_fr.SUBJUNCTIVE2P, lexical_fr.SUBJUNCTIVE3P,
+    lexical_fr.IMPERATIVE2S, lexical_fr.IMPERATIVE1P, lexical_fr.IMPERATIVE2P,
+)
+
 
 class FrenchMorphologyRules(object):
 
@@ -70,7 +88,7 @@ class FrenchMorphologyRules(object):
         ones, they can only complete them.
 
         """
-        features = old_element.features.copy()
+        features = old_element.copy_features()
         element = old_element.lexicon.first(
             new_element_base_form,
             category=old_element.category)
@@ -610,23 +628,11 @@ class FrenchMorphologyRules(object):
 
         return StringElement(string=inflected_form, word=element)
 
-    def morph_adjective(self, element, base_word=None):
-        """Performs the morphology for adjectives."""
-        base_form = self.get_base_form(element, base_word)
-        # Comparatives and superlatives are mainly treated by syntax
-        # in French. Only exceptions, provided by the lexicon, are
-        # treated by morphology.
-        if element.is_comparative:
-            realised = element.comparative
-            element = self.replace_element(
-                old_element=element, new_element_base_form=realised)
-            if base_word and not realised:
-                realised = base_word.comparative
-            if not realised:
-                realised = base_form
-        else:
-            realised = base_form
+    def get_adjective_parent(self, element):
+        """Return the element the argument adjective element agrees with
+        in gender and number.
 
+        """
         #  Get gender from parent or "grandparent" or self, in that order
         discourse_function = element.discourse_function
         parent = element.parent
@@ -654,6 +660,26 @@ class FrenchMorphologyRules(object):
                     break
                 if direct_object:
                     parent = direct_object
+        return parent
+
+    def morph_adjective(self, element, base_word=None):
+        """Performs the morphology for adjectives."""
+        base_form = self.get_base_form(element, base_word)
+        # Comparatives and superlatives are mainly treated by syntax
+        # in French. Only exceptions, provided by the lexicon, are
+        # treated by morphology.
+        if element.is_comparative:
+            realised = element.comparative
+            element = self.replace_element(
+                old_element=element, new_element_base_form=realised)
+            if base_word and not realised:
+                realised = base_word.comparative
+            if not realised:
+                realised = base_form
+        else:
+            realised = base_form
+
+        parent = self.get_adjective_parent(element)
 
         #  Feminine
         #  The rules used here apply to the most general cases.
@@ -682,6 +708,71 @@ class FrenchMorphologyRules(object):
 
         return StringElement(string=realised, word=element)
 
+    @staticmethod
+    def has_inflection_overrides(element, base_word):
+        """Return True if the argument element has its own base form, or
+        inflected forms (plural, present3p, etc) differing from the ones
+        of the argument base word.
+
+        """
+        if element.base_form != base_word.default_spelling_variant:
+            return True
+        features, base_features = element._features, base_word._features
+        for feature in INFLECTION_FEATURES:
+            if features.get(feature) != base_features.get(feature):
+                return True
+        return False
+
+    def inflection_key(self, element, base_word):
+        """Return the key of the inflected form of the argument noun,
+        adjective or verb element in the lexicon inflection cache, or None
+        if the form must not be cached.
+
+        The key is made of the id of the lexicon entry the element is
+        inflected from, which determines its lexical forms (plural,
+        present3p, etc), and of the element and context features the
+        form depends on. Words without id, elements overriding the forms
+        of their lexicon entry, comparatives and nouns taking the opposite
+        gender (which modify the element) are not cached.
+
+        """
+        if base_word is None or base_word.id is None or base_word.lexicon is None:
+            return None
+        if self.has_inflection_overrides(element, base_word):
+            return None
+        category = element.category
+        if category == NOUN:
+            if (
+                    base_word.opposite_gender
+                    and set([base_word.gender, element.gender]) == set(
+                        [MASCULINE, FEMININE])
+            ):
+                return None
+            plural = bool(
+                (element.parent and element.parent.is_plural or element.is_plural)
+                and not element.proper)
+            return (base_word.id, NOUN, element.base_form, plural, element.particle)
+        elif category == ADJECTIVE:
+            if element.is_comparative:
+                return None
+            parent = self.get_adjective_parent(element)
+            return (
+                base_word.id, ADJECTIVE, element.base_form,
+                parent.is_feminine or element.is_feminine,
+                parent.is_plural or element.is_plural,
+                element.particle)
+        elif category == VERB:
+            form = element.form
+            gender, number = element.gender, element.number
+            if form in (PRESENT_PARTICIPLE, PAST_PARTICIPLE):
+                parent, agreement = self.get_verb_parent(element)
+                if agreement:
+                    gender, number = parent.gender, parent.number
+            return (
+                base_word.id, VERB, element.base_form, form, element.tense,
+                element.person, gender, number, element.particle)
+        return None
+
     def morph_noun(self, element, base_word=None):
         # The gender of the inflected word is opposite to the base word
         if (
@@ -727,6 +818,27 @@ class FrenchMorphologyRules(object):
         if element.form in [PRESENT_PARTICIPLE, PAST_PARTICIPLE] and agreement:
             gender, number = parent.gender, parent.number
 
+        #  Read the form from the precomputed conjugation paradigms of the
+        #  lexicon verbs, if any (see pynlg.morphology.paradigm), unless
+        #  the element overrides the forms of its lexicon entry
+        realised = None
+        lexicon = base_word.lexicon if base_word else None
+        paradigms = lexicon.verb_paradigms if lexicon is not None else None
+        if paradigms is not None and not self.has_inflection_overrides(element, base_word):
+            realised = paradigms.get(
+                base_word.id, form, tense, person, number, gender)
+        if realised is None:
+            realised = self.realise_verb(
+                element, base_word, base_form, form, tense, person, number, gender)
+        realised = '%s%s' % (realised, element.particle)
+        return StringElement(string=realised, word=element)
+
+    def realise_verb(
+            self, element, base_word, base_form, form, tense, person, number, gender):
+        """Return the form of the argument verb element, at the argument
+        form, tense, person, number and gender (without its particle).
+
+        """
         # The verb morphology depends of its form (infititive, present participle, past
         # participle, etc). Each form has specific morphology rules.
         if form in (BARE_INFINITIVE, INFINITIVE):
@@ -756,9 +868,7 @@ class FrenchMorphologyRules(object):
             radical = self.get_imperfect_pres_part_radical(
                 element, base_word, base_form)
             realised = self.build_past_verb(radical, person, number)
-
-        realised = '%s%s' % (realised, element.particle)
-        return StringElement(string=realised, word=element)
+        return realised
 
     def morph_adverb(self, element, base_word):
         base_form = self.get_base_form(element, base_word)
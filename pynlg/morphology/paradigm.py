@@ -0,0 +1,177 @@
+# encoding: utf-8
+
+"""Definition of the precomputed conjugation paradigms of the lexicon verbs.
+
+Realising a verb combines the forms provided by the lexicon (present1s,
+future_radical, etc) with the conjugation rules, for each word. The
+paradigm of a verb, every form x tense x person x number (or gender x
+number, for the participles) form, can instead be generated once for all
+the verbs of a lexicon, and realising a verb becomes an indexed read.
+
+The forms are stored in a single string, along with an array of their
+offsets, which is much more compact than a dict per verb.
+
+Example:
+>>> from pynlg.lexicon.fr import FrenchLexicon
+>>> lex = FrenchLexicon()
+>>> paradigms = lex.build_verb_paradigms()
+>>> paradigms.get(lex.first('être').id, 'indicative', 'present', 'third', 'plural')
+'sont'
+
+"""
+
+from __future__ import unicode_literals
+
+import six
+
+from array import array
+
+from ..lexicon.feature.category import VERB
+from ..lexicon.feature.gender import MASCULINE, FEMININE
+from ..lexicon.feature.number import SINGULAR, PLURAL, BOTH
+from ..lexicon.feature.person import FIRST, SECOND, THIRD
+from ..lexicon.feature.tense import PRESENT, PAST, FUTURE, CONDITIONAL
+from ..lexicon.feature.form import (
+    BARE_INFINITIVE, INFINITIVE, INDICATIVE, SUBJUNCTIVE, IMPERATIVE,
+    GERUND, PRESENT_PARTICIPLE, PAST_PARTICIPLE)
+from ..exc import UnhandledLanguage
+from ..util import get_shared_morphology_rules
+
+__all__ = ['CELLS', 'cell_key', 'VerbParadigms']
+
+PERSONS = (FIRST, SECOND, THIRD)
+NUMBERS = (SINGULAR, PLURAL, BOTH)
+GENDERS = (MASCULINE, FEMININE)
+
+#  Keys of the forms of a paradigm (see cell_key), in storage order
+CELLS = (
+    [(tense, person, number)
+     for tense in (PRESENT, PAST, FUTURE, CONDITIONAL)
+     for person in PERSONS for number in NUMBERS]
+    + [(form, person, number)
+       for form in (SUBJUNCTIVE, IMPERATIVE)
+       for person in PERSONS for number in NUMBERS]
+    + [(form, gender, number)
+       for form in (PRESENT_PARTICIPLE, PAST_PARTICIPLE)
+       for gender in GENDERS for number in NUMBERS]
+)
+
+CELL_INDEX = dict((key, index) for index, key in enumerate(CELLS))
+
+#  Number of forms of a paradigm
+WIDTH = len(CELLS)
+
+
+def cell_key(form, tense, person, number, gender):
+    """Return the key of the paradigm form realising a verb at the
+    argument form, tense, person, number and gender, following the
+    branches of FrenchMorphologyRules.realise_verb, or None for the
+    infinitives, which are the verb base form.
+
+    """
+    if form in (BARE_INFINITIVE, INFINITIVE):
+        return None
+    elif form in (PRESENT_PARTICIPLE, GERUND):
+        return (PRESENT_PARTICIPLE, gender, number)
+    elif form == PAST_PARTICIPLE:
+        return (PAST_PARTICIPLE, gender, number)
+    elif form in (SUBJUNCTIVE, IMPERATIVE):
+        return (form, person, number)
+    return (tense, person, number)
+
+
+def cell_arguments(key):
+    """Return the (form, tense, person, number, gender) realising the
+    argument paradigm form key.
+
+    """
+    first, second, number = key
+    if first in (PRESENT_PARTICIPLE, PAST_PARTICIPLE):
+        return first, PRESENT, THIRD, number, second
+    elif first in (SUBJUNCTIVE, IMPERATIVE):
+        return first, PRESENT, second, number, MASCULINE
+    return INDICATIVE, first, second, number, MASCULINE
+
+
+class VerbParadigms(object):
+
+    """Conjugation paradigms of the verbs of a lexicon, by word id.
+
+    The forms of the verb of row r are the text slices between the
+    offsets r * WIDTH + i and r * WIDTH + i + 1, i being the
+    index of the form key in CELLS. A form which could not be generated
+    (or is not a string) is stored as an empty string, and is realised
+    by the morphology rules at request time.
+
+    """
+
+    def __init__(self, rows, text, offsets):
+        self.rows = rows
+        self.text = text
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, word_id):
+        return word_id in self.rows
+
+    @classmethod
+    def build(cls, lexicon):
+        """Generate the paradigms of all the verbs of the argument lexicon
+        having an id.
+
+        Raise an UnhandledLanguage error if the lexicon language
+        morphology rules do not realise verbs form by form.
+
+        """
+        rules = get_shared_morphology_rules(lexicon.language)
+        if not hasattr(rules, 'realise_verb'):
+            raise UnhandledLanguage(
+                'No verb paradigms for %s' % (lexicon.language))
+        arguments = [cell_arguments(key) for key in CELLS]
+        rows, forms, offsets = {}, [], array('L', [0])
+        end = 0
+        for word in lexicon.category_index.get(VERB, ()):
+            if word.id is None or word.id in rows:
+                continue
+            word = lexicon.materialise(lexicon.id_index[word.id])
+            rows[word.id] = len(rows)
+            for form, tense, person, number, gender in arguments:
+                try:
+                    realised = rules.realise_verb(
+                        word, word, word.base_form, form, tense, person, number, gender)
+                except Exception:
+                    # The rules do not handle some base forms: they keep
+                    # failing at request time, as without paradigms.
+                    realised = None
+                if not isinstance(realised, six.string_types):
+                    # not a form (eg: a boolean lexicon feature)
+                    realised = ''
+                forms.append(realised)
+                end += len(realised)
+                offsets.append(end)
+        return cls(rows, ''.join(forms), offsets)
+
+    def get(self, word_id, form, tense, person, number, gender=MASCULINE):
+        """Return the form of the verb having the argument id, at the
+        argument form, tense, person, number and gender, or None if it
+        is not part of the paradigms.
+
+        """
+        row = self.rows.get(word_id)
+        if row is None:
+            return None
+        index = CELL_INDEX.get(cell_key(form, tense, person, number, gender))
+        if index is None:
+            return None
+        position = row * WIDTH + index
+        start, end = self.offsets[position], self.offsets[position + 1]
+        return self.text[start:end] if end > start else None
+
+    def discard(self, word_id):
+        """Remove the paradigm of the verb having the argument id, which
+        is realised by the morphology rules from then on.
+
+        """
+        self.rows.pop(word_id, None)
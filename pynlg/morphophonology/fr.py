@@ -161,7 +161,7 @@ def undetach_pronoun(left_word, right_word):
             category=base_word.category, features=base_word.features)
         if new_base_word:
             inflected_new_base_word = InflectedWordElement(word=new_base_word)
-            left_word.features = inflected_new_base_word.features.copy()
+            left_word.features = inflected_new_base_word.copy_features()
             left_word.category = inflected_new_base_word.category
             left_word[ELIDED] = False
             left_word.realisation = new_base_word.base_form
@@ -4,52 +4,126 @@
 
 
 import six
-import os
-import importlib
-
-import platform
-from os.path import join, dirname, relpath
 
 from ..lexicon.feature import PARTICLE
+from ..lexicon.feature.constants import FEATURE_CONSTANTS
 from ..lexicon.feature.number import PLURAL
 from ..lexicon.feature.gender import FEMININE
 
-PY3 = int(platform.python_version_tuple()[0]) == 3
+PY3 = six.PY3
+
+#  Marker of a missing feature
+_MISSING = object()
+
+
+class FeatureDescriptor(object):
+
+    """Descriptor giving access to a feature of an element, as if it were
+    an element attribute.
+
+    The attribute name is the lower case name of a feature constant,
+    and the value is looked up in the element features, first using the
+    attribute name, then the feature constant value (eg:
+    element.inflections returns element.features['infl']), and is None
+    if both are missing.
+
+    A value assigned to the attribute does not modify the features: it
+    is stored in the element _attributes dict, and shadows the feature
+    until it is deleted.
+
+    """
+
+    __slots__ = ('name', 'feature_name')
+
+    def __init__(self, name, feature_name):
+        self.name = name
+        self.feature_name = feature_name
+
+    def __get__(self, element, cls=None):
+        if element is None:
+            return self
+        attributes = element._attributes
+        if attributes and self.name in attributes:
+            return attributes[self.name]
+        features = element._features
+        if self.name in features:
+            return features[self.name]
+        return features.get(self.feature_name)
+
+    def __set__(self, element, value):
+        attributes = element._attributes
+        if attributes is None:
+            element._attributes = attributes = {}
+        attributes[self.name] = value
+
+    def __delete__(self, element):
+        attributes = element._attributes
+        if not attributes or self.name not in attributes:
+            raise AttributeError(self.name)
+        del attributes[self.name]
 
 
 class FeatureModulesLoader(type):
 
-    """Metaclass injecting the feature module property onto a class."""
+    """Metaclass injecting the feature constants registry onto a class.
+
+    All the element classes share the same registry, collected once
+    from the feature modules (see lexicon.feature.constants). The root
+    element class also gets a FeatureDescriptor for each feature
+    constant not clashing with one of its attributes, so that reading
+    a feature does not go through __getattr__.
+
+    """
 
     def __new__(cls, clsname, bases, dct):
-        features = {}
-        feature_pkg_path = relpath(
-            join(dirname(__file__), '..', 'lexicon', 'feature'))
-        for dirpath, _, filenames in os.walk(feature_pkg_path):
-            pkg_root = dirpath[dirpath.rfind("pynlg"):].replace(os.sep, '.')
-            for filename in filenames:
-                if not filename.endswith('.py'):
-                    continue
-                pkg_path = pkg_root + '.' + filename.replace('.py', '')
-                mod = importlib.import_module(pkg_path)
-                mod_features = [c for c in dir(mod) if c.isupper()]
-                for feat in mod_features:
-                    features[feat] = getattr(mod, feat)
-
-        dct['_feature_constants'] = features
-
-        return super(FeatureModulesLoader, cls).__new__(
+        dct['_feature_constants'] = FEATURE_CONSTANTS
+        if not any(isinstance(base, FeatureModulesLoader) for base in bases):
+            slots = dct.get('__slots__', ())
+            for constant, feature_name in FEATURE_CONSTANTS.items():
+                name = constant.lower()
+                if name not in dct and name not in slots:
+                    dct[name] = FeatureDescriptor(name, feature_name)
+
+        newcls = super(FeatureModulesLoader, cls).__new__(
             cls, clsname, bases, dct)
 
+        # Collect the slot descriptors of the class and of its parents,
+        # used to copy an element without its instance __dict__.
+        slot_descriptors = []
+        for klass in reversed(newcls.__mro__):
+            for slot in klass.__dict__.get('__slots__', ()):
+                if slot != '__dict__':
+                    slot_descriptors.append(klass.__dict__[slot])
+        newcls._slot_descriptors = tuple(slot_descriptors)
+        return newcls
+
 
 @six.add_metaclass(FeatureModulesLoader)
 @six.python_2_unicode_compatible
 class NLGElement(object):
 
-    """Base spec element class from which all spec element classes inherit."""
+    """Base spec element class from which all spec element classes inherit.
+
+    Spec elements are allocated in large numbers during a realisation, so
+    their attributes are stored in slots. The attributes named after a
+    feature constant can still be set on an element (see
+    FeatureDescriptor): they are stored in the _attributes dict, only
+    allocated when the first of them is. Arbitrary attributes can be set
+    as well, but the instance __dict__ is only allocated when the first
+    of them is.
+
+    """
+
+    #  _shared_features: whether the element feature dict is shared with a
+    #  copy of the element, and must be copied before being modified.
+    #  _attributes: the values assigned to the feature attributes, or None
+    __slots__ = ('_features', '_shared_features', '_attributes', 'category',
+                 'realisation', 'lexicon', 'base_form', 'parent', 'children',
+                 '__dict__')
 
     def __init__(self, features=None, category=u'', realisation=u'',
                  lexicon=None):
+        self._attributes = None
         self.features = features if features else {}
         self.category = category
         self.realisation = realisation
@@ -58,9 +132,54 @@ class NLGElement(object):
         self.parent = None
         self.children = []
 
+    @property
+    def features(self):
+        """Return the element feature dict.
+
+        If the feature dict is shared with a copy of the element (see
+        __copy__), it is copied first (see copy_features), as the caller
+        might modify it.
+
+        """
+        if self._shared_features:
+            self._features = self.copy_features()
+            self._shared_features = False
+        return self._features
+
+    @features.setter
+    def features(self, features):
+        self._features = features
+        self._shared_features = False
+
+    def copy_features(self):
+        """Return a copy of the element feature dict, in which the list
+        values (eg: the inflection codes) are copied as well, so that they
+        can be modified without impacting the element.
+
+        Contrary to self.features.copy(), a shared feature dict will
+        only be copied once.
+
+        """
+        features = self._features.copy()
+        for feature_name, feature_value in features.items():
+            if isinstance(feature_value, list):
+                features[feature_name] = list(feature_value)
+        return features
+
+    def has_features(self, features):
+        """Return True if the element features include all the argument
+        feature names and values.
+
+        """
+        own_features = self._features
+        for feature_name, feature_value in features.items():
+            if own_features.get(feature_name, _MISSING) != feature_value:
+                return False
+        return True
+
     def __eq__(self, other):
         if isinstance(other, NLGElement):
-            return (self.features == other.features
+            return (self._features == other._features
                     and self.category == other.category)
         elif isinstance(other, (six.text_type, six.binary_type)):
             return self.realisation == other
@@ -69,13 +188,13 @@ class NLGElement(object):
                 str(type(other))))
 
     def __hash__(self):
-        feat = {k: v for k, v in self.features.items() if not isinstance(v, (list, tuple))}
+        feat = {k: v for k, v in self._features.items() if not isinstance(v, (list, tuple))}
         features = tuple(sorted(tuple(feat)))
         return hash((features, self.realisation, self.category, self.base_form))
 
     def __contains__(self, feature_name):
         """Check if the argument feature name is contained in the element."""
-        return feature_name in self.features
+        return feature_name in self._features
 
     def __setitem__(self, feature_name, feature_value):
         """Set the feature name/value in the element feature dict."""
@@ -88,7 +207,7 @@ class NLGElement(object):
         If the feature name is not found in the feature dict, return None.
 
         """
-        return self.features.get(feature_name)
+        return self._features.get(feature_name)
 
     def __delitem__(self, feature_name):
         """Remove the argument feature name and its associated value from
@@ -106,7 +225,7 @@ class NLGElement(object):
             self.__class__.__name__,
             self.realisation,
             self.category,
-            self.features)
+            self._features)
 
     def __repr__(self):
         _repr = u"<{} (realisation={}, category={})>".format(
@@ -122,6 +241,10 @@ class NLGElement(object):
         """When a undefined attribute name is accessed, try to return
         self.features[name] if it exists.
 
+        Note: the lower case feature constant names are handled by
+        FeatureDescriptor, this method is only called for the other
+        names.
+
         If name is not in self.features, but name.upper() is defined as
         a feature constant, don't raise an AttribueError. Instead, try
         to return the feature value associated with the feature constant
@@ -143,17 +266,45 @@ class NLGElement(object):
                 # constant, and elt.features['infl'] = ['lala']
 
         """
+        if name == '_features':
+            # the element is not initialized yet
+            raise AttributeError(name)
         n = name.upper()
-        if name in self.features:
-            return self.features[name]
+        features = self._features
+        if name in features:
+            return features[name]
         elif n in self._feature_constants:
             new_name = self._feature_constants[n]
-            return self.features.get(new_name)
+            return features.get(new_name)
         raise AttributeError(name)
 
+    def __copy__(self):
+        """Return a lightweight copy of the element, sharing the element
+        feature dict until either of them modifies it (copy-on-write).
+
+        The copy has no parent nor children. As in a deep copy (see
+        __deepcopy__), the arbitrary attributes of the element are not
+        copied, and its instance __dict__ is never allocated.
+
+        """
+        cls = self.__class__
+        copyobj = cls.__new__(cls)
+        for slot in cls._slot_descriptors:
+            try:
+                slot.__set__(copyobj, slot.__get__(self, cls))
+            except AttributeError:
+                # unset slot
+                pass
+        if self._attributes:
+            copyobj._attributes = dict(self._attributes)
+        copyobj.parent = None
+        copyobj.children = []
+        copyobj._shared_features = self._shared_features = True
+        return copyobj
+
     def __deepcopy__(self, memodict={}):
         copyobj = self.__class__()
-        copyobj.features = self.features.copy()
+        copyobj.features = self.copy_features()
         copyobj.category = self.category
         copyobj.realisation = self.realisation
         copyobj.lexicon = self.lexicon
@@ -163,7 +314,7 @@ class NLGElement(object):
     @property
     def feature_names(self):
         """Return all feature names, the keys in the element feature dict."""
-        return list(self.features.keys())
+        return list(self._features.keys())
 
     @property
     def language(self):
@@ -181,5 +332,5 @@ class NLGElement(object):
 
     @property
     def particle(self):
-        return ('-' + self.features[PARTICLE] if self.features.get(PARTICLE)
+        return ('-' + self._features[PARTICLE] if self._features.get(PARTICLE)
                 else '')
@@ -24,6 +24,8 @@ class ListElement(NLGElement):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, element=None):
         """The ListElement inherits factory, category and all features
         from the phrase.
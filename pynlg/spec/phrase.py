@@ -14,7 +14,7 @@ import six
 from .base import NLGElement
 from .string import StringElement
 from .word import WordElement
-from ..util import get_phrase_helper
+from ..util import get_shared_phrase_helper
 from ..lexicon.feature import ELIDED, NUMBER
 from ..lexicon.feature import category as cat
 from ..lexicon.feature import internal
@@ -27,12 +27,18 @@ __all__ = ['PhraseElement', 'AdjectivePhraseElement', 'NounPhraseElement']
 
 class PhraseElement(NLGElement):
 
+    __slots__ = ('helper', )
+
+    #  Phrase type of the helper realising the phrase (see
+    #  pynlg.util.phrase_helper_router).
+    helper_type = 'phrase'
+
     def __init__(self, lexicon, category):
         """Create a phrase of the given type."""
         super(PhraseElement, self).__init__(category=category, lexicon=lexicon)
         self.features[ELIDED] = False
-        self.helper = get_phrase_helper(language=self.lexicon.language,
-                                        phrase_type='phrase')()
+        self.helper = get_shared_phrase_helper(
+            language=self.lexicon.language, phrase_type=self.helper_type)
 
     @property
     def head(self):
@@ -157,6 +163,8 @@ class AdjectivePhraseElement(PhraseElement):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, lexicon):
         super(AdjectivePhraseElement, self).__init__(
             category=cat.ADJECTIVE_PHRASE, lexicon=lexicon)
@@ -189,13 +197,14 @@ class NounPhraseElement(PhraseElement):
 
     """
 
+    __slots__ = ()
+
+    helper_type = cat.NOUN_PHRASE
+
     def __init__(self, lexicon, phrase=None):
         super(NounPhraseElement, self).__init__(
             category=cat.NOUN_PHRASE,
             lexicon=lexicon)
-        self.helper = get_phrase_helper(
-            language=self.lexicon.language,
-            phrase_type=cat.NOUN_PHRASE)()
         if phrase:
             self.features.update(phrase.features)
             self.parent = phrase.parent
@@ -8,8 +8,9 @@ strings, with unknown category and features.
 from .base import NLGElement
 from ..lexicon.feature import ELIDED
 from ..lexicon.feature.category import CANNED_TEXT
+from ..lexicon import registry
 from ..lexicon.lang import DEFAULT as DEFAULT_LANG
-from ..util import get_lexicon, get_morphophonology_rules
+from ..util import get_morphophonology_rules
 
 
 class StringElement(NLGElement):
@@ -20,19 +21,26 @@ class StringElement(NLGElement):
     simple string. In the latter case, the StringElement category is
     set to 'CANNED_TEXT', a special category used for arbitrary text.
 
+    The StringElement lexicon is the shared lexicon of its language,
+    fetched from the lexicon registry the first time it is accessed.
+
     """
 
+    __slots__ = ('_language', '_lexicon')
+
     def __init__(self, string=None, word=None, language=DEFAULT_LANG):
+        self._attributes = None
         self.features = {}
         self.features[ELIDED] = False
-        self.lexicon = get_lexicon(language)
+        self._language = language
+        self._lexicon = None
         self.children = []
         self.parent = None
         if not word:
             self.category = CANNED_TEXT
             self.realisation = string
         else:
-            self.features.update(word.features.copy())
+            self.features.update(word.copy_features())
             self.category = word.category
             self.realisation = string if string else word.realisation
 
@@ -42,6 +50,23 @@ class StringElement(NLGElement):
             self.realisation,
             self.category if self.category else u'no category')
 
+    @property
+    def lexicon(self):
+        if self._lexicon is None:
+            self._lexicon = registry.get(self._language)
+        return self._lexicon
+
+    @lexicon.setter
+    def lexicon(self, value):
+        self._lexicon = value
+
+    @property
+    def language(self):
+        """Return the language of the element, without loading its lexicon."""
+        if self._lexicon is not None:
+            return self._lexicon.language
+        return self._language
+
     def __eq__(self, other):
         return (
             isinstance(other, StringElement)
@@ -11,13 +11,15 @@ from ..lexicon.feature.lexical import (DEFAULT_INFL, DEFAULT_SPELL, INFLECTIONS,
 from ..lexicon.feature.internal import DISCOURSE_FUNCTION
 from ..lexicon.feature.category import (ANY, NOUN, ADJECTIVE, DETERMINER, VERB,
                                         ADVERB, PRONOUN)
-from ..util import get_morphology_rules
+from ..util import get_shared_morphology_rules
 
 
 class WordElement(NLGElement):
 
     """Element defining rules and behaviour for a word."""
 
+    __slots__ = ('id', )
+
     def __init__(self, base_form=u'', category=u'', id=u'', lexicon=u'',
                  realisation=u''):
         """Create a WordElement with the specified baseForm, category,
@@ -39,13 +41,34 @@ class WordElement(NLGElement):
             return (
                 self.base_form == other.base_form
                 and self.id == other.id
-                and self.features == other.features
+                and self._features == other._features
             )
         return False
 
     def __hash__(self):
         return super(WordElement, self).__hash__()
 
+    def __copy__(self):
+        """Return a lightweight copy of the word (see NLGElement.__copy__).
+
+        Lexicon words are copied each time they are looked up, so the
+        slots are copied explicitly rather than through the generic
+        slot descriptor loop.
+
+        """
+        copyobj = self.__class__.__new__(self.__class__)
+        copyobj._features = self._features
+        copyobj.category = self.category
+        copyobj.realisation = self.realisation
+        copyobj.lexicon = self.lexicon
+        copyobj.base_form = self.base_form
+        copyobj.id = self.id
+        copyobj.parent = None
+        copyobj.children = []
+        copyobj._attributes = dict(self._attributes) if self._attributes else None
+        copyobj._shared_features = self._shared_features = True
+        return copyobj
+
     def __unicode__(self):
         return "<%s [%s:%s]>" % (
             self.__class__.__name__,
@@ -54,7 +77,7 @@ class WordElement(NLGElement):
 
     @property
     def default_inflection_variant(self):
-        return self.features[DEFAULT_INFL]
+        return self._features[DEFAULT_INFL]
 
     @default_inflection_variant.setter
     def default_inflection_variant(self, variant):
@@ -80,7 +103,7 @@ class WordElement(NLGElement):
 
     @property
     def default_spelling_variant(self):
-        default_spelling = self.features.get(DEFAULT_SPELL)
+        default_spelling = self._features.get(DEFAULT_SPELL)
         return self.base_form if default_spelling is None else default_spelling
 
     @default_spelling_variant.setter
@@ -114,6 +137,8 @@ class InflectedWordElement(NLGElement):
 
     """
 
+    __slots__ = ('base_word', )
+
     def __init__(self, word, category=None, features=None):
         """Constructs a new inflected word using the argument word as
         the base form.
@@ -126,10 +151,11 @@ class InflectedWordElement(NLGElement):
         :param features: an optional feature dict
 
         """
+        self._attributes = None
         self.base_word = word
         self.base_form = word.default_spelling_variant
         self.realisation = self.base_form
-        self.features = word.features.copy()
+        self.features = word.copy_features()
         if features:
             self.features.update(features)
         if not category:
@@ -168,6 +194,10 @@ class InflectedWordElement(NLGElement):
         """Apply morphology rules to update the word realisation
         according to its features.
 
+        The realised forms are cached in the inflection cache of the
+        lexicon, by lexicon entry and inflection features (see the
+        inflection_key method of the morphology rules).
+
         """
         if self.non_morph:
             realised_element = StringElement(string=self.base_form, word=self)
@@ -178,7 +208,13 @@ class InflectedWordElement(NLGElement):
                 base_word = self.base_word
             else:
                 base_word = self.lexicon.first(self.base_form)
-            rules = get_morphology_rules(self.language)()
+            rules = get_shared_morphology_rules(self.language)
+            key = rules.inflection_key(self, base_word)
+            if key is not None:
+                cache = base_word.lexicon.inflection_cache
+                realisation = cache.get(key)
+                if realisation is not None:
+                    return StringElement(string=realisation, word=self)
             if self.category == NOUN:
                 realised_element = rules.morph_noun(self, base_word)
             elif self.category == ADJECTIVE:
@@ -191,4 +227,6 @@ class InflectedWordElement(NLGElement):
                 realised_element = rules.morph_adverb(self, base_word)
             elif self.category == PRONOUN:
                 realised_element = rules.morph_adverb(self)
+            if key is not None:
+                cache[key] = realised_element.realisation
         return realised_element
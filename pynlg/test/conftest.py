@@ -10,16 +10,31 @@ from ..lexicon.en import EnglishLexicon
 
 @pytest.fixture(scope='session')
 def lexicon_fr():
-    """An indexed french lexicon"""
+    """An indexed french lexicon, distinct from the one of the lexicon
+    registry, as the tests add words to it.
+
+    """
     return FrenchLexicon()
 
 
 @pytest.fixture(scope='session')
 def lexicon_en():
-    """An indexed english lexicon"""
+    """An indexed english lexicon, distinct from the one of the lexicon
+    registry.
+
+    """
     return EnglishLexicon()
 
 
+@pytest.fixture(scope='session')
+def xml_lexicon_fr():
+    """A french lexicon indexed from the XML lexicon, that is not
+    modified by the tests (contrary to lexicon_fr).
+
+    """
+    return FrenchLexicon()
+
+
 @pytest.fixture
 def empty_lexicon_fr():
     """An unindexed french lexicon"""
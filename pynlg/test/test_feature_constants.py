@@ -0,0 +1,44 @@
+# encoding: utf-8
+
+"""Test suite of the feature constants registry."""
+
+from __future__ import unicode_literals
+
+import os
+
+from os.path import join, dirname, relpath
+
+from ..lexicon.feature.constants import (
+    FEATURE_MODULES, FEATURE_CONSTANTS, collect_feature_constants)
+from ..lexicon.feature import category, lexical
+from ..spec.base import NLGElement
+from ..spec.word import WordElement
+from ..spec.phrase import NounPhraseElement
+
+
+def test_feature_modules_complete():
+    feature_dir = join(dirname(__file__), '..', 'lexicon', 'feature')
+    modules = set()
+    for dirpath, _, filenames in os.walk(feature_dir):
+        subpackage = relpath(dirpath, feature_dir)
+        package = 'pynlg.lexicon.feature'
+        if subpackage != os.curdir:
+            package += '.' + subpackage.replace(os.sep, '.')
+        for filename in filenames:
+            if filename.endswith('.py') and filename != 'constants.py':
+                module = filename[:-3]
+                modules.add(package if module == '__init__' else package + '.' + module)
+    assert modules == set(FEATURE_MODULES)
+
+
+def test_feature_constants():
+    assert FEATURE_CONSTANTS == collect_feature_constants()
+    assert FEATURE_CONSTANTS['PLURAL'] == 'plural'
+    # the last module defining a constant wins
+    assert FEATURE_CONSTANTS['PAST_PARTICIPLE'] == lexical.PAST_PARTICIPLE
+    assert FEATURE_CONSTANTS['MODAL'] == category.MODAL
+
+
+def test_shared_registry():
+    for cls in (NLGElement, WordElement, NounPhraseElement):
+        assert cls._feature_constants is FEATURE_CONSTANTS
@@ -0,0 +1,43 @@
+# encoding: utf-8
+
+"""Test suite of the lazy loading of the pynlg modules."""
+
+from __future__ import unicode_literals
+
+import sys
+import subprocess
+
+import pytest
+
+import pynlg
+
+
+def imported_modules(statement):
+    """Return the modules imported after running the argument statement
+    in a fresh interpreter.
+
+    """
+    output = subprocess.check_output([
+        sys.executable, '-c', '%s; import sys; print(" ".join(sys.modules))' % (statement)])
+    return set(output.decode('utf-8').split())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires module __getattr__')
+def test_lazy_import():
+    modules = imported_modules('import pynlg')
+    assert 'pynlg.spec.phrase' not in modules
+    modules = imported_modules('import pynlg.lexicon.feature.category')
+    assert 'pynlg.spec.base' not in modules
+
+
+def test_lazy_lexicon_modules():
+    modules = imported_modules('import pynlg.lexicon.fr')
+    assert 'pynlg.lexicon.snapshot' not in modules
+    assert 'multiprocessing' not in modules
+
+
+def test_lazy_attribute():
+    from ..spec.phrase import NounPhraseElement
+    assert pynlg.NounPhraseElement is NounPhraseElement
+    with pytest.raises(AttributeError):
+        pynlg.Plop
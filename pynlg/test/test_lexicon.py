@@ -4,6 +4,8 @@
 
 from __future__ import unicode_literals
 
+import threading
+
 import pytest
 
 from xml.etree import cElementTree as ET
@@ -13,13 +15,15 @@ from ..lexicon.en import EnglishLexicon
 from ..lexicon.feature.internal import DISCOURSE_FUNCTION
 from ..lexicon.feature.discourse import SUBJECT
 from ..lexicon.feature.lexical.fr import VOWEL_ELISION
-from ..lexicon.feature.number import SINGULAR
+from ..lexicon.feature.number import SINGULAR, PLURAL
 from ..lexicon.feature.person import FIRST
+from ..lexicon.feature.form import SUBJUNCTIVE
 from ..lexicon.feature import PERSON, NUMBER
 from ..lexicon.feature.category import (NOUN, VERB, ANY, DETERMINER, ADJECTIVE, ADVERB,
                                         PRONOUN)
 from ..lexicon.feature.lexical import (COMPARATIVE, SUPERLATIVE, PREDICATIVE,
                                        QUALITATIVE)
+from ..lexicon.lexicon import LazyWordEntry, LexiconIndexes
 from ..spec.word import WordElement
 
 
@@ -202,6 +206,110 @@ def test_independant_words(lexicon_fr):
     assert le2.realisation == 'le'
 
 
+def test_copy_on_write_words(lexicon_fr):
+    le1 = lexicon_fr.first('le', category=DETERMINER)
+    le2 = lexicon_fr.first('le', category=DETERMINER)
+    le1['plural'] = 'plop'
+    le1.features['feminine_singular'] = 'plip'
+    assert le1.plural == 'plop'
+    assert le1.feminine_singular == 'plip'
+    assert le2.plural == 'les'
+    assert le2.feminine_singular == 'la'
+    assert lexicon_fr.first('le', category=DETERMINER).plural == 'les'
+
+
+def test_copy_on_write_list_features(lexicon_fr):
+    cheval = lexicon_fr.first('cheval', category=NOUN)
+    cheval.features['infl'].append('x')
+    cheval.inflection_variants.append('y')
+    cheval.inflex()['infl'].append('z')
+    assert cheval.inflection_variants == ['reg', 'x', 'y']
+    assert lexicon_fr.first('cheval', category=NOUN).inflection_variants == ['reg']
+
+
+def test_category_indexes(xml_lexicon_fr):
+    lex = xml_lexicon_fr
+    assert [w.id for w in lex.category_base_index[(NOUN, 'son')]] == [
+        w.id for w in lex.get('son', category=NOUN)]
+    assert lex.category_variant_index[(VERB, 'sont')] == lex.lookup('sont')
+    assert lex.first('un', category=DETERMINER).base_form == 'un'
+    assert lex.first('sont', category=VERB).base_form == 'être'
+    assert lex.lookup('son', category=VERB) == []
+    assert lex.lookup('E0012152', category=NOUN) == []
+
+
+
+def index_ids(index):
+    return dict(
+        (key, [getattr(entry, 'id', entry) for entry in entries])
+        for key, entries in index.items())
+
+
+def test_lazy_indexes(xml_lexicon_fr):
+    lex = FrenchLexicon()
+    assert all(getattr(lex.indexes, attr) is None for attr in LexiconIndexes.LAZY_INDEXES)
+    assert lex.first('sont', category=VERB).base_form == 'être'
+    assert lex.indexes.category_variant_index is not None
+    assert lex.indexes.feature_index is None
+    # the built indexes are updated, the other ones include the word once built
+    word = WordElement('Olympia', NOUN, 'olympia_1', lexicon=lex)
+    word.features['plural'] = 'Olympias'
+    lex.create_word(word)
+    assert lex.category_variant_index[(NOUN, 'Olympias')] == [word]
+    assert lex.category_base_index[(NOUN, 'Olympia')] == [word]
+    assert lex.feature_index[('plural', 'Olympias')] == [word]
+    lex.unindex_word(word)
+    assert (NOUN, 'Olympias') not in lex.category_variant_index
+    assert ('plural', 'Olympias') not in lex.feature_index
+
+
+def test_lazy_indexes_order(xml_lexicon_fr):
+    # indexes built along with the words list them in the same order
+    # as the ones built on first access
+    lex = FrenchLexicon(auto_index=False)
+    for attr in LexiconIndexes.LAZY_INDEXES:
+        lex.lazy_index(attr)
+    for word in lex.iter_xml_words():
+        lex.add_word(word)
+    for attr in ('category_base_index', 'category_variant_index'):
+        assert index_ids(getattr(lex, attr)) == index_ids(getattr(xml_lexicon_fr, attr))
+    assert [
+        (w.id, names) for w, names in lex.inflection_index['sommes']
+    ] == [(w.id, names) for w, names in xml_lexicon_fr.inflection_index['sommes']]
+    assert set(lex.feature_index) == set(xml_lexicon_fr.feature_index)
+
+
+def test_get_many(xml_lexicon_fr):
+    lex = xml_lexicon_fr
+    results = lex.get_many([('son', NOUN), 'son', ('GRUB', NOUN), ('son', NOUN)])
+    assert [w.category for w in results[0]] == [NOUN]
+    assert [w.category for w in results[1]] == [DETERMINER, NOUN]
+    assert results[2] is None
+    # repeated queries share the same result
+    assert results[3] is results[0]
+    assert 'GRUB' not in lex.base_index
+
+
+def test_first_many(lexicon_fr):
+    results = lexicon_fr.first_many(
+        [('son', NOUN), ('son', VERB), 'chevaux', 'GRUBMANY'])
+    assert results[0].category == NOUN
+    assert results[1] is None
+    assert results[2].base_form == 'cheval'
+    assert results[3] is None
+    created = lexicon_fr.first_many(['GRUBMANY'], create_if_missing=True)[0]
+    assert created.base_form == 'GRUBMANY'
+
+
+def test_first_copies_first_match_only(lexicon_fr, monkeypatch):
+    copied = []
+    monkeypatch.setattr(
+        WordElement, '__copy__',
+        lambda self: copied.append(self) or self, raising=False)
+    assert lexicon_fr.first('son').category == DETERMINER
+    assert len(copied) == 1
+
+
 @pytest.mark.parametrize('d1, d2, expected', [
     ({}, {}, True),
     ({'k1': 'v1', 'k2': 'v2'}, {'k1': 'v1', 'k2': 'v2'}, True),
@@ -222,3 +330,235 @@ def test_find_by_features(lexicon_fr):
     }
     word = lexicon_fr.find_by_features(features, category=PRONOUN)
     assert word.base_form == 'je'
+    # the returned word is a copy
+    assert all(w is not word for w in lexicon_fr.lookup('je', category=PRONOUN))
+    word.base_word = lexicon_fr.first('tu', category=PRONOUN)
+    word['person'] = 'second'
+    assert lexicon_fr.find_by_features(features, category=PRONOUN).person == FIRST
+
+
+def test_feature_index(empty_lexicon_fr, word_node):
+    lex = empty_lexicon_fr
+    word_elt = lex.word_from_node(word_node)
+    lex.index_word(word_elt)
+    assert lex.feature_index[('present3p', 'sont')] == [word_elt]
+    assert lex.feature_index[('copular', True)] == [word_elt]
+    # unhashable feature values are not indexed
+    assert 'infl' not in [name for name, _ in lex.feature_index]
+
+
+@pytest.mark.parametrize('category', [PRONOUN, ANY])
+def test_find_by_features_without_scan(lexicon_fr, monkeypatch, category):
+    features = {
+        PERSON: FIRST,
+        NUMBER: SINGULAR,
+        VOWEL_ELISION: True,
+        DISCOURSE_FUNCTION: SUBJECT
+    }
+    monkeypatch.setattr(lexicon_fr, 'is_dict_subset', None)
+    word = lexicon_fr.find_by_features(features, category=category)
+    assert word.base_form == 'je'
+    assert lexicon_fr.find_by_features(features, category=NOUN) is None
+
+
+def test_iter_xml_words(empty_lexicon_fr):
+    word_nodes = empty_lexicon_fr.parse_xml_lexicon().getroot().findall('word')
+    words = list(empty_lexicon_fr.iter_xml_words())
+    assert len(words) == len(word_nodes)
+    assert [w.id for w in words] == [n.findtext('id') for n in word_nodes]
+    # the parsed XML tree is not kept around once the words are built
+    assert not hasattr(empty_lexicon_fr, 'tree')
+
+
+def test_inflection_index(xml_lexicon_fr):
+    lex = xml_lexicon_fr
+    words = lex.get('sont', create_if_missing=False)
+    assert [(w.base_form, w.category) for w in words] == [('être', VERB)]
+    assert words[0].realisation == 'sont'
+    chevaux = lex.first('chevaux')
+    assert chevaux.base_form == 'cheval'
+    assert chevaux.number == PLURAL
+    assert lex.first('sois').form == SUBJUNCTIVE
+    assert [(w.base_form, features) for w, features in lex.lookup_inflection('sois')] == [
+        ('être', ('imperative2s', 'subjunctive1s', 'subjunctive2s'))]
+    assert lex.lookup_inflection('sois', category=NOUN) == []
+
+
+def test_inflection_index_category(xml_lexicon_fr):
+    lex = xml_lexicon_fr
+    assert lex.first('perdu', category=VERB).base_form == 'perdre'
+    # an inflected form of another category is not a match
+    assert lex.lookup('perdu', category=ADJECTIVE) is None
+
+
+def test_inflection_index_en(lexicon_en):
+    assert lexicon_en.first('went').base_form == 'go'
+    assert lexicon_en.first('women', category=NOUN).base_form == 'woman'
+
+
+@pytest.fixture(scope='module')
+def lazy_lexicon_fr():
+    """A lazily indexed french lexicon"""
+    return FrenchLexicon(lazy=True)
+
+
+def test_lazy_index_lexicon(lazy_lexicon_fr, xml_lexicon_fr):
+    entry = lazy_lexicon_fr.id_index['E0012152']
+    assert isinstance(entry, LazyWordEntry)
+    assert entry.base_form == 'être'
+    assert entry.category == VERB
+    assert entry.word is None
+    assert set(lazy_lexicon_fr.id_index) == set(xml_lexicon_fr.id_index)
+    assert set(lazy_lexicon_fr.base_index) == set(xml_lexicon_fr.base_index)
+    assert set(lazy_lexicon_fr.variant_index) == set(xml_lexicon_fr.variant_index)
+
+
+def test_lazy_get(lazy_lexicon_fr, lexicon_fr):
+    etre = lazy_lexicon_fr.first('être', category=VERB)
+    assert isinstance(etre, WordElement)
+    assert etre == lexicon_fr.first('être', category=VERB)
+    assert etre.lexicon is lazy_lexicon_fr
+    # the word is only materialised once
+    assert lazy_lexicon_fr.id_index['E0012152'].word is not None
+    assert lazy_lexicon_fr.materialise(
+        lazy_lexicon_fr.id_index['E0012152']) is lazy_lexicon_fr.id_index[
+            'E0012152'].word
+
+
+def test_lazy_find_by_features(lazy_lexicon_fr):
+    features = {
+        PERSON: FIRST,
+        NUMBER: SINGULAR,
+        VOWEL_ELISION: True,
+        DISCOURSE_FUNCTION: SUBJECT
+    }
+    word = lazy_lexicon_fr.find_by_features(features, category=PRONOUN)
+    assert word.base_form == 'je'
+
+
+def test_interned_features(xml_lexicon_fr):
+    beau = xml_lexicon_fr.id_index['beau_2']
+    bon = xml_lexicon_fr.id_index['bon_2']
+    assert beau.category is bon.category
+    # each word has its own (mutable) list of inflection codes
+    assert beau.inflection_variants == bon.inflection_variants
+    assert beau.inflection_variants is not bon.inflection_variants
+    beau_names = {name: name for name in beau.feature_names}
+    for name in bon.feature_names:
+        if name in beau_names:
+            assert name is beau_names[name]
+    # the interning table is dropped once the lexicon is indexed
+    assert not xml_lexicon_fr.interned
+
+
+def test_memory_usage(xml_lexicon_fr, empty_lexicon_fr):
+    usage = xml_lexicon_fr.memory_usage()
+    assert usage['total'] == sum(v for k, v in usage.items() if k != 'total')
+    assert usage['words'] > usage['id_index'] > 0
+    assert empty_lexicon_fr.memory_usage()['total'] < usage['total']
+
+
+@pytest.fixture
+def edited_lexicon_filepath(tmpdir, monkeypatch):
+    """A copy of the french XML lexicon, used by all the french lexicons
+    created during the test.
+
+    """
+    filepath = tmpdir.join('french-lexicon.xml')
+    with open(FrenchLexicon(auto_index=False).lexicon_filepath, 'rb') as f:
+        filepath.write_binary(f.read())
+    monkeypatch.setattr(
+        FrenchLexicon, 'lexicon_filepath', property(lambda self: str(filepath)))
+    return filepath
+
+
+def edit_lexicon(filepath, old, new):
+    source = filepath.read_binary()
+    assert old.encode('utf-8') in source
+    filepath.write_binary(source.replace(old.encode('utf-8'), new.encode('utf-8'), 1))
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_reload(edited_lexicon_filepath, lazy):
+    lex = FrenchLexicon(lazy=lazy)
+    runtime_word = lex.first('Olympia', category=NOUN)
+    etre = lex.id_index['être_1']
+    word_count = len(lex.words)
+    assert lex.reload() == {'added': 0, 'changed': 0, 'removed': 0}
+    assert len(lex.words) == word_count
+
+    edit_lexicon(
+        edited_lexicon_filepath, '<plural>chevaux</plural>', '<plural>chevals</plural>')
+    edit_lexicon(
+        edited_lexicon_filepath,
+        '<word>\n\t\t<base>zèle</base>',
+        '<word>\n\t\t<base>zébu</base>\n\t\t<category>noun</category>\n'
+        '\t\t<id>zébu_1</id>\n\t</word>\n\t<word>\n\t\t<base>zèle</base>')
+    edit_lexicon(edited_lexicon_filepath, '<id>yeux_1</id>', '<id>yeux_2</id>')
+    indexes = lex.indexes
+    assert lex.reload() == {'added': 2, 'changed': 1, 'removed': 1}
+    assert len(lex.words) == word_count + 1
+    # the new indexes replaced the old ones, which were left untouched
+    assert lex.indexes is not indexes
+    assert 'zébu_1' not in indexes.id_index
+    assert len(indexes.words) == word_count
+
+    chevals = lex.get('chevals', category=NOUN, create_if_missing=False)
+    assert chevals[0].base_form == 'cheval'
+    assert lex.lookup('chevaux') is None
+    zebu = lex.get('zébu', category=NOUN, create_if_missing=False)[0]
+    assert zebu.id == 'zébu_1'
+    assert zebu.lexicon is lex
+    assert lex.materialise(lex.id_index['zébu_1']).lexicon is lex
+    assert 'yeux_1' not in lex.id_index
+    assert lex.get('yeux_2', create_if_missing=False)[0].base_form == 'yeux'
+    assert [w.base_form for w in lex.prefix_search('zé')] == ['zébu']
+    # the words created at runtime are kept
+    assert lex.first('Olympia', category=NOUN) == runtime_word
+    # the unchanged words are not reindexed
+    assert lex.id_index['être_1'] is etre
+
+
+
+def test_reload_staging(edited_lexicon_filepath, monkeypatch):
+    lex = FrenchLexicon()
+    lex.build_verb_paradigms()
+    lex.inflection_cache[('aimer_1', 'present1s')] = 'aime'
+    edit_lexicon(edited_lexicon_filepath, '<id>aimer_1</id>', '<id>aimer_2</id>')
+    created = []
+    add_word = FrenchLexicon.add_word
+
+    def staging_add_word(self, word):
+        if self is not lex and not created:
+            # the aimer_1 entry is already removed from the staging lexicon
+            assert 'aimer_1' not in self.id_index
+            assert 'aimer_1' in lex.id_index
+            assert 'aimer_1' in lex.verb_paradigms
+            assert ('aimer_1', 'present1s') in lex.inflection_cache
+            # a word created by another thread during the reload
+            olympia = WordElement('Olympia', NOUN, 'olympia_1', lexicon=lex)
+            thread = threading.Thread(target=lex.create_word, args=(olympia,))
+            thread.start()
+            thread.join()
+            created.append(olympia)
+        return add_word(self, word)
+
+    monkeypatch.setattr(FrenchLexicon, 'add_word', staging_add_word)
+    assert lex.reload() == {'added': 1, 'changed': 0, 'removed': 1}
+    assert created
+    assert lex.first('olympia_1') == created[0]
+    assert id(created[0]) in lex.runtime_words
+    assert 'aimer_1' not in lex.verb_paradigms
+    assert 'aimer_2' in lex.verb_paradigms
+    assert ('aimer_1', 'present1s') not in lex.inflection_cache
+
+
+def test_reload_is_atomic(edited_lexicon_filepath):
+    lex = FrenchLexicon()
+    word_count = len(lex.words)
+    # duplicate the cheval_1 id
+    edit_lexicon(edited_lexicon_filepath, '<id>zèle_1</id>', '<id>cheval_1</id>')
+    with pytest.raises(ValueError):
+        lex.reload()
+    assert len(lex.words) == word_count
+    assert lex.get('zèle', create_if_missing=False)[0].id == 'zèle_1'
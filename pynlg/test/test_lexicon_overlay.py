@@ -0,0 +1,103 @@
+# encoding: utf-8
+
+"""Test suite of the overlay lexicons"""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..lexicon.overlay import OverlayLexicon
+from ..lexicon.feature.category import NOUN, VERB, DETERMINER, CONJUNCTION
+from ..spec.word import WordElement
+
+
+@pytest.fixture
+def overlay_fr(xml_lexicon_fr):
+    """An empty overlay on top of the french lexicon"""
+    return OverlayLexicon(xml_lexicon_fr)
+
+
+def make_word(lexicon, base_form, category, id, **features):
+    word = WordElement(base_form=base_form, category=category, id=id,
+                       lexicon=lexicon, realisation=base_form)
+    word.features.update(features)
+    return word
+
+
+def test_chained_lookup(overlay_fr, xml_lexicon_fr):
+    assert overlay_fr.language == xml_lexicon_fr.language
+    assert overlay_fr.indexed
+    son = overlay_fr.get('son')
+    assert [w.category for w in son] == [DETERMINER, NOUN]
+    assert all(w.lexicon is overlay_fr for w in son)
+    assert overlay_fr.first('E0012152').base_form == 'être'
+    assert overlay_fr.first('sont', category=VERB).base_form == 'être'
+    assert overlay_fr.conjunction_coordination.category == CONJUNCTION
+
+
+def test_overlay_words(overlay_fr, xml_lexicon_fr):
+    overlay_fr.create_word(make_word(overlay_fr, 'Olympia', NOUN, 'olympia_1'))
+    overlay_fr.create_word(make_word(overlay_fr, 'son', NOUN, 'son_festival'))
+    assert overlay_fr.first('Olympia').id == 'olympia_1'
+    assert overlay_fr.first('olympia_1', category=NOUN).base_form == 'Olympia'
+    assert [w.id for w in overlay_fr.get('son', category=NOUN)][0] == 'son_festival'
+    assert len(overlay_fr.get('son', category=NOUN)) == 2
+    # the base lexicon is left untouched
+    assert xml_lexicon_fr.get('Olympia', create_if_missing=False) is None
+    assert len(xml_lexicon_fr.get('son', category=NOUN)) == 1
+    assert 'son_festival' not in xml_lexicon_fr.id_index
+
+
+def test_missing_words_created_in_overlay(overlay_fr, xml_lexicon_fr):
+    word = overlay_fr.first('Zénith', category=NOUN)
+    assert word.lexicon is overlay_fr
+    assert 'Zénith' in overlay_fr.base_index
+    assert 'Zénith' not in xml_lexicon_fr.base_index
+
+
+def test_overlays_are_isolated(xml_lexicon_fr):
+    tenant1 = OverlayLexicon(xml_lexicon_fr)
+    tenant2 = OverlayLexicon(xml_lexicon_fr)
+    tenant1.create_word(make_word(tenant1, 'Olympia', NOUN, 'olympia_1'))
+    assert tenant1.get('Olympia', create_if_missing=False)
+    assert tenant2.get('Olympia', create_if_missing=False) is None
+
+
+def test_shadowed_words(overlay_fr):
+    etre = make_word(overlay_fr, 'être', VERB, 'E0012152', copular=True)
+    overlay_fr.create_word(etre)
+    assert overlay_fr.get('être', category=VERB) == [etre]
+    assert overlay_fr.lookup_inflection('sont') == []
+    word = overlay_fr.find_by_features({'copular': True}, category=VERB)
+    assert word == etre
+    assert word is not etre
+    with pytest.raises(ValueError):
+        overlay_fr.create_word(make_word(overlay_fr, 'être', VERB, 'E0012152'))
+
+
+def test_find_by_features(overlay_fr, xml_lexicon_fr):
+    word = overlay_fr.find_by_features({'copular': True}, category=VERB)
+    assert word.base_form == 'être'
+    assert word.lexicon is overlay_fr
+    # the word is a copy of the base word, which is left untouched
+    assert xml_lexicon_fr.id_index[word.id].lexicon is xml_lexicon_fr
+    assert overlay_fr.find_by_features({'copular': 'nope'}, category=VERB) is None
+
+
+def test_stacked_overlays(overlay_fr):
+    overlay_fr.create_word(make_word(overlay_fr, 'Olympia', NOUN, 'olympia_1'))
+    tenant = OverlayLexicon(overlay_fr)
+    tenant.create_word(make_word(tenant, 'Bataclan', NOUN, 'bataclan_1'))
+    assert tenant.first('Olympia').lexicon is tenant
+    assert tenant.first('être', category=VERB).id == 'E0012152'
+    assert overlay_fr.get('Bataclan', create_if_missing=False) is None
+
+
+def test_prefix_search(overlay_fr):
+    overlay_fr.create_word(make_word(overlay_fr, 'chevalet', NOUN, 'chevalet_1'))
+    words = overlay_fr.prefix_search('cheval', category=NOUN)
+    assert [w.realisation for w in words][:4] == [
+        'cheval', 'chevalet', 'chevalier', 'chevaliers']
+    assert all(w.lexicon is overlay_fr for w in words)
+    assert len(overlay_fr.prefix_search('cheval', category=NOUN, limit=2)) == 2
+    assert 'chevalet' in [w.realisation for w in overlay_fr.suffix_search('et')]
@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""Test suite of the parallel parsing of the XML lexicons"""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..lexicon.fr import FrenchLexicon
+from ..lexicon.lexicon import Lexicon
+from ..lexicon.parallel import split_chunks, parse_chunk
+
+
+@pytest.fixture(scope='module')
+def parallel_lexicon_fr():
+    return FrenchLexicon(processes=2)
+
+
+def index_ids(index):
+    return dict(
+        (key, [getattr(entry, 'id', entry) for entry in entries])
+        for key, entries in index.items())
+
+
+def test_split_chunks():
+    spans = [(0, 10), (10, 20), (25, 30), (30, 40), (40, 50)]
+    assert split_chunks(spans, 2) == [(0, 30), (30, 50)]
+    assert split_chunks(spans, 5) == spans
+    assert split_chunks(spans, 10) == spans
+    assert split_chunks([], 2) == []
+
+
+def test_iter_word_spans():
+    source = (b'<lexicon><word><base>a</base></word>'
+              b'<!-- <word><base>b</base></word> -->'
+              b'<word><base>c</base></word></lexicon>')
+    spans = list(Lexicon.iter_word_spans(source))
+    assert [source[start:end] for start, end in spans] == [
+        b'<word><base>a</base></word>', b'<word><base>c</base></word>']
+
+
+def test_parse_chunk(xml_lexicon_fr):
+    filepath = xml_lexicon_fr.lexicon_filepath
+    with open(filepath, 'rb') as f:
+        spans = list(Lexicon.iter_word_spans(f.read()))
+    start, end = spans[10][0], spans[19][1]
+    records, id_index, indexes = parse_chunk((FrenchLexicon, filepath, start, end))
+    assert len(records) == 10
+    for word_id, position in id_index.items():
+        assert records[position][0] == word_id
+        word = xml_lexicon_fr.id_index[word_id]
+        assert xml_lexicon_fr.word_to_record(word) == records[position]
+    for base_form, positions in indexes['base_index'].items():
+        assert all(records[position][1] == base_form for position in positions)
+
+
+def test_parallel_indexes(parallel_lexicon_fr, xml_lexicon_fr):
+    assert len(parallel_lexicon_fr.words) == len(xml_lexicon_fr.words)
+    assert set(parallel_lexicon_fr.id_index) == set(xml_lexicon_fr.id_index)
+    for attr in ('base_index', 'variant_index', 'category_base_index',
+                 'category_variant_index', 'feature_index'):
+        assert index_ids(getattr(parallel_lexicon_fr, attr)) == index_ids(
+            getattr(xml_lexicon_fr, attr))
+    assert [
+        (w.id, names) for w, names in parallel_lexicon_fr.inflection_index['sommes']
+    ] == [(w.id, names) for w, names in xml_lexicon_fr.inflection_index['sommes']]
+
+
+def test_parallel_get(parallel_lexicon_fr):
+    cheval = parallel_lexicon_fr.first('chevaux')
+    assert cheval.base_form == 'cheval'
+    assert cheval.lexicon is parallel_lexicon_fr
+    assert parallel_lexicon_fr.reload() == {'added': 0, 'changed': 0, 'removed': 0}
+
+
+def test_parallel_duplicate_id(tmpdir, monkeypatch):
+    filepath = tmpdir.join('french-lexicon.xml')
+    with open(FrenchLexicon(auto_index=False).lexicon_filepath, 'rb') as f:
+        filepath.write_binary(
+            f.read().replace(b'<id>z\xc3\xa8le_1</id>', b'<id>cheval_1</id>'))
+    monkeypatch.setattr(
+        FrenchLexicon, 'lexicon_filepath', property(lambda self: str(filepath)))
+    with pytest.raises(ValueError):
+        FrenchLexicon(processes=2)
@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""Test suite of the prefix indexes"""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..lexicon.prefix import PrefixIndex
+from ..lexicon.feature.category import NOUN, ADJECTIVE, ANY
+
+
+@pytest.fixture
+def mapping():
+    return {'chat': 1, 'chaton': 2, 'cheval': 3, 'chevaux': 4, 'veau': 5}
+
+
+def test_prefix_index(mapping):
+    index = PrefixIndex(mapping)
+    assert len(index) == 5
+    assert list(index.search('chat')) == [('chat', 1), ('chaton', 2)]
+    assert list(index.search('ch')) == [
+        ('chat', 1), ('chaton', 2), ('cheval', 3), ('chevaux', 4)]
+    assert list(index.search('x')) == []
+    assert 'cheval' in index
+    assert 'chev' not in index
+
+
+def test_suffix_index(mapping):
+    index = PrefixIndex(mapping, reverse=True)
+    assert list(index.search('aux')) == [('chevaux', 4)]
+    assert list(index.search('au')) == [('veau', 5)]
+    assert 'veau' in index
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_prefix_index_add(mapping, reverse):
+    index = PrefixIndex(mapping, reverse=reverse)
+    index.add('chevalet', 6)
+    expected = PrefixIndex(dict(mapping, chevalet=6), reverse=reverse)
+    assert index.keys == expected.keys
+    assert index.values == expected.values
+
+
+def test_lexicon_prefix_search(lexicon_fr):
+    words = lexicon_fr.prefix_search('chev', category=NOUN)
+    forms = [w.realisation for w in words]
+    assert forms == sorted(forms)
+    assert 'chevaux' in forms
+    assert all(w.category == NOUN for w in words)
+    assert words[forms.index('chevaux')].base_form == 'cheval'
+    assert len(lexicon_fr.prefix_search('chev', limit=3)) == 3
+    assert lexicon_fr.prefix_search('zzzz', category=ANY) == []
+
+
+def test_lexicon_suffix_search(lexicon_fr):
+    forms = [w.realisation for w in lexicon_fr.suffix_search('eaux', category=ADJECTIVE)]
+    assert 'beaux' in forms
+    assert all(form.endswith('eaux') for form in forms)
+
+
+def test_form_indexes_rebuilt(empty_lexicon_fr, lexicon_fr):
+    lex = empty_lexicon_fr
+    assert lex.prefix_search('chev') == []
+    lex.create_word(lexicon_fr.first('cheval', category=NOUN))
+    assert [w.realisation for w in lex.prefix_search('chev')] == ['cheval', 'chevaux']
+    # the built indexes are updated when words are indexed
+    prefix_index, suffix_index = lex.prefix_index, lex.suffix_index
+    lex.get('chevalet')
+    assert lex.prefix_index is prefix_index and lex.suffix_index is suffix_index
+    assert [w.realisation for w in lex.prefix_search('chev')] == [
+        'cheval', 'chevalet', 'chevaux']
+    assert [w.realisation for w in lex.suffix_search('let')] == ['chevalet']
@@ -0,0 +1,64 @@
+# encoding: utf-8
+
+"""Test suite of the lexicon registry"""
+
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from ..lexicon import registry
+from ..lexicon.fr import FrenchLexicon
+from ..lexicon.lang import FRENCH, ENGLISH
+from ..spec.string import StringElement
+
+
+@pytest.fixture
+def clean_registry(monkeypatch):
+    """An empty lexicon registry, restored after the test"""
+    monkeypatch.setattr(registry, '_lexicons', {})
+
+
+def test_get(lexicon_fr):
+    lexicon = registry.get(FRENCH)
+    assert registry.get(FRENCH) is lexicon
+    assert isinstance(lexicon, FrenchLexicon)
+    assert lexicon.indexed
+    # the fixture lexicon is not the shared one
+    assert lexicon is not lexicon_fr
+
+
+def test_get_loads_once(clean_registry, monkeypatch):
+    calls = []
+    make_indexes = FrenchLexicon.make_indexes
+
+    def counting_make_indexes(self):
+        calls.append(self)
+        make_indexes(self)
+
+    monkeypatch.setattr(FrenchLexicon, 'make_indexes', counting_make_indexes)
+    lexicons = []
+    threads = [
+        threading.Thread(target=lambda: lexicons.append(registry.get(FRENCH)))
+        for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(lex is lexicons[0] for lex in lexicons)
+
+
+def test_register_unregister(clean_registry):
+    lex = FrenchLexicon(auto_index=False)
+    registry.register(lex)
+    assert registry.get(FRENCH) is lex
+    registry.unregister(FRENCH)
+    assert registry.get(FRENCH) is not lex
+
+
+def test_string_element_lexicon():
+    se = StringElement('maison', language=FRENCH)
+    assert se.lexicon is registry.get(FRENCH)
+    assert StringElement('house', language=ENGLISH).language == ENGLISH
@@ -0,0 +1,80 @@
+# encoding: utf-8
+
+"""Test suite of the binary lexicon snapshots"""
+
+from __future__ import unicode_literals
+
+import os
+import pytest
+
+from ..lexicon.fr import FrenchLexicon
+from ..lexicon.lexicon import LexiconIndexes
+from ..lexicon.feature.category import NOUN
+from ..lexicon.snapshot import (SNAPSHOT_DIR_ENV, checksum, snapshot_filepath,
+                                dump_snapshot, load_snapshot, compile_snapshot,
+                                is_trusted)
+
+
+@pytest.fixture
+def snapshot_dir(tmpdir, monkeypatch):
+    monkeypatch.setenv(SNAPSHOT_DIR_ENV, str(tmpdir))
+    return tmpdir
+
+
+def test_snapshot_filepath(snapshot_dir):
+    filepath = snapshot_filepath('/some/where/french-lexicon.xml')
+    assert filepath == str(snapshot_dir.join('french-lexicon.xml.snapshot'))
+
+
+def test_load_missing_snapshot(snapshot_dir):
+    assert load_snapshot(str(snapshot_dir.join('nope.snapshot')), 'abc') is None
+
+
+def test_load_stale_snapshot(snapshot_dir):
+    filepath = str(snapshot_dir.join('lex.snapshot'))
+    dump_snapshot([('E1', 'chat', 'NOUN', {})], filepath, 'abc')
+    assert load_snapshot(filepath, 'abc') == [('E1', 'chat', 'NOUN', {})]
+    assert load_snapshot(filepath, 'def') is None
+
+
+def test_load_corrupted_snapshot(snapshot_dir):
+    filepath = snapshot_dir.join('lex.snapshot')
+    filepath.write_binary(b'garbage')
+    assert load_snapshot(str(filepath), 'abc') is None
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='no file permissions')
+def test_load_untrusted_snapshot(snapshot_dir):
+    filepath = str(snapshot_dir.join('lex.snapshot'))
+    dump_snapshot([('E1', 'chat', 'NOUN', {})], filepath, 'abc')
+    assert is_trusted(filepath)
+    os.chmod(filepath, 0o666)
+    assert not is_trusted(filepath)
+    assert load_snapshot(filepath, 'abc') is None
+
+
+def test_compile_snapshot(snapshot_dir, xml_lexicon_fr):
+    lex = FrenchLexicon(auto_index=False)
+    filepath = compile_snapshot(lex)
+    records, id_index, indexes = load_snapshot(filepath, checksum(lex.lexicon_filepath))
+    assert len(records) == len(xml_lexicon_fr.words)
+    assert set(id_index) == set(xml_lexicon_fr.id_index)
+    # the snapshot holds the indexes built while parsing
+    assert set(indexes) == set(LexiconIndexes.LIST_INDEXES)
+    assert set(indexes['variant_index']) == set(xml_lexicon_fr.variant_index)
+
+
+def test_lexicon_from_snapshot(snapshot_dir, xml_lexicon_fr):
+    # The first instanciation compiles the snapshot, the second loads it
+    lex1 = FrenchLexicon(snapshot=True)
+    assert snapshot_dir.join('french-lexicon.xml.snapshot').check()
+    lex2 = FrenchLexicon(snapshot=True)
+    for lex in (lex1, lex2):
+        assert len(lex.words) == len(xml_lexicon_fr.words)
+        assert set(lex.id_index) == set(xml_lexicon_fr.id_index)
+        assert set(lex.base_index) == set(xml_lexicon_fr.base_index)
+        assert set(lex.category_index) == set(xml_lexicon_fr.category_index)
+        assert lex.first('chevaux', category=NOUN).base_form == 'cheval'
+    son = lex2.first('son')
+    assert son == xml_lexicon_fr.first('son')
+    assert son.lexicon is lex2
@@ -0,0 +1,149 @@
+# encoding: utf-8
+
+"""Test suite of the SQLite lexicons"""
+
+from __future__ import unicode_literals
+
+import json
+
+import pytest
+
+from ..lexicon.sqlite import SQLiteLexicon
+from ..lexicon.lang import FRENCH
+from ..lexicon.feature import PERSON, NUMBER
+from ..lexicon.feature.category import NOUN, VERB, DETERMINER, PRONOUN, ADJECTIVE
+from ..lexicon.feature.discourse import SUBJECT
+from ..lexicon.feature.internal import DISCOURSE_FUNCTION
+from ..lexicon.feature.lexical.fr import VOWEL_ELISION
+from ..lexicon.feature.number import SINGULAR
+from ..lexicon.feature.person import FIRST
+from ..spec.word import WordElement
+
+
+@pytest.fixture(scope='module')
+def db_filepath(tmpdir_factory):
+    """A SQLite database filled with the french lexicon words"""
+    filepath = str(tmpdir_factory.mktemp('sqlite').join('french.db'))
+    SQLiteLexicon(filepath, language=FRENCH)
+    return filepath
+
+
+@pytest.fixture
+def sqlite_lexicon_fr(db_filepath):
+    return SQLiteLexicon(db_filepath, language=FRENCH, cache_size=16)
+
+
+def test_fill_from_xml(sqlite_lexicon_fr, xml_lexicon_fr):
+    assert sqlite_lexicon_fr.indexed
+    count = sqlite_lexicon_fr.query('SELECT COUNT(*) FROM words')[0][0]
+    assert count == len(xml_lexicon_fr.words)
+
+
+def test_unindexed(tmpdir):
+    lex = SQLiteLexicon(str(tmpdir.join('empty.db')), language=FRENCH, auto_index=False)
+    assert not lex.indexed
+    assert lex.get('son', create_if_missing=False) is None
+
+
+def test_get(sqlite_lexicon_fr, xml_lexicon_fr):
+    for word_feature in ('son', 'E0012152', 'sont', 'chevaux'):
+        words = sqlite_lexicon_fr.get(word_feature, create_if_missing=False)
+        expected = xml_lexicon_fr.get(word_feature, create_if_missing=False)
+        assert words == expected
+        assert [w.realisation for w in words] == [w.realisation for w in expected]
+        assert all(w.lexicon is sqlite_lexicon_fr for w in words)
+    assert sqlite_lexicon_fr.lookup('son', category=VERB) == []
+    assert sqlite_lexicon_fr.lookup('perdu', category=ADJECTIVE) is None
+
+
+def test_first(sqlite_lexicon_fr):
+    assert sqlite_lexicon_fr.first('son').category == DETERMINER
+    assert sqlite_lexicon_fr.first('son', category=NOUN).category == NOUN
+    assert sqlite_lexicon_fr.first('sont', category=VERB).base_form == 'être'
+
+
+def test_copies(sqlite_lexicon_fr):
+    le1 = sqlite_lexicon_fr.first('le', category=DETERMINER)
+    le1['plural'] = 'plop'
+    assert sqlite_lexicon_fr.first('le', category=DETERMINER).plural == 'les'
+
+
+def test_lookup_cache(sqlite_lexicon_fr):
+    cache = sqlite_lexicon_fr.cache
+    sqlite_lexicon_fr.first('son', category=NOUN)
+    hits = cache.hits
+    sqlite_lexicon_fr.first('son', category=NOUN)
+    assert cache.hits == hits + 1
+    for i in range(20):
+        sqlite_lexicon_fr.get('son_%d' % (i), category=NOUN, create_if_missing=False)
+    assert len(cache) == 16
+    assert 'son' not in cache
+
+
+def test_create_word(db_filepath):
+    lex = SQLiteLexicon(db_filepath, language=FRENCH)
+    assert lex.get('Olympia', create_if_missing=False) is None
+    lex.create_word(WordElement('Olympia', NOUN, 'olympia_1', lexicon=lex))
+    assert lex.first('Olympia').id == 'olympia_1'
+    # the word is persisted
+    other = SQLiteLexicon(db_filepath, language=FRENCH)
+    assert other.first('olympia_1').base_form == 'Olympia'
+    with pytest.raises(ValueError):
+        lex.create_word(WordElement('Olympia', NOUN, 'olympia_1', lexicon=lex))
+
+
+def test_json_features(tmpdir):
+    lex = SQLiteLexicon(str(tmpdir.join('json.db')), language=FRENCH, auto_index=False)
+    word = WordElement('Zenith', NOUN, 'zenith_1', lexicon=lex)
+    word.features['plural'] = 'Zeniths'
+    lex.create_word(word)
+    features, = lex.query('SELECT features FROM words WHERE id = ?', ('zenith_1',))[0]
+    assert json.loads(features) == {'plural': 'Zeniths'}
+    assert lex.first('zenith_1').features['plural'] == 'Zeniths'
+    word = WordElement('Cigale', NOUN, 'cigale_1', lexicon=lex)
+    word.features['venue'] = object()
+    with pytest.raises(ValueError):
+        lex.create_words([WordElement('Trianon', NOUN, 'trianon_1', lexicon=lex), word])
+    assert lex.query('SELECT id FROM words WHERE id = ?', ('trianon_1',)) == []
+
+
+def test_reload(db_filepath):
+    lex = SQLiteLexicon(db_filepath, language=FRENCH)
+    assert lex.get('Bataclan', create_if_missing=False) is None
+    other = SQLiteLexicon(db_filepath, language=FRENCH)
+    other.create_word(WordElement('Bataclan', NOUN, 'bataclan_1', lexicon=other))
+    # the lookup is cached
+    assert lex.get('Bataclan', create_if_missing=False) is None
+    assert lex.reload() is None
+    assert lex.first('Bataclan').id == 'bataclan_1'
+
+
+def test_create_missing_word(tmpdir):
+    lex = SQLiteLexicon(str(tmpdir.join('missing.db')), language=FRENCH, auto_index=False)
+    assert lex.get('GRUB', create_if_missing=False) is None
+    assert lex.first('GRUB').base_form == 'GRUB'
+    assert len(lex.get('GRUB', create_if_missing=False)) == 1
+
+
+def test_find_by_features(sqlite_lexicon_fr):
+    features = {
+        PERSON: FIRST,
+        NUMBER: SINGULAR,
+        VOWEL_ELISION: True,
+        DISCOURSE_FUNCTION: SUBJECT
+    }
+    assert sqlite_lexicon_fr.find_by_features(features, category=PRONOUN).base_form == 'je'
+    assert sqlite_lexicon_fr.find_by_features(features).base_form == 'je'
+    assert sqlite_lexicon_fr.find_by_features(features, category=NOUN) is None
+
+
+def test_inflections_and_searches(sqlite_lexicon_fr, xml_lexicon_fr):
+    assert [
+        (w.base_form, features)
+        for w, features in sqlite_lexicon_fr.lookup_inflection('sois')
+    ] == [('être', ('imperative2s', 'subjunctive1s', 'subjunctive2s'))]
+    assert [
+        w.realisation for w in sqlite_lexicon_fr.prefix_search('chev', category=NOUN)
+    ] == [w.realisation for w in xml_lexicon_fr.prefix_search('chev', category=NOUN)]
+    assert [w.realisation for w in sqlite_lexicon_fr.suffix_search('eaux', limit=2)] == [
+        w.realisation for w in xml_lexicon_fr.suffix_search('eaux', limit=2)]
@@ -0,0 +1,78 @@
+# encoding: utf-8
+
+"""Test suite of the reverse morphological analyser."""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..exc import UnhandledLanguage
+from ..morphology.analyser import FormAutomaton, MorphologyAnalyser, Analysis
+from ..morphology.fr import FrenchMorphologyRules
+from ..lexicon.feature import NUMBER, PERSON, TENSE, FORM
+from ..lexicon.feature.lexical import GENDER
+from ..lexicon.feature.category import NOUN, ADJECTIVE, DETERMINER, VERB
+from ..lexicon.feature.gender import MASCULINE, FEMININE
+from ..lexicon.feature.number import SINGULAR, PLURAL
+from ..lexicon.feature.person import FIRST, THIRD
+from ..lexicon.feature.tense import PRESENT, CONDITIONAL
+from ..lexicon.feature.form import INFINITIVE, INDICATIVE, PAST_PARTICIPLE
+from ..spec.word import InflectedWordElement
+
+
+@pytest.fixture(scope='module')
+def analyser(xml_lexicon_fr):
+    return MorphologyAnalyser.build(xml_lexicon_fr)
+
+
+def test_form_automaton():
+    automaton = FormAutomaton(['chat.', 'chats.', 'rat.', 'rats.', 'chien.'])
+    assert sorted(automaton.suffixes('ch')) == ['at.', 'ats.', 'ien.']
+    assert sorted(automaton.suffixes('rat')) == ['.', 's.']
+    assert list(automaton.suffixes('chev')) == []
+    assert automaton.walk('rats.') is not None
+    assert automaton.walk('rats') != automaton.walk('rats.')
+    # 'at', 'at.', 'ats' and 'ats.' are shared by 'ch' and 'r'
+    assert len(automaton) == 10
+
+
+@pytest.mark.parametrize('form, expected', [
+    ('belles', Analysis('beau', ADJECTIVE, {GENDER: FEMININE, NUMBER: PLURAL})),
+    ('chevaux', Analysis('cheval', NOUN, {NUMBER: PLURAL})),
+    ('la', Analysis('le', DETERMINER, {GENDER: FEMININE, NUMBER: SINGULAR})),
+    ('sont', Analysis('être', VERB, {
+        FORM: INDICATIVE, TENSE: PRESENT, PERSON: THIRD, NUMBER: PLURAL})),
+    ('aimerions', Analysis('aimer', VERB, {
+        FORM: INDICATIVE, TENSE: CONDITIONAL, PERSON: FIRST, NUMBER: PLURAL})),
+    ('été', Analysis('être', VERB, {
+        FORM: PAST_PARTICIPLE, GENDER: MASCULINE, NUMBER: SINGULAR})),
+    ('finir', Analysis('finir', VERB, {FORM: INFINITIVE})),
+])
+def test_analyse(analyser, form, expected):
+    assert expected in analyser.analyse(form)
+
+
+def test_analyse_unknown_form(analyser):
+    assert analyser.analyse('grouik') == []
+    assert analyser.analyse('') == []
+
+
+@pytest.mark.parametrize('form', ['belles', 'chevaux', 'finissaient', 'allées'])
+def test_analyse_realise(xml_lexicon_fr, analyser, form):
+    rules = FrenchMorphologyRules()
+    morph = {
+        NOUN: rules.morph_noun,
+        ADJECTIVE: rules.morph_adjective,
+        VERB: rules.morph_verb,
+    }
+    analyses = analyser.analyse(form)
+    assert analyses
+    for lemma, category, features in analyses:
+        word = xml_lexicon_fr.first(lemma, category=category)
+        element = InflectedWordElement(word, features=features)
+        assert morph[category](element, word).realisation == form
+
+
+def test_build_unhandled_language(lexicon_en):
+    with pytest.raises(UnhandledLanguage):
+        MorphologyAnalyser.build(lexicon_en)
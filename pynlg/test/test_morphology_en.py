@@ -0,0 +1,157 @@
+# encoding: utf-8
+
+"""Test suite of the english morphology rules."""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..morphology.en import EnglishMorphologyRules, load_wordlists, NULL_PLURAL
+from ..lexicon.feature.category import NOUN, VERB, ADJECTIVE, ADVERB, DETERMINER
+from ..lexicon.feature import NUMBER, IS_COMPARATIVE, IS_SUPERLATIVE, PARTICLE
+from ..lexicon.feature.number import PLURAL, SINGULAR
+from ..lexicon.feature.person import FIRST, SECOND, THIRD
+from ..lexicon.feature.tense import PRESENT, PAST, FUTURE
+from ..lexicon.feature.form import (
+    INFINITIVE, GERUND, PRESENT_PARTICIPLE, PAST_PARTICIPLE)
+from ..lexicon.feature import PERSON, TENSE, FORM
+from ..spec.word import WordElement
+
+
+@pytest.fixture
+def morph_rules_en():
+    return EnglishMorphologyRules()
+
+
+def test_load_wordlists():
+    wordlists = load_wordlists()
+    assert 'admit' in wordlists['verb const doubling']
+    assert 'sheep' in wordlists[NULL_PLURAL]
+    assert wordlists['modals'] >= set(['may', 'should'])
+
+
+def test_tables(morph_rules_en):
+    tables = morph_rules_en.tables
+    assert tables is EnglishMorphologyRules().tables
+    assert 'admit' in tables.consonant_doubling
+    assert 'sheep' in tables.null_plural
+
+
+@pytest.mark.parametrize('word, features, expected', [
+    ('cat', {}, 'cat'),
+    ('cat', {NUMBER: PLURAL}, 'cats'),
+    ('child', {NUMBER: PLURAL}, 'children'),
+    ('box', {NUMBER: PLURAL}, 'boxes'),
+    ('city', {NUMBER: PLURAL}, 'cities'),
+    ('day', {NUMBER: PLURAL}, 'days'),
+    # null plural
+    ('sheep', {NUMBER: PLURAL}, 'sheep'),
+    # non count noun
+    ('goodness', {NUMBER: PLURAL}, 'goodness'),
+])
+def test_morph_noun(lexicon_en, morph_rules_en, word, features, expected):
+    element = lexicon_en.first(word, category=NOUN)
+    element.features.update(features)
+    assert morph_rules_en.morph_noun(element, element).realisation == expected
+
+
+def test_morph_noun_without_base_word(lexicon_en, morph_rules_en):
+    element = lexicon_en.first('mouse', category=NOUN)
+    element.features = {NUMBER: PLURAL}
+    # irregular form read from the lexicon entry
+    assert morph_rules_en.morph_noun(element).realisation == 'mice'
+
+
+def test_morph_standalone_lexicon(empty_lexicon_en, morph_rules_en):
+    wug = WordElement('wug', NOUN, 'wug_1', lexicon=empty_lexicon_en)
+    wug.features['plural'] = 'wugzes'
+    empty_lexicon_en.create_word(wug)
+    element = WordElement('wug', NOUN, lexicon=empty_lexicon_en)
+    element.features[NUMBER] = PLURAL
+    # the irregular forms are the ones of the element lexicon
+    assert morph_rules_en.morph_noun(element).realisation == 'wugzes'
+    element.lexicon = None
+    assert morph_rules_en.morph_noun(element).realisation == 'wugs'
+
+
+@pytest.mark.parametrize('word, tense, form, person, number, expected', [
+    ('walk', PRESENT, None, THIRD, SINGULAR, 'walks'),
+    ('walk', PRESENT, None, FIRST, PLURAL, 'walk'),
+    ('walk', PAST, None, FIRST, SINGULAR, 'walked'),
+    ('walk', FUTURE, None, FIRST, SINGULAR, 'walk'),
+    ('cry', PRESENT, None, THIRD, SINGULAR, 'cries'),
+    ('cry', PAST, None, THIRD, SINGULAR, 'cried'),
+    ('admit', PAST, None, THIRD, SINGULAR, 'admitted'),
+    ('admit', None, PRESENT_PARTICIPLE, THIRD, SINGULAR, 'admitting'),
+    ('make', None, GERUND, THIRD, SINGULAR, 'making'),
+    ('die', None, PRESENT_PARTICIPLE, THIRD, SINGULAR, 'dying'),
+    ('go', PRESENT, None, THIRD, SINGULAR, 'goes'),
+    ('go', PAST, None, THIRD, SINGULAR, 'went'),
+    ('go', None, PAST_PARTICIPLE, THIRD, SINGULAR, 'gone'),
+    ('go', None, INFINITIVE, THIRD, SINGULAR, 'go'),
+    ('be', PRESENT, None, FIRST, SINGULAR, 'am'),
+    ('be', PRESENT, None, SECOND, SINGULAR, 'are'),
+    ('be', PRESENT, None, THIRD, SINGULAR, 'is'),
+    ('be', PAST, None, THIRD, SINGULAR, 'was'),
+    ('be', PAST, None, THIRD, PLURAL, 'were'),
+    ('be', None, PAST_PARTICIPLE, THIRD, SINGULAR, 'been'),
+])
+def test_morph_verb(
+        lexicon_en, morph_rules_en, word, tense, form, person, number, expected):
+    verb = lexicon_en.first(word, category=VERB)
+    verb.features.update({
+        TENSE: tense,
+        FORM: form,
+        PERSON: person,
+        NUMBER: number,
+    })
+    assert morph_rules_en.morph_verb(verb, base_word=verb).realisation == expected
+
+
+def test_morph_modal_verb(lexicon_en, morph_rules_en):
+    verb = WordElement('should', VERB, lexicon=lexicon_en)
+    verb.features.update({TENSE: PRESENT, PERSON: THIRD, NUMBER: SINGULAR})
+    assert morph_rules_en.morph_verb(verb, base_word=None).realisation == 'should'
+
+
+def test_morph_phrasal_verb(lexicon_en, morph_rules_en):
+    verb = lexicon_en.first('give', category=VERB)
+    verb.features.update({TENSE: PAST, PARTICLE: 'up'})
+    assert morph_rules_en.morph_verb(verb, base_word=verb).realisation == 'gave up'
+
+
+@pytest.mark.parametrize('word, features, expected', [
+    ('tall', {}, 'tall'),
+    ('tall', {IS_COMPARATIVE: True}, 'taller'),
+    ('tall', {IS_SUPERLATIVE: True}, 'tallest'),
+    ('happy', {IS_COMPARATIVE: True}, 'happier'),
+    ('nice', {IS_SUPERLATIVE: True}, 'nicest'),
+    ('good', {IS_COMPARATIVE: True}, 'better'),
+    ('good', {IS_SUPERLATIVE: True}, 'best'),
+])
+def test_morph_adjective(lexicon_en, morph_rules_en, word, features, expected):
+    element = lexicon_en.first(word, category=ADJECTIVE)
+    element.features.update(features)
+    assert morph_rules_en.morph_adjective(element, element).realisation == expected
+
+
+def test_morph_adverb(lexicon_en, morph_rules_en):
+    well = lexicon_en.first('well', category=ADVERB)
+    well.features[IS_COMPARATIVE] = True
+    assert morph_rules_en.morph_adverb(well, well).realisation == 'better'
+    quickly = lexicon_en.first('quickly', category=ADVERB)
+    quickly.features[IS_COMPARATIVE] = True
+    assert morph_rules_en.morph_adverb(quickly, quickly).realisation == 'quickly'
+
+
+@pytest.mark.parametrize('word, number, expected', [
+    ('the', PLURAL, 'the'),
+    ('this', SINGULAR, 'this'),
+    ('this', PLURAL, 'these'),
+    ('that', PLURAL, 'those'),
+    ('a', PLURAL, 'some'),
+])
+def test_morph_determiner(lexicon_en, morph_rules_en, word, number, expected):
+    element = lexicon_en.first(word, category=DETERMINER)
+    element.features[NUMBER] = number
+    assert morph_rules_en.morph_determiner(element).realisation == expected
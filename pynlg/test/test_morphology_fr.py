@@ -7,8 +7,10 @@ import pytest
 from ..morphology.fr import FrenchMorphologyRules
 from ..spec.phrase import PhraseElement
 from ..spec.string import StringElement
+from ..spec.word import InflectedWordElement
 from ..lexicon.feature.category import ADJECTIVE, VERB_PHRASE, NOUN_PHRASE, VERB
 from ..lexicon.feature.lexical import GENDER
+from ..lexicon.feature.lexical.fr import FEMININE_PLURAL, PRESENT3P
 from ..lexicon.feature import NUMBER, IS_COMPARATIVE
 from ..lexicon.feature.gender import MASCULINE, FEMININE
 from ..lexicon.feature.number import PLURAL, SINGULAR, BOTH
@@ -547,3 +549,56 @@ def test_morph_verb(
     realised = morph_rules_fr.morph_verb(verb, base_word=verb)
     assert isinstance(realised, StringElement)
     assert realised.realisation == expected
+
+
+def test_inflection_key(lexicon_fr, morph_rules_fr):
+    word = lexicon_fr.first(u'beau', category=ADJECTIVE)
+    beau = InflectedWordElement(word)
+    parent = PhraseElement(lexicon=lexicon_fr, category=NOUN_PHRASE)
+    parent.gender = FEMININE
+    parent.number = PLURAL
+    beau.parent = parent
+    key = morph_rules_fr.inflection_key(beau, word)
+    assert key[0] == word.id
+    beau.parent = None
+    assert morph_rules_fr.inflection_key(beau, word) != key
+    beau.is_comparative = True
+    assert morph_rules_fr.inflection_key(beau, word) is None
+    assert morph_rules_fr.inflection_key(beau, None) is None
+
+
+def test_inflection_cache(lexicon_fr):
+    cache = lexicon_fr.inflection_cache
+    etre = lexicon_fr.first(u'être', category=VERB)
+    sont = InflectedWordElement(etre, features={NUMBER: PLURAL, PERSON: THIRD})
+    assert sont.realise_morphology().realisation == u'sont'
+    hits = cache.hits
+    assert sont.realise_morphology().realisation == u'sont'
+    assert cache.hits == hits + 1
+    etes = InflectedWordElement(etre, features={NUMBER: PLURAL, PERSON: SECOND})
+    assert etes.realise_morphology().realisation == u'êtes'
+    cache.invalidate(etre.id)
+    assert sont.realise_morphology().realisation == u'sont'
+    assert cache.hits == hits + 1
+
+
+@pytest.mark.parametrize('word, category, features, overrides, expected, overridden', [
+    (u'beau', ADJECTIVE, {GENDER: FEMININE, NUMBER: PLURAL},
+     {FEMININE_PLURAL: u'OVERRIDE'}, u'belles', u'OVERRIDE'),
+    (u'être', VERB, {NUMBER: PLURAL, PERSON: THIRD},
+     {PRESENT3P: u'SONTX'}, u'sont', u'SONTX'),
+])
+@pytest.mark.parametrize('override_first', [True, False])
+def test_inflection_cache_overrides(
+        lexicon_fr, morph_rules_fr, word, category, features, overrides, expected,
+        overridden, override_first):
+    word = lexicon_fr.first(word, category=category)
+    lexicon_fr.inflection_cache.invalidate(word.id)
+    default = InflectedWordElement(word, features=features)
+    override = InflectedWordElement(word, features=dict(features, **overrides))
+    assert morph_rules_fr.inflection_key(override, word) is None
+    elements = [(override, overridden), (default, expected)]
+    if not override_first:
+        elements.reverse()
+    for element, realisation in elements + elements:
+        assert element.realise_morphology().realisation == realisation
@@ -0,0 +1,95 @@
+# encoding: utf-8
+
+"""Test suite of the precomputed verb conjugation paradigms."""
+
+from __future__ import unicode_literals
+
+import pytest
+
+from ..exc import UnhandledLanguage
+from ..morphology.fr import FrenchMorphologyRules
+from ..morphology.paradigm import VerbParadigms, CELLS, cell_key
+from ..lexicon.feature import NUMBER, PERSON, TENSE, FORM
+from ..lexicon.feature.category import VERB
+from ..lexicon.feature.lexical.fr import PRESENT3P
+from ..lexicon.feature.gender import MASCULINE, FEMININE
+from ..lexicon.feature.number import SINGULAR, PLURAL
+from ..lexicon.feature.person import FIRST, THIRD
+from ..lexicon.feature.tense import PRESENT, PAST, FUTURE
+from ..lexicon.feature.form import (
+    INFINITIVE, INDICATIVE, SUBJUNCTIVE, GERUND, PRESENT_PARTICIPLE, PAST_PARTICIPLE)
+from ..spec.word import InflectedWordElement
+
+
+@pytest.fixture(scope='module')
+def paradigms(xml_lexicon_fr):
+    return VerbParadigms.build(xml_lexicon_fr)
+
+
+@pytest.mark.parametrize('form, tense, person, number, gender, expected', [
+    (INFINITIVE, PRESENT, THIRD, SINGULAR, MASCULINE, None),
+    (INDICATIVE, PAST, FIRST, PLURAL, FEMININE, (PAST, FIRST, PLURAL)),
+    (None, FUTURE, THIRD, SINGULAR, MASCULINE, (FUTURE, THIRD, SINGULAR)),
+    (SUBJUNCTIVE, PRESENT, FIRST, PLURAL, MASCULINE, (SUBJUNCTIVE, FIRST, PLURAL)),
+    (GERUND, PRESENT, FIRST, PLURAL, FEMININE, (PRESENT_PARTICIPLE, FEMININE, PLURAL)),
+])
+def test_cell_key(form, tense, person, number, gender, expected):
+    key = cell_key(form, tense, person, number, gender)
+    assert key == expected
+    assert key is None or key in CELLS
+
+
+@pytest.mark.parametrize('word, form, tense, person, number, gender, expected', [
+    ('être', INDICATIVE, PRESENT, THIRD, PLURAL, MASCULINE, 'sont'),
+    ('chanter', INDICATIVE, FUTURE, FIRST, PLURAL, MASCULINE, 'chanterons'),
+    ('finir', INDICATIVE, PAST, THIRD, PLURAL, MASCULINE, 'finissaient'),
+    ('finir', SUBJUNCTIVE, PRESENT, FIRST, PLURAL, MASCULINE, 'finissions'),
+    ('aller', PAST_PARTICIPLE, PRESENT, THIRD, PLURAL, FEMININE, 'allées'),
+    ('finir', INFINITIVE, PRESENT, THIRD, SINGULAR, MASCULINE, None),
+])
+def test_get(xml_lexicon_fr, paradigms, word, form, tense, person, number, gender,
+             expected):
+    verb = xml_lexicon_fr.first(word, category=VERB)
+    assert paradigms.get(verb.id, form, tense, person, number, gender) == expected
+
+
+def test_discard(xml_lexicon_fr, paradigms):
+    verb = xml_lexicon_fr.first('chanter', category=VERB)
+    paradigms = VerbParadigms(dict(paradigms.rows), paradigms.text, paradigms.offsets)
+    assert verb.id in paradigms
+    paradigms.discard(verb.id)
+    assert verb.id not in paradigms
+    assert paradigms.get(verb.id, INDICATIVE, PRESENT, THIRD, SINGULAR) is None
+
+
+def test_morph_verb(xml_lexicon_fr, paradigms, monkeypatch):
+    verb = xml_lexicon_fr.first('finir', category=VERB)
+    element = InflectedWordElement(
+        verb, features={TENSE: PAST, PERSON: THIRD, NUMBER: PLURAL, FORM: INDICATIVE})
+    monkeypatch.setattr(xml_lexicon_fr, 'verb_paradigms', paradigms)
+    monkeypatch.setattr(paradigms, 'text', paradigms.text.replace(
+        'finissaient', 'FINISSAIENT'))
+    rules = FrenchMorphologyRules()
+    assert rules.morph_verb(element, verb).realisation == 'FINISSAIENT'
+
+
+@pytest.mark.parametrize('features, expected', [
+    ({}, 'chantent'),
+    ({PRESENT3P: 'CHANTX'}, 'CHANTX'),
+])
+@pytest.mark.parametrize('with_paradigms', [True, False])
+def test_morph_verb_overrides(
+        xml_lexicon_fr, paradigms, monkeypatch, features, expected, with_paradigms):
+    verb = xml_lexicon_fr.first('chanter', category=VERB)
+    features = dict(features, **{
+        TENSE: PRESENT, PERSON: THIRD, NUMBER: PLURAL, FORM: INDICATIVE})
+    element = InflectedWordElement(verb, features=features)
+    if with_paradigms:
+        monkeypatch.setattr(xml_lexicon_fr, 'verb_paradigms', paradigms)
+    rules = FrenchMorphologyRules()
+    assert rules.morph_verb(element, verb).realisation == expected
+
+
+def test_build_unhandled_language(lexicon_en):
+    with pytest.raises(UnhandledLanguage):
+        VerbParadigms.build(lexicon_en)
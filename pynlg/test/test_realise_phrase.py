@@ -62,3 +62,27 @@ def test_realise_noun_phrase_features_on_parent(lexicon_fr):
     assert phrase.components[1].realisation == u'belles'
     assert phrase.components[2].realisation == u'maisons'
     assert phrase.components[3].realisation == u'perdues'
+
+
+def test_realise_noun_phrase_inflected_forms(lexicon_fr):
+    # words looked up by one of their inflected forms keep it
+    le = lexicon_fr.first(u'le', category=DETERMINER)
+    chevaux = lexicon_fr.first(u'chevaux', category=NOUN)
+    belles = lexicon_fr.first(u'belles', category=ADJECTIVE)
+    assert chevaux.base_form == u'cheval'
+    assert belles.base_form == u'beau'
+    phrase = make_noun_phrase(
+        lexicon=lexicon_fr, specifier=le, noun=chevaux, modifiers=[belles])
+    phrase = phrase.realise()
+    phrase = phrase.realise_morphology()
+    assert phrase.components[1].realisation == u'belles'
+    assert phrase.components[2].realisation == u'chevaux'
+    # the lemmas are still realised with their base form
+    phrase = make_noun_phrase(
+        lexicon=lexicon_fr, specifier=le,
+        noun=lexicon_fr.first(u'cheval', category=NOUN),
+        modifiers=[lexicon_fr.first(u'beau', category=ADJECTIVE)])
+    phrase = phrase.realise()
+    phrase = phrase.realise_morphology()
+    assert phrase.components[1].realisation == u'beau'
+    assert phrase.components[2].realisation == u'cheval'
@@ -4,7 +4,7 @@
 
 import pytest
 
-from ..spec.base import NLGElement
+from ..spec.base import NLGElement, FeatureDescriptor
 
 
 @pytest.fixture(scope='module')
@@ -33,14 +33,34 @@ def test_contains(nlg_elt):
         NLGElement(features={'k': 'v'}, category='h'),
         NLGElement(features={'k': 'v'}, category='h')
     ),
-    pytest.mark.xfail((
+    pytest.param(
         NLGElement(features={'k1': 'v1'}, category='h'),
-        NLGElement(features={'k2': 'v2'}, category='h')
-    )),
-    pytest.mark.xfail((
+        NLGElement(features={'k2': 'v2'}, category='h'),
+        marks=pytest.mark.xfail),
+    pytest.param(
         NLGElement(features={'k': 'v'}, category='h1'),
-        NLGElement(features={'k': 'v'}, category='h2')
-    ))
+        NLGElement(features={'k': 'v'}, category='h2'),
+        marks=pytest.mark.xfail)
 ])
 def test_equality(elt, other_elt):
     assert elt == other_elt
+
+
+def test_feature_descriptors():
+    elt = NLGElement(features={'gender': 'feminine', 'infl': ['reg']})
+    assert isinstance(NLGElement.__dict__['gender'], FeatureDescriptor)
+    assert elt.gender == 'feminine'
+    # unset known feature
+    assert elt.plural is None
+    # INFLECTIONS = 'infl'
+    assert elt.inflections == ['reg']
+    # features named after a value, and not after a constant
+    assert elt.infl == ['reg']
+    with pytest.raises(AttributeError):
+        elt.plop
+    # instance attributes shadow the features
+    elt.gender = 'masculine'
+    assert elt.gender == 'masculine'
+    assert elt.features['gender'] == 'feminine'
+    del elt.gender
+    assert elt.gender == 'feminine'
@@ -9,6 +9,7 @@ import pytest
 from ..spec.phrase import AdjectivePhraseElement, NounPhraseElement
 from ..lexicon.feature.category import ADJECTIVE, NOUN, DETERMINER
 from ..lexicon.feature.discourse import SPECIFIER
+from ..helper.fr import FrenchPhraseHelper, FrenchNounPhraseHelper
 
 
 @pytest.fixture
@@ -81,3 +82,10 @@ def test_get_set_noun_phrase_pronoun(lexicon_fr, noun_phrase):
     noun_phrase.pronoun = pronoun
     assert noun_phrase.head == pronoun
     assert noun_phrase.pronoun == pronoun
+
+
+def test_shared_phrase_helpers(lexicon_fr, adj_phrase, noun_phrase):
+    assert type(adj_phrase.helper) is FrenchPhraseHelper
+    assert type(noun_phrase.helper) is FrenchNounPhraseHelper
+    assert AdjectivePhraseElement(lexicon_fr).helper is adj_phrase.helper
+    assert NounPhraseElement(lexicon_fr).helper is noun_phrase.helper
@@ -4,8 +4,10 @@
 
 import pytest
 
+from copy import copy
+
 from ..spec.word import WordElement, InflectedWordElement
-from ..lexicon.feature.category import NOUN, ADJECTIVE
+from ..lexicon.feature.category import NOUN, ADJECTIVE, DETERMINER
 from ..lexicon.feature.number import PLURAL
 from ..lexicon.feature import NUMBER
 
@@ -24,14 +26,14 @@ def word():
         WordElement('beau', ADJECTIVE, "E123", None),
         WordElement('beau', ADJECTIVE, "E123", None),
     ),
-    pytest.mark.xfail((
+    pytest.param(
         WordElement('joli', ADJECTIVE, "E1", None),
         WordElement('beau', ADJECTIVE, "E123", None),
-    )),
-    pytest.mark.xfail((
+        marks=pytest.mark.xfail),
+    pytest.param(
         WordElement('joli', ADJECTIVE, "E1", None),
         'something',
-    ))
+        marks=pytest.mark.xfail)
 ])
 def test_equality(word, other_word):
     assert word == other_word
@@ -65,3 +67,29 @@ def test_inflex(word):
     iw = word.inflex(number=PLURAL)
     assert isinstance(iw, InflectedWordElement)
     assert iw.features[NUMBER] == PLURAL
+
+
+def test_copy_slotted_word(lexicon_fr):
+    word = lexicon_fr.lookup('le', category=DETERMINER)[0]
+    le = copy(word)
+    assert (le.id, le.base_form, le.category) == (
+        word.id, word.base_form, word.category)
+    assert le.lexicon is lexicon_fr
+    # copying a word allocates no attribute dict
+    assert word._attributes is None and le._attributes is None
+    # the attributes shadowing the features are copied
+    le.gender = 'plop'
+    other = copy(le)
+    assert other.gender == 'plop'
+    assert other.features.get('gender') == word.features.get('gender')
+    other.gender = 'plip'
+    assert le.gender == 'plop'
+
+
+def test_arbitrary_attributes(word):
+    word.note = 'plop'
+    assert word.note == 'plop'
+    assert 'note' not in word.features
+    del word.note
+    with pytest.raises(AttributeError):
+        word.note
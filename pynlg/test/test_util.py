@@ -0,0 +1,98 @@
+# encoding: utf-8
+
+"""Test suite of the utility functions and classes"""
+
+import threading
+
+import pytest
+
+from ..exc import UnhandledLanguage
+from ..lexicon.lang import FRENCH
+from ..morphology.fr import FrenchMorphologyRules
+from ..util import (
+    LRUCache, InflectionCache, get_morphology_rules, get_shared_morphology_rules,
+    get_morphophonology_rules, clear_dispatch_table, _dispatch_table)
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1
+    cache['c'] = 3
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('b', 0) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 1)
+    assert cache.pop('c') == 3
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('cache_class', [LRUCache, InflectionCache])
+def test_lru_cache_disabled(cache_class):
+    cache = cache_class(maxsize=0)
+    cache[('a', 'plural')] = 1
+    assert len(cache) == 0
+    assert cache.get(('a', 'plural')) is None
+    assert cache.evictions == 0
+
+
+def test_inflection_cache():
+    cache = InflectionCache(maxsize=3)
+    cache[('beau_2', 'plural')] = 'beaux'
+    cache[('beau_2', 'feminine')] = 'belle'
+    cache[('maison_1', 'plural')] = 'maisons'
+    cache.invalidate('beau_2')
+    assert len(cache) == 1
+    assert cache.get(('maison_1', 'plural')) == 'maisons'
+    cache[('chat_1', 'plural')] = 'chats'
+    cache[('chien_1', 'plural')] = 'chiens'
+    cache[('cheval_1', 'plural')] = 'chevaux'
+    assert cache.evictions == 1
+    assert ('maison_1', 'plural') not in cache
+    cache.invalidate('maison_1')
+    assert len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('cache_class', [LRUCache, InflectionCache])
+def test_cache_lock(cache_class):
+    cache = cache_class(maxsize=2)
+    cache[('a', 'plural')] = 1
+
+    def update():
+        cache[('b', 'plural')] = 2
+        cache.get(('a', 'plural'))
+
+    with cache.lock:
+        thread = threading.Thread(target=update)
+        thread.start()
+        thread.join(0.05)
+        # the other thread waits for the lock
+        assert len(cache) == 1
+        assert cache.hits == 0
+    thread.join()
+    assert len(cache) == 2
+    assert cache.hits == 1
+
+
+def test_dispatch_table():
+    clear_dispatch_table()
+    assert get_morphology_rules(FRENCH) is FrenchMorphologyRules
+    assert ('.morphology', 'FrenchMorphologyRules', FRENCH) in _dispatch_table
+    assert get_morphophonology_rules(FRENCH) is get_morphophonology_rules(FRENCH)
+    rules = get_shared_morphology_rules(FRENCH)
+    assert isinstance(rules, FrenchMorphologyRules)
+    assert get_shared_morphology_rules(FRENCH) is rules
+    clear_dispatch_table()
+    assert not _dispatch_table
+    assert get_shared_morphology_rules(FRENCH) is not rules
+
+
+def test_dispatch_unhandled_language():
+    with pytest.raises(UnhandledLanguage):
+        get_morphophonology_rules('klingon')
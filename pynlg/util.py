@@ -2,7 +2,12 @@
 
 """Definition of utility functions and classes."""
 
+import gc
+import sys
 import importlib
+import threading
+
+from collections import OrderedDict, defaultdict
 
 from .lexicon.lang import FRENCH, ENGLISH
 from .lexicon.feature.category import NOUN_PHRASE, ADJECTIVE_PHRASE
@@ -38,14 +43,39 @@ phrase_helper_router = {
 }
 
 
+#  Targets already resolved by _get_from_module, by (module name, target,
+#  language), so that routing a language is a dict probe after the first
+#  call instead of an importlib lookup.
+_dispatch_table = {}
+
+#  Shared instances of the stateless morphology rules and phrase helpers,
+#  by (kind, language[, phrase type]).
+_shared_instances = {}
+
+
 def _get_from_module(module_name, target, language):
+    key = (module_name, target, language)
+    try:
+        return _dispatch_table[key]
+    except KeyError:
+        pass
     try:
         mod_name = mod_router[language]
     except KeyError:
         raise UnhandledLanguage('No module for %s was found in %s' %
                                 (language, module_name))
     mod = importlib.import_module(module_name + '.' + mod_name, package=__package__)
-    return getattr(mod, target)
+    _dispatch_table[key] = resolved = getattr(mod, target)
+    return resolved
+
+
+def clear_dispatch_table():
+    """Forget all the resolved targets and shared instances, so that they
+    are resolved again on their next access.
+
+    """
+    _dispatch_table.clear()
+    _shared_instances.clear()
 
 
 def get_morphology_rules(language):
@@ -54,6 +84,22 @@ def get_morphology_rules(language):
         '.morphology', language=language, target=morphology_rules[language])
 
 
+def get_shared_morphology_rules(language):
+    """Return an instance of the appropriate morphology rules given a
+    language, shared by all callers.
+
+    The morphology rules hold no per-word state, so a single instance
+    can realise all the words of a language.
+
+    """
+    key = ('morphology', language)
+    try:
+        return _shared_instances[key]
+    except KeyError:
+        rules = _shared_instances[key] = get_morphology_rules(language)()
+        return rules
+
+
 def get_morphophonology_rules(language):
     """Return the appropriate morphophonology rules given a language."""
     return _get_from_module('.morphophonology', language=language, target='apply_rules')
@@ -70,3 +116,195 @@ def get_phrase_helper(language, phrase_type):
         '.helper',
         language=language,
         target=phrase_helper_router[language][phrase_type])
+
+
+def get_shared_phrase_helper(language, phrase_type):
+    """Return an instance of the appropriate phrase helper given a
+    language and a phrase type, shared by all the phrases.
+
+    The phrase helpers hold no per-phrase state: the phrase is passed
+    to each one of their methods.
+
+    """
+    key = ('helper', language, phrase_type)
+    try:
+        return _shared_instances[key]
+    except KeyError:
+        helper = _shared_instances[key] = get_phrase_helper(language, phrase_type)()
+        return helper
+
+
+def deep_sizeof(obj, seen=None):
+    """Return the approximate size in bytes of the argument object, and
+    of all the objects it references: container items, instance
+    attributes, etc.
+
+    Objects whose id is in the argument seen set are not accounted for,
+    and the ids of the accounted objects are added to the set. This
+    allows to account for objects shared between several structures
+    only once, or to exclude some objects from the accounting.
+
+    Classes, modules and functions are never accounted for.
+
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _UNSIZED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        # container items, instance __dict__ and slot values
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+_UNSIZED_TYPES = (type, type(sys), type(deep_sizeof), type(len))
+
+
+class LRUCache(object):
+
+    """Mapping holding at most ``maxsize`` items, evicting the least
+    recently used item when full.
+
+    The number of cache hits and misses of the ``get`` method, and the
+    number of evicted items are recorded in the ``hits``, ``misses`` and
+    ``evictions`` attributes.
+
+    A cache which maxsize is 0 holds no item.
+
+    As a lookup reorders the items, the cache is guarded by a lock, so
+    that it can be shared by several threads.
+
+    Example:
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3  # evicts 'b', the least recently used item
+    >>> 'b' in cache
+    False
+
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __setitem__(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            items = self._items
+            if key in items:
+                del items[key]
+            elif len(items) >= self.maxsize:
+                self.evict(items.popitem(last=False)[0])
+            items[key] = value
+
+    def evict(self, key):
+        """Called with the key of each item evicted to make room for a new
+        one.
+
+        """
+        self.evictions += 1
+
+    def get(self, key, default=None):
+        """Return the value associated with the argument key, and mark it
+        as the most recently used, or return the default value if the key
+        is not cached.
+
+        """
+        with self.lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items[key] = value
+            self.hits += 1
+            return value
+
+    def pop(self, key, default=None):
+        with self.lock:
+            return self._items.pop(key, default)
+
+    def clear(self):
+        """Remove all the cached items (the hit, miss and eviction counts
+        are kept).
+
+        """
+        with self.lock:
+            self._items.clear()
+
+
+class InflectionCache(LRUCache):
+
+    """LRU cache of the realised inflected forms of the lexicon words.
+
+    The keys are tuples starting with the id of the lexicon entry the
+    form is inflected from (see FrenchMorphologyRules.inflection_key),
+    so that the forms of an entry can be invalidated when it changes.
+
+    Example:
+    >>> cache = InflectionCache(maxsize=2)
+    >>> cache[('beau_2', 'ADJECTIVE', True, True)] = 'belles'
+    >>> cache.invalidate('beau_2')
+    >>> len(cache)
+    0
+
+    """
+
+    def __init__(self, maxsize=4096):
+        super(InflectionCache, self).__init__(maxsize=maxsize)
+        self._entry_keys = defaultdict(set)
+
+    def __setitem__(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            super(InflectionCache, self).__setitem__(key, value)
+            self._entry_keys[key[0]].add(key)
+
+    def evict(self, key):
+        super(InflectionCache, self).evict(key)
+        self._discard_key(key)
+
+    def _discard_key(self, key):
+        keys = self._entry_keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._entry_keys[key[0]]
+
+    def pop(self, key, default=None):
+        with self.lock:
+            self._discard_key(key)
+            return super(InflectionCache, self).pop(key, default)
+
+    def invalidate(self, entry_id):
+        """Remove the cached forms inflected from the lexicon entry having
+        the argument id.
+
+        """
+        with self.lock:
+            for key in self._entry_keys.pop(entry_id, ()):
+                self._items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            super(InflectionCache, self).clear()
+            self._entry_keys.clear()